@@ -12,9 +12,9 @@ from world.tiles import make_box
 class Log:
     """Log: stretched box, moves along X; player on top is carried."""
 
+    __slots__ = ("node", "lane_z", "world_x", "length_tiles", "half_length", "direction", "speed")
+
     def __init__(self, base: ShowBase, parent: NodePath, lane_z: float, start_x: float, length_tiles: int, direction: int, speed: float):
-        self.base = base
-        self.parent = parent
         self.node = parent.attachNewNode("log")
         ts = settings.TILE_SIZE
         # Raft / wooden plank (Bikini Bottom style)
@@ -29,18 +29,23 @@ class Log:
         self.speed = speed
         self.node.setPos(self.world_x, 0, lane_z)
 
-    def update(self, dt: float):
+    def update(self, dt: float) -> bool:
+        """Move along the lane; returns True if the log wrapped to the other edge this tick."""
         self.world_x += self.direction * self.speed * dt
         # Wrap so logs cycle in the lane – there's always a log the player can use
         ts = settings.TILE_SIZE
         lane_width = settings.LANE_WIDTH * ts
+        wrapped = False
         if self.direction > 0:
             if self.world_x > lane_width + self.half_length:
                 self.world_x = -self.half_length
+                wrapped = True
         else:
             if self.world_x < -self.half_length:
                 self.world_x = lane_width + self.half_length
+                wrapped = True
         self.node.setX(self.world_x)
+        return wrapped
 
     def get_bounds(self):
         """(min_x, max_x, min_z, max_z) world."""
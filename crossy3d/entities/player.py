@@ -7,27 +7,32 @@ from panda3d.core import Vec3, NodePath, Vec4
 
 import settings
 from utils.math3d import grid_to_world
-from utils.easing import ease_in_out_quad, hop_height, squash_stretch
+from utils.animation import Animator, CURVE_IN_OUT_QUAD, CURVE_ARC, CURVE_BUMP
 from game.input import DIRECTIONS
 
 
 class Player:
     """One tile per hop; smooth hop animation; no diagonals."""
 
-    def __init__(self, base: ShowBase, parent: NodePath):
-        self.base = base
-        self.parent = parent
+    __slots__ = (
+        "node", "grid_x", "grid_z", "world_x", "world_z", "animator", "_ch_x", "_ch_z", "_ch_y", "_ch_scale",
+        "_in_hop", "_hop_duration", "_hop_height", "_squash", "riding_log", "alive",
+    )
+
+    def __init__(self, base: ShowBase, parent: NodePath, animator: Animator = None):
         self.node = parent.attachNewNode("player")
         self._build_visual(base.loader)
         self.grid_x = 0
         self.grid_z = 0
         self.world_x = 0.0
         self.world_z = 0.0
-        self._hop_start_x = 0.0
-        self._hop_start_z = 0.0
-        self._hop_end_x = 0.0
-        self._hop_end_z = 0.0
-        self._hop_t = 1.0  # 1 = not hopping
+        # Hop channels, advanced with every other animation by the game's Animator
+        self.animator = animator if animator is not None else Animator(4)
+        self._ch_x = self.animator.channel()
+        self._ch_z = self.animator.channel()
+        self._ch_y = self.animator.channel()
+        self._ch_scale = self.animator.channel(1.0)
+        self._in_hop = False
         self._hop_duration = settings.PLAYER_HOP_DURATION
         self._hop_height = settings.PLAYER_HOP_HEIGHT
         self._squash = settings.PLAYER_SQUASH_SCALE
@@ -71,7 +76,7 @@ class Player:
         return (self.grid_x, self.grid_z)
 
     def is_hopping(self) -> bool:
-        return self._hop_t < 1.0
+        return self.animator.playing(self._ch_x)
 
     def can_accept_input(self) -> bool:
         """Accept new move (either idle or buffer during hop)."""
@@ -92,28 +97,28 @@ class Player:
         return True
 
     def _start_hop(self, end_x: int, end_z: int):
-        self._hop_start_x = self.world_x
-        self._hop_start_z = self.world_z
-        self._hop_end_x, self._hop_end_z = grid_to_world(end_x, end_z, settings.TILE_SIZE)
-        self._hop_t = 0.0
+        anim = self.animator
+        d = self._hop_duration
+        wx, wz = grid_to_world(end_x, end_z, settings.TILE_SIZE)
+        anim.tween(self._ch_x, self.world_x, wx, d, CURVE_IN_OUT_QUAD)
+        anim.tween(self._ch_z, self.world_z, wz, d, CURVE_IN_OUT_QUAD)
+        anim.tween(self._ch_y, 0.0, self._hop_height, d, CURVE_ARC)
+        # Stretch during the hop, back to 1 on landing
+        anim.tween(self._ch_scale, 1.0, 1.0 + (1.0 - self._squash) * 0.2, d, CURVE_BUMP)
+        self._in_hop = True
         self.grid_x = end_x
         self.grid_z = end_z
 
     def update(self, dt: float):
-        """Advance hop animation; apply ride-on-log offset."""
-        if self._hop_t < 1.0:
-            self._hop_t = min(1.0, self._hop_t + dt / self._hop_duration)
-            t = ease_in_out_quad(self._hop_t)
-            self.world_x = self._hop_start_x + (self._hop_end_x - self._hop_start_x) * t
-            self.world_z = self._hop_start_z + (self._hop_end_z - self._hop_start_z) * t
-            h = hop_height(self._hop_t, self._hop_height)
-            squash = squash_stretch(self._hop_t, self._squash)
-            self.node.setPos(self.world_x, h, self.world_z)  # Y-up: hop arc
-            self.node.setScale(squash)
-            if self._hop_t >= 1.0:
-                self.node.setScale(1.0)
-                self.world_x = self._hop_end_x
-                self.world_z = self._hop_end_z
+        """Apply the hop channels (advanced by the Animator this frame) to the node."""
+        if self._in_hop:
+            # On the landing frame the channels have settled exactly on the tile, height 0, scale 1
+            values = self.animator.values
+            self.world_x = float(values[self._ch_x])
+            self.world_z = float(values[self._ch_z])
+            self.node.setPos(self.world_x, float(values[self._ch_y]), self.world_z)  # Y-up: hop arc
+            self.node.setScale(float(values[self._ch_scale]))
+            self._in_hop = self.is_hopping()
         else:
             self.node.setPos(self.world_x, 0, self.world_z)
         if self.riding_log:
@@ -137,7 +142,10 @@ class Player:
         self.grid_x = grid_x
         self.grid_z = grid_z
         self.world_x, self.world_z = grid_to_world(grid_x, grid_z, settings.TILE_SIZE)
-        self._hop_t = 1.0
+        for ch in (self._ch_x, self._ch_z, self._ch_y):
+            self.animator.set(ch, 0.0)
+        self.animator.set(self._ch_scale, 1.0)
+        self._in_hop = False
         self.riding_log = None
         self.alive = True
         self.node.setPos(self.world_x, 0, self.world_z)
@@ -0,0 +1,59 @@
+"""
+Road traffic: a lane's vehicles as a fixed-size ring that recycles boats from one edge to the other.
+"""
+
+import random
+
+import settings
+
+
+class TrafficRing:
+    """Vehicles of one road lane, ordered head (furthest along travel) to tail.
+
+    All vehicles share the lane's speed, so order never changes: only the head can leave the
+    lane, and it re-enters behind the tail with seeded spacing. No allocation per recycle.
+    """
+
+    __slots__ = ("direction", "vehicles", "rng", "_head", "_lane_min", "_lane_max")
+
+    def __init__(self, vehicles: list, direction: int, seed: int = 0):
+        self.direction = direction
+        self.vehicles = sorted(vehicles, key=lambda v: v.world_x * direction, reverse=True)
+        self.rng = random.Random(seed)
+        self._head = 0
+        ts = settings.TILE_SIZE
+        self._lane_min = -0.5 * ts
+        self._lane_max = (settings.LANE_WIDTH - 0.5) * ts
+
+    def update(self, dt: float):
+        for v in self.vehicles:
+            v.update(dt)
+        n = len(self.vehicles)
+        if n == 0:
+            return
+        # A long frame can push more than one vehicle out
+        for _ in range(n):
+            head = self.vehicles[self._head]
+            if not self._has_left(head):
+                break
+            self._recycle(head, self.vehicles[self._head - 1])
+            self._head = (self._head + 1) % n
+
+    def _has_left(self, v) -> bool:
+        if self.direction > 0:
+            return v.world_x - v.half_width > self._lane_max
+        return v.world_x + v.half_width < self._lane_min
+
+    def _recycle(self, v, tail):
+        """Re-enter v behind tail, at least off-screen, ROAD_VEHICLE_GAP_MIN..MAX tiles apart."""
+        ts = settings.TILE_SIZE
+        gap = self.rng.randint(settings.ROAD_VEHICLE_GAP_MIN, settings.ROAD_VEHICLE_GAP_MAX)
+        spacing = (gap + 1) * ts
+        if tail is v:
+            behind = v.world_x - self.direction * spacing
+        else:
+            behind = tail.world_x - self.direction * spacing
+        if self.direction > 0:
+            v.recycle(min(behind, self._lane_min - v.half_width))
+        else:
+            v.recycle(max(behind, self._lane_max + v.half_width))
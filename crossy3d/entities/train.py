@@ -1,7 +1,9 @@
 """
-Train: fast, long; warning then kill on contact.
+Train: fast, long; warning then kill on contact. Recurs: sleep -> warning -> pass -> sleep.
 """
 
+import random
+
 from direct.showbase.ShowBase import ShowBase
 from panda3d.core import NodePath, Vec4
 
@@ -10,11 +12,14 @@ from world.tiles import make_box
 
 
 class Train:
-    """Train: long row of boxes; moves at high speed after warning."""
+    """Train: long row of boxes; moves at high speed after warning, then sleeps off-screen."""
+
+    __slots__ = (
+        "node", "lane_z", "length", "half_length", "half_depth", "direction", "speed",
+        "start_x", "world_x", "prev_x", "rng", "active", "warning", "timer",
+    )
 
-    def __init__(self, base: ShowBase, parent: NodePath, lane_z: float, direction: int):
-        self.base = base
-        self.parent = parent
+    def __init__(self, base: ShowBase, parent: NodePath, lane_z: float, direction: int, seed: int = 0):
         self.node = parent.attachNewNode("train")
         ts = settings.TILE_SIZE
         length = settings.TRAIN_LENGTH
@@ -33,23 +38,55 @@ class Train:
         self.half_length = (length * ts) / 2
         self.direction = direction
         self.speed = settings.TRAIN_SPEED
-        self.world_x = -self.half_length - 5 if direction > 0 else self.half_length + 5
+        self.start_x = -self.half_length - 5 if direction > 0 else self.half_length + 5
+        self.world_x = self.start_x
+        self.prev_x = self.world_x  # position at the start of the current tick (swept collision)
+        self.half_depth = ts * 0.4
+        self.rng = random.Random(seed)  # pass timing; same seed -> same schedule
         self.active = False  # starts moving after warning
-        self.warning_timer = settings.TRAIN_WARNING_TIME
+        self.warning = False
+        self.timer = None  # next scheduled transition (TimerHandle), owned by the game
         self.node.setPos(self.world_x, 0, lane_z)
+        self.node.stash()
+
+    def next_sleep_time(self) -> float:
+        """Seconds to stay parked before the next warning."""
+        return self.rng.uniform(settings.TRAIN_SLEEP_MIN, settings.TRAIN_SLEEP_MAX)
+
+    def start_warning(self):
+        self.warning = True
+        self.node.unstash()
+
+    def activate(self):
+        """Warning over: start driving. Called from the game's timer wheel."""
+        self.warning = False
+        self.active = True
+        self.timer = None
 
     def update(self, dt: float):
-        if self.warning_timer > 0:
-            self.warning_timer -= dt
-            if self.warning_timer <= 0:
-                self.active = True
-            return
         if self.active:
+            self.prev_x = self.world_x
             self.world_x += self.direction * self.speed * dt
             self.node.setX(self.world_x)
 
+    def has_left_lane(self) -> bool:
+        """True once the whole train is past the far edge of the lane."""
+        lane_width = settings.LANE_WIDTH * settings.TILE_SIZE
+        if self.direction > 0:
+            return self.world_x - self.half_length > lane_width + settings.TILE_SIZE
+        return self.world_x + self.half_length < -settings.TILE_SIZE
+
+    def sleep(self):
+        """Park off-screen at the entry side until the next pass."""
+        self.active = False
+        self.warning = False
+        self.world_x = self.start_x
+        self.prev_x = self.world_x
+        self.node.setX(self.world_x)
+        self.node.stash()
+
     def get_bounds(self):
-        hd = settings.TILE_SIZE * 0.4
+        hd = self.half_depth
         return (
             self.world_x - self.half_length,
             self.world_x + self.half_length,
@@ -61,7 +98,7 @@ class Train:
         return self.active
 
     def is_warning(self) -> bool:
-        return self.warning_timer > 0
+        return self.warning
 
     def remove(self):
         self.node.removeNode()
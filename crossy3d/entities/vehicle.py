@@ -12,9 +12,9 @@ from world.tiles import make_box
 class Vehicle:
     """Car/truck: stretched box, moves along X at given speed."""
 
+    __slots__ = ("node", "lane_z", "world_x", "prev_x", "direction", "speed", "half_width", "half_depth")
+
     def __init__(self, base: ShowBase, parent: NodePath, lane_z: float, grid_x: int, direction: int, speed: float):
-        self.base = base
-        self.parent = parent
         self.node = parent.attachNewNode("vehicle")
         ts = settings.TILE_SIZE
         # Boat-style (Bikini Bottom): white hull, blue cabin
@@ -27,15 +27,23 @@ class Vehicle:
         self.node.setPos(grid_x * ts, 0, lane_z)
         self.lane_z = lane_z
         self.world_x = grid_x * ts
+        self.prev_x = self.world_x  # position at the start of the current tick (swept collision)
         self.direction = direction  # -1 or 1
         self.speed = speed
         self.half_width = ts * 0.6  # collision half-extent X
         self.half_depth = ts * 0.4  # Z
 
     def update(self, dt: float):
+        self.prev_x = self.world_x
         self.world_x += self.direction * self.speed * dt
         self.node.setX(self.world_x)
 
+    def recycle(self, world_x: float):
+        """Re-enter the lane at world_x (used by TrafficRing)."""
+        self.world_x = world_x
+        self.prev_x = world_x
+        self.node.setX(world_x)
+
     def get_bounds(self):
         """(min_x, max_x, min_z, max_z) in world."""
         hw = self.half_width
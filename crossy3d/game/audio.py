@@ -4,6 +4,7 @@ Uses Panda3D AudioSound; gracefully no-op if files missing.
 """
 
 import os
+import time
 from pathlib import Path
 
 import settings
@@ -16,6 +17,7 @@ class AudioManager:
         self.base = base
         self.enabled = settings.AUDIO_ENABLED
         self._sounds = {}
+        self.listener = None  # listener(event, key, ms) after each load / play, e.g. the hitch detector
         self._base_path = Path(__file__).resolve().parent.parent
 
     def _path(self, rel: str) -> Path:
@@ -28,12 +30,15 @@ class AudioManager:
         full = self._path(path)
         if not full.exists():
             return
+        t0 = time.perf_counter()
         try:
             sound = self.base.loader.loadSfx(str(full))
             if sound:
                 self._sounds[key] = sound
         except Exception:
             pass
+        if self.listener is not None:
+            self.listener("load", key, (time.perf_counter() - t0) * 1000.0)
 
     def load_all(self):
         """Load all configured sounds."""
@@ -50,10 +55,13 @@ class AudioManager:
             return
         s = self._sounds.get(key)
         if s:
+            t0 = time.perf_counter()
             try:
                 s.play()
             except Exception:
                 pass
+            if self.listener is not None:
+                self.listener("play", key, (time.perf_counter() - t0) * 1000.0)
 
     def play_hop(self):
         self.play("hop")
@@ -1,62 +1,109 @@
 """
-Isometric / trailing camera with smooth follow.
+Isometric / trailing camera: critically damped spring follow, landing look-ahead, seeded shake.
 """
 
+import math
+import random
+
 from direct.showbase.ShowBase import ShowBase
-from panda3d.core import Vec3, Quat
 
 import settings
-from utils.math3d import grid_to_world
 
 
 class CameraController:
-    """Smooth follow camera: above and behind player, looking forward."""
+    """Spring follow camera: above and behind the point the player is landing on, looking forward.
+
+    update() allocates nothing: state is plain floats, updated in place, and the behind-and-above
+    offset is recomputed only when distance / height / angle change (set_params).
+    """
 
     def __init__(self, base: ShowBase):
         self.base = base
         self.camera = base.camera
-        self.target_pos = Vec3(0, 0, 0)
-        self.current_pos = Vec3(0, 0, 0)
-        self.smoothing = settings.CAMERA_SMOOTHING
+        self.smoothing = settings.CAMERA_SMOOTHING  # spring angular frequency (1/s)
+        self.look_ahead = settings.CAMERA_LOOK_AHEAD
+        self.hop_lead = settings.CAMERA_HOP_LEAD
         self.distance = settings.CAMERA_DISTANCE
         self.height = settings.CAMERA_HEIGHT
         self.angle_deg = settings.CAMERA_ANGLE
-        self.look_ahead = settings.CAMERA_LOOK_AHEAD
-        self._shake_timer = 0.0
+        self._offset_y = 0.0
+        self._offset_z = 0.0
+        self.set_params()
+        # Followed point (x, z on the ground) and its velocity; target it springs towards
+        self._x = 0.0
+        self._z = 0.0
+        self._vx = 0.0
+        self._vz = 0.0
+        self._target_x = 0.0
+        self._target_z = 0.0
+        # Shake: decaying sines with phases drawn from a seeded generator, same every session
+        self._shake_rng = random.Random(settings.CAMERA_SHAKE_SEED)
+        self._shake_time = 0.0
+        self._shake_duration = 0.0
         self._shake_magnitude = 0.0
+        self._shake_phase_x = 0.0
+        self._shake_phase_z = 0.0
 
-    def set_target_from_player(self, grid_x: int, grid_z: int):
-        """Set target to follow player at (grid_x, grid_z)."""
-        wx, wz = grid_to_world(grid_x, grid_z, settings.TILE_SIZE)
-        # Look slightly ahead (forward = +Z)
-        self.target_pos = Vec3(wx, 0, wz + self.look_ahead)
+    def set_params(self, distance: float = None, height: float = None, angle_deg: float = None):
+        """Change the framing; the offset is recomputed here and nowhere else."""
+        if distance is not None:
+            self.distance = distance
+        if height is not None:
+            self.height = height
+        if angle_deg is not None:
+            self.angle_deg = angle_deg
+        rad = math.radians(self.angle_deg)
+        self._offset_y = self.height + self.distance * math.sin(rad)
+        self._offset_z = -self.distance * math.cos(rad)
+
+    def set_target_from_player(self, player):
+        """Aim at the tile the player lands on (its grid position is the landing tile as soon as
+        a hop starts), a little further along the hop while it is in the air."""
+        ts = settings.TILE_SIZE
+        land_x = player.grid_x * ts
+        land_z = player.grid_z * ts
+        self._target_x = land_x
+        self._target_z = land_z + self.look_ahead
+        if player.is_hopping():
+            wx, wz = player.get_world_pos()
+            dx = land_x - wx
+            dz = land_z - wz
+            dist = math.hypot(dx, dz)
+            if dist > 1e-6:
+                self._target_x += dx / dist * self.hop_lead
+                self._target_z += dz / dist * self.hop_lead
 
     def update(self, dt: float):
-        """Smooth camera follow and optional shake."""
-        # Smooth position
-        self.current_pos = self.current_pos + (
-            self.target_pos - self.current_pos
-        ) * min(1.0, self.smoothing * dt)
-
-        # Offset: behind and above (in camera space: -Z back, +Y up)
-        import math
-        rad = math.radians(self.angle_deg)
-        offset_z = -self.distance * math.cos(rad)
-        offset_y = self.height + self.distance * math.sin(rad)
-        cam_pos = self.current_pos + Vec3(0, offset_y, offset_z)
+        """Advance the spring and shake, then place the camera."""
+        # Critically damped spring, exact for any dt (no overshoot, no instability on long frames)
+        omega = self.smoothing
+        decay = math.exp(-omega * dt)
+        cx = self._x - self._target_x
+        tx = (self._vx + omega * cx) * dt
+        self._vx = (self._vx - omega * tx) * decay
+        self._x = self._target_x + (cx + tx) * decay
+        cz = self._z - self._target_z
+        tz = (self._vz + omega * cz) * dt
+        self._vz = (self._vz - omega * tz) * decay
+        self._z = self._target_z + (cz + tz) * decay
 
-        # Shake
-        if self._shake_timer > 0:
-            import random
-            self._shake_timer -= dt
-            s = self._shake_magnitude * (self._shake_timer / 0.3)
-            cam_pos.x += (random.random() - 0.5) * 2 * s
-            cam_pos.z += (random.random() - 0.5) * 2 * s
+        x = self._x
+        z = self._z
+        if self._shake_time > 0.0:
+            self._shake_time = max(0.0, self._shake_time - dt)
+            s = self._shake_magnitude * (self._shake_time / self._shake_duration)
+            elapsed = self._shake_duration - self._shake_time
+            freq = settings.CAMERA_SHAKE_FREQUENCY * 2.0 * math.pi
+            x += s * math.sin(freq * elapsed + self._shake_phase_x)
+            z += s * math.sin(freq * elapsed + self._shake_phase_z)
 
-        self.camera.setPos(cam_pos)
-        self.camera.lookAt(self.current_pos)
+        self.camera.setPos(x, self._offset_y, z + self._offset_z)
+        self.camera.lookAt(self._x, 0.0, self._z)
 
     def trigger_death_shake(self, magnitude: float = 0.4, duration: float = 0.3):
-        """Brief camera jolt on death."""
-        self._shake_timer = duration
+        """Brief camera jolt on death; the sequence of shakes is the same every session."""
+        self._shake_time = duration
+        self._shake_duration = duration
         self._shake_magnitude = magnitude
+        self._shake_phase_x = self._shake_rng.uniform(0.0, 2.0 * math.pi)
+        self._shake_phase_z = self._shake_rng.uniform(0.0, 2.0 * math.pi)
@@ -0,0 +1,296 @@
+"""
+Collision backends: hazard hits, log riding and log coverage behind one interface.
+
+PythonCollision runs the hand-written swept AABB tests. PandaCollision attaches CollisionBox
+solids to the entity nodes (into masks per hazard kind, a from box and a down ray on the player)
+and runs one CollisionTraverser pass per frame into a queue handler.
+Pick one with settings.COLLISION_BACKEND ("python" or "panda").
+"""
+
+from abc import ABC, abstractmethod
+
+from panda3d.core import (
+    BitMask32, CollisionBox, CollisionHandlerQueue, CollisionNode, CollisionRay, CollisionTraverser,
+    LineSegs, Point3, Vec3,
+)
+
+import settings
+from entities.vehicle import Vehicle
+from entities.log import Log
+from entities.train import Train
+from utils.math3d import swept_aabb_overlap
+from world.lane import RiverLane
+
+MASK_VEHICLE = BitMask32.bit(1)
+MASK_TRAIN = BitMask32.bit(2)
+MASK_LOG = BitMask32.bit(3)
+
+PLAYER_HALF = 0.35  # player collision half extent on X and Z, in tiles
+HAZARD_HALF_DEPTH = 0.4  # vehicles, logs and trains, in tiles
+_BOX_HEIGHT = 0.6
+
+
+def _half_extents(entity) -> tuple:
+    """(half X, half Z) of an entity's collision box."""
+    ts = settings.TILE_SIZE
+    if isinstance(entity, Vehicle):
+        return entity.half_width, entity.half_depth
+    if isinstance(entity, (Log, Train)):
+        return entity.half_length, ts * HAZARD_HALF_DEPTH
+    return ts * PLAYER_HALF, ts * PLAYER_HALF
+
+
+class CollisionBackend(ABC):
+    """Per frame, after hazards moved: update(), then read `hit` and `log_under_player`."""
+
+    name = ""
+
+    def __init__(self, world_root):
+        self.world_root = world_root
+        self.debug = False
+        self.hit = None  # "vehicle" / "train" if the player touched one this frame
+        self.log_under_player = None
+        self._debug_nodes = {}  # entity -> debug NodePath
+
+    def attach(self, entity):
+        """Track an entity (a hazard once its lane is built, or the player)."""
+        if self.debug:
+            self._show_debug(entity)
+
+    def detach(self, entity):
+        self._debug_nodes.pop(entity, None)
+
+    def clear(self):
+        """Forget every hazard (world reset); the player stays attached."""
+
+    @abstractmethod
+    def update(self, player, prev_pos: tuple, vehicles: list, active_trains: list, lane):
+        """Collide the player's motion this frame (prev_pos -> now) with the hazards; `lane` is
+        the lane at the player's row (log ride)."""
+        pass
+
+    @abstractmethod
+    def is_covered(self, lane, lane_node, grid_x: int) -> bool:
+        """Is the center of tile grid_x of a river lane on a log right now?"""
+        pass
+
+    def set_debug(self, visible: bool):
+        """Show or hide the collision shapes (F1)."""
+        self.debug = visible
+        for node in self._debug_nodes.values():
+            if visible:
+                node.show()
+            else:
+                node.hide()
+
+    def _show_debug(self, entity):
+        node = self._debug_nodes.get(entity)
+        if node is None:
+            node = self._debug_nodes[entity] = self._make_debug_node(entity)
+        node.show()
+
+    @abstractmethod
+    def _make_debug_node(self, entity):
+        """Debug NodePath showing the entity's collision shape."""
+        pass
+
+
+class PythonCollision(CollisionBackend):
+    """Swept AABB tests in Python (exact for fast hazards and long frames)."""
+
+    name = "python"
+
+    def __init__(self, world_root):
+        super().__init__(world_root)
+        self._entities = set()
+
+    def attach(self, entity):
+        self._entities.add(entity)
+        super().attach(entity)
+
+    def detach(self, entity):
+        self._entities.discard(entity)
+        super().detach(entity)
+
+    def clear(self):
+        self._entities = {e for e in self._entities if not isinstance(e, (Vehicle, Log, Train))}
+        self._debug_nodes = {e: n for e, n in self._debug_nodes.items() if e in self._entities}
+
+    def update(self, player, prev_pos: tuple, vehicles: list, active_trains: list, lane):
+        ts = settings.TILE_SIZE
+        px1, pz1 = player.get_world_pos()
+        # Only ride once the hop has brought the player within a log's depth of the lane
+        self.log_under_player = None
+        if isinstance(lane, RiverLane) and abs(pz1 - lane.z_index * ts) <= ts * HAZARD_HALF_DEPTH:
+            self.log_under_player = lane.log_at(px1)
+        self.hit = None
+        if not player.alive:
+            return
+        px0, pz0 = prev_pos
+        half = ts * PLAYER_HALF
+        z_lo = min(pz0, pz1) - half
+        z_hi = max(pz0, pz1) + half
+        for v in vehicles:
+            if v.lane_z + v.half_depth < z_lo or v.lane_z - v.half_depth > z_hi:
+                continue
+            if swept_aabb_overlap(
+                px0, pz0, px1, pz1, half, half,
+                v.prev_x, v.lane_z, v.world_x, v.lane_z, v.half_width, v.half_depth,
+            ):
+                self.hit = "vehicle"
+                return
+        for t in active_trains:
+            if t.lane_z + t.half_depth < z_lo or t.lane_z - t.half_depth > z_hi:
+                continue
+            if swept_aabb_overlap(
+                px0, pz0, px1, pz1, half, half,
+                t.prev_x, t.lane_z, t.world_x, t.lane_z, t.half_length, t.half_depth,
+            ):
+                self.hit = "train"
+                return
+
+    def is_covered(self, lane, lane_node, grid_x: int) -> bool:
+        return lane.is_covered(grid_x)
+
+    def set_debug(self, visible: bool):
+        if visible:
+            for entity in self._entities:
+                self._show_debug(entity)
+        super().set_debug(visible)
+
+    def _make_debug_node(self, entity):
+        """Outline of the AABB the tests use, parented to the entity's node."""
+        hx, hz = _half_extents(entity)
+        lines = LineSegs("collision-debug")
+        lines.setColor(1, 0.2, 0.2, 1)
+        corners = [(-hx, -hz), (hx, -hz), (hx, hz), (-hx, hz), (-hx, -hz)]
+        for y in (0.0, _BOX_HEIGHT):
+            lines.moveTo(corners[0][0], y, corners[0][1])
+            for x, z in corners[1:]:
+                lines.drawTo(x, y, z)
+        for x, z in corners[:4]:
+            lines.moveTo(x, 0.0, z)
+            lines.drawTo(x, _BOX_HEIGHT, z)
+        node = entity.node.attachNewNode(lines.create())
+        node.setLightOff()
+        return node
+
+
+class PandaCollision(CollisionBackend):
+    """CollisionBox solids on every entity node, one CollisionTraverser pass per frame.
+
+    The player's from-box is stretched over its own motion this frame; hazards are tested where
+    they are at the end of the frame (no sweep on their side).
+    """
+
+    name = "panda"
+
+    def __init__(self, world_root):
+        super().__init__(world_root)
+        self._colliders = {}  # entity -> collision NodePath
+        self.traverser = CollisionTraverser("hazards")
+        self.queue = CollisionHandlerQueue()
+        self._probe_traverser = CollisionTraverser("log-probe")
+        self._probe_queue = CollisionHandlerQueue()
+        self._player_box = None
+        self._player_ray = None
+        # Down ray for tile-coverage queries, moved to the tile and traversed under one lane
+        probe = CollisionNode("log-probe")
+        probe.addSolid(CollisionRay(Point3(0, 2, 0), Vec3(0, -1, 0)))
+        probe.setFromCollideMask(MASK_LOG)
+        probe.setIntoCollideMask(BitMask32.allOff())
+        self._probe = world_root.attachNewNode(probe)
+        self._probe_traverser.addCollider(self._probe, self._probe_queue)
+
+    def attach(self, entity):
+        if isinstance(entity, (Vehicle, Log, Train)):
+            hx, hz = _half_extents(entity)
+            cnode = CollisionNode(type(entity).__name__.lower())
+            cnode.addSolid(CollisionBox(Point3(0, _BOX_HEIGHT / 2, 0), hx, _BOX_HEIGHT / 2, hz))
+            if isinstance(entity, Vehicle):
+                cnode.setIntoCollideMask(MASK_VEHICLE)
+            elif isinstance(entity, Train):
+                cnode.setIntoCollideMask(MASK_TRAIN)
+            else:
+                cnode.setIntoCollideMask(MASK_LOG)
+            cnode.setFromCollideMask(BitMask32.allOff())
+            collider = entity.node.attachNewNode(cnode)
+            collider.setPythonTag("entity", entity)
+            self._colliders[entity] = collider
+        else:
+            self._attach_player(entity)
+        super().attach(entity)
+
+    def _attach_player(self, player):
+        half = settings.TILE_SIZE * PLAYER_HALF
+        box = CollisionNode("player")
+        box.addSolid(CollisionBox(Point3(0, _BOX_HEIGHT / 2, 0), half, _BOX_HEIGHT / 2, half))
+        box.setFromCollideMask(MASK_VEHICLE | MASK_TRAIN)
+        box.setIntoCollideMask(BitMask32.allOff())
+        # Not under the player node: it is stretched over the frame's motion in world space
+        self._player_box = self.world_root.attachNewNode(box)
+        ray = CollisionNode("player-ray")
+        ray.addSolid(CollisionRay(Point3(0, 2, 0), Vec3(0, -1, 0)))
+        ray.setFromCollideMask(MASK_LOG)
+        ray.setIntoCollideMask(BitMask32.allOff())
+        self._player_ray = self.world_root.attachNewNode(ray)
+        self.traverser.addCollider(self._player_box, self.queue)
+        self.traverser.addCollider(self._player_ray, self.queue)
+        self._colliders[player] = self._player_box
+
+    def detach(self, entity):
+        collider = self._colliders.pop(entity, None)
+        if collider is not None and not collider.isEmpty():
+            collider.removeNode()
+        super().detach(entity)
+
+    def clear(self):
+        for entity in [e for e in self._colliders if isinstance(e, (Vehicle, Log, Train))]:
+            self.detach(entity)
+
+    def update(self, player, prev_pos: tuple, vehicles: list, active_trains: list, lane):
+        ts = settings.TILE_SIZE
+        px0, pz0 = prev_pos
+        px1, pz1 = player.get_world_pos()
+        half = ts * PLAYER_HALF
+        self._player_box.setPos((px0 + px1) / 2, 0, (pz0 + pz1) / 2)
+        self._player_box.setScale((abs(px1 - px0) + 2 * half) / (2 * half), 1, (abs(pz1 - pz0) + 2 * half) / (2 * half))
+        self._player_ray.setPos(px1, 0, pz1)
+        self.queue.clearEntries()
+        self.traverser.traverse(self.world_root)
+        self.hit = None
+        self.log_under_player = None
+        for i in range(self.queue.getNumEntries()):
+            entry = self.queue.getEntry(i)
+            entity = entry.getIntoNodePath().getPythonTag("entity")
+            if isinstance(entity, Log):
+                if entry.getFromNodePath() == self._player_ray and lane is not None and entity.lane_z == lane.z_index * ts:
+                    self.log_under_player = entity
+            elif not player.alive or entry.getFromNodePath() != self._player_box:
+                continue
+            elif isinstance(entity, Vehicle):
+                self.hit = "vehicle"  # vehicles win ties, as in PythonCollision
+            elif isinstance(entity, Train) and entity.active and self.hit is None:
+                self.hit = "train"
+
+    def is_covered(self, lane, lane_node, grid_x: int) -> bool:
+        if not 0 <= grid_x < settings.LANE_WIDTH:
+            return False
+        ts = settings.TILE_SIZE
+        self._probe.setPos(grid_x * ts, 0, lane.z_index * ts)
+        self._probe_queue.clearEntries()
+        self._probe_traverser.traverse(lane_node)
+        return self._probe_queue.getNumEntries() > 0
+
+    def _make_debug_node(self, entity):
+        return self._colliders[entity]
+
+
+BACKENDS = {PythonCollision.name: PythonCollision, PandaCollision.name: PandaCollision}
+
+
+def make_backend(name: str, world_root) -> CollisionBackend:
+    try:
+        return BACKENDS[name](world_root)
+    except KeyError:
+        raise ValueError(f"unknown collision backend {name!r} (choose from {', '.join(BACKENDS)})") from None
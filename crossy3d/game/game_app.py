@@ -2,8 +2,10 @@
 Main game: init Panda3D, world, player, camera, UI, state machine, collision, scoring.
 """
 
-import random
 import math
+import sys
+import time
+from collections import deque
 from direct.showbase.ShowBase import ShowBase
 from direct.showbase.ShowBaseGlobal import globalClock
 from direct.task import Task
@@ -16,6 +18,14 @@ from .camera import CameraController
 from .audio import AudioManager
 from .ui import UIManager
 from .save import load_best_score, save_best_score
+from .timers import TimerWheel
+from .collision import make_backend
+from .hazard_motion import HazardIntervals
+from .profiler import FrameProfiler, blocks_since
+from .leak_monitor import LeakMonitor
+from .hitch_detector import HitchDetector
+from .profile_capture import ProfileCapture
+from .gc_manager import GcManager
 from world.lane import LaneType, GrassLane, RoadLane, RiverLane, TrainLane
 from world.world_gen import WorldGenerator
 from world import tiles as world_tiles
@@ -24,6 +34,8 @@ from entities.player import Player
 from entities.vehicle import Vehicle
 from entities.log import Log
 from entities.train import Train
+from entities.traffic import TrafficRing
+from utils.animation import Animator
 from utils.math3d import grid_to_world
 
 
@@ -48,32 +60,69 @@ class GameApp(ShowBase):
         self.score = 0
         self.best_score = load_best_score()
         self.max_reached_z = -1
-        self.last_forward_time = 0.0
-        self.drown_timer = 0.0
         self.in_water = False
+        self._player_prev_pos = (0.0, 0.0)  # player world (x, z) at the start of the tick
+        # Gameplay deadlines run on a timer wheel advanced by the update task
+        self.timers = TimerWheel()
+        self._drown_timer = None
+        self._doom_timer = None
+        # Wall-clock cost (ms) of the latest death -> game over and restart -> playable transitions
+        self.transition_times = {}
+        self.profiler = FrameProfiler()
+        self.gc_mgr = GcManager(self.profiler, managed=settings.GC_MODE == "managed")
+        self.hitch = HitchDetector(settings.HITCH_FACTOR * settings.HITCH_TARGET_MS)
+        self.hitch.enabled = settings.HITCH_DETECTOR
+        self.finalExitCallbacks.append(self.hitch.dump)
+        self.capture = ProfileCapture(GameApp._update_task.__code__, settings.PROFILE_CAPTURE_MODE)
+        self.finalExitCallbacks.append(self.capture.finish)
 
         self.world_root = self.render.attachNewNode("world")
         self._setup_lighting()
 
         self.input_mgr = InputManager(settings.INPUT_BUFFER_MAX)
+        # Tweens (the player hop) advance in one Animator update per frame; the camera follows on
+        # its own spring (game/camera.py)
+        self.animator = Animator()
         self.camera_ctrl = CameraController(self)
         self.audio = AudioManager(self)
+        self.audio.listener = self.hitch.sound
         self.audio.load_all()
         self.ui = UIManager(self)
 
-        self.player = Player(self, self.world_root)
-        self.world_gen = WorldGenerator()
-        self.lanes = []  # list of (z_index, Lane, node_for_tiles, entities_list)
-        self.vehicles = []
-        self.logs = []
-        self.trains = []
-        self._lane_nodes = []
-        self._lane_entities = []
+        self.player = Player(self, self.world_root, self.animator)
+        self.collision = make_backend(settings.COLLISION_BACKEND, self.world_root)
+        self.collision.attach(self.player)
+        # "intervals": the engine moves hazards; None: the update task moves them every frame
+        self.hazard_intervals = HazardIntervals() if settings.HAZARD_MOTION == "intervals" else None
+        self._lane_stream = None
+        self._course = None
+        self.world_gen = self._new_world_gen()
+        # Lanes are built at the front and culled at the back in z order, so each of these holds its
+        # items oldest lane first and culling pops from the left
+        self.lanes = deque()  # (z_index, Lane, node_for_tiles, entities_list)
+        self.vehicles = deque()
+        self.road_lanes = deque()  # RoadLanes; each owns its vehicles as a TrafficRing
+        self.river_lanes = deque()  # RiverLanes; each owns its logs as a sorted interval index
+        self.trains = deque()
+        self.active_trains = []  # trains on a pass; sleeping / warning trains are never updated or collided
+        self._lane_nodes = deque()
+        self._lane_entities = deque()
+        self.leak_monitor = None
+        if settings.LEAK_DIAGNOSTICS:
+            self.leak_monitor = LeakMonitor()
+            self.finalExitCallbacks.append(self.leak_monitor.close)
 
         self._key_bindings()
         self.ui.show_start_screen()
         self.taskMgr.add(self._update_task, "update")
-        self._frame_times = []
+        # Key-to-hop latency: keys are stamped with the end of the last rendered frame (they arrived
+        # after it) and a hop's sample closes once a frame showing it displaced has been rendered
+        self._frame_boundary = time.perf_counter()
+        self._updates = 0
+        self._hop_pressed = None  # (arrival stamp, update count when the hop started)
+        self.taskMgr.add(self._frame_end_task, "frame-end", sort=51)  # right after igLoop (50)
+        self._frame_times = deque(maxlen=60)
+        self.gc_mgr.startup()
 
     def _setup_lighting(self):
         from panda3d.core import DirectionalLight, AmbientLight
@@ -95,6 +144,8 @@ class GameApp(ShowBase):
         self.accept("return", self._on_enter)
         self.accept("r", self._on_restart)
         self.accept("f1", self._toggle_debug)
+        self.accept(settings.PROFILER_KEY, self._toggle_profiler)
+        self.accept(settings.PROFILE_CAPTURE_KEY, self.capture.toggle, [self])
 
     def _on_key(self, key):
         if self.state == GameState.START:
@@ -102,33 +153,49 @@ class GameApp(ShowBase):
         if self.state == GameState.GAME_OVER:
             return
         direction = KEY_TO_DIR.get(key)
-        if direction:
-            self.input_mgr.push_direction(direction)
+        if not direction:
+            return
+        pressed = self._frame_boundary
+        # Apply at once when nothing is queued ahead of it: the hop starts in this frame's update
+        if not self.input_mgr and self.player.alive and not self.player.is_hopping():
+            self._try_player_move(direction, pressed)
+        else:
+            self.input_mgr.push(direction, pressed)
 
     def _on_enter(self):
         if self.state == GameState.START:
             self.state = GameState.PLAYING
+            self.player.reset(settings.LANE_WIDTH // 2, 0)
+            self._player_prev_pos = self.player.get_world_pos()
             self.ui.hide_all()
             self.ui.show_hud(self.score, self.best_score)
-            self._ensure_lanes()
-            self.last_forward_time = self.taskMgr.globalClock.getFrameTime()
+            self._ensure_lanes(ahead=settings.LANES_READY_ON_RESTART)
+            self._arm_doom()
+            self.gc_mgr.enter_play()
+            if settings.PROFILE_CAPTURE_ON_PLAY:
+                self.capture.start(self, settings.PROFILE_CAPTURE_ON_PLAY)
         elif self.state == GameState.GAME_OVER:
             self._on_restart()
 
     def _on_restart(self):
         if self.state != GameState.GAME_OVER:
             return
+        t0 = time.perf_counter()
         self._reset_world()
+        self.gc_mgr.restart()
         self.state = GameState.PLAYING
         self.score = 0
         self.max_reached_z = -1
-        self.last_forward_time = self.taskMgr.globalClock.getFrameTime()
+        self._arm_doom()
         self.ui.hide_all()
         self.ui.show_hud(self.score, self.best_score)
-        self._ensure_lanes()
+        # Only the lanes around the player are built now; the rest stream in over the next frames
+        self._ensure_lanes(ahead=settings.LANES_READY_ON_RESTART)
+        self.transition_times["restart_to_playable"] = (time.perf_counter() - t0) * 1000.0
 
     def _toggle_debug(self):
         settings.DEBUG_COLLISION_BOXES = not getattr(settings, "DEBUG_COLLISION_BOXES", False)
+        self.collision.set_debug(settings.DEBUG_COLLISION_BOXES)
 
     def _update_lens_aspect(self):
         """Set camera lens aspect ratio to window size so the view fills the window."""
@@ -144,227 +211,354 @@ class GameApp(ShowBase):
     def _reset_world(self):
         for node in self._lane_nodes:
             node.removeNode()
-        self._lane_nodes = []
+        self._lane_nodes.clear()
         for ent_list in self._lane_entities:
             for e in ent_list:
                 if hasattr(e, "remove"):
                     e.remove()
-        self._lane_entities = []
-        self.lanes = []
-        self.vehicles = []
-        self.logs = []
-        self.trains = []
-        self.world_gen = WorldGenerator()
+        self._lane_entities.clear()
+        self.lanes.clear()
+        self.vehicles.clear()
+        self.road_lanes.clear()
+        self.river_lanes.clear()
+        self.trains.clear()
+        self.active_trains = []
+        self.collision.clear()
+        if self.hazard_intervals is not None:
+            self.hazard_intervals.clear()
+        self.timers.clear()
+        self._drown_timer = None
+        self._doom_timer = None
+        self.world_gen = self._new_world_gen()
         self.player.reset(settings.LANE_WIDTH // 2, 0)
-        self.drown_timer = 0.0
+        self._player_prev_pos = self.player.get_world_pos()
         self.in_water = False
 
-    def _ensure_lanes(self):
-        """Generate lanes so we have LANES_AHEAD ahead of player."""
+    def _new_world_gen(self):
+        """Lane source for a new world: a course file, the worker stream if enabled and available, else a generator."""
+        if settings.COURSE_FILE:
+            if self._course is None:
+                from world.course import Course
+                self._course = Course(settings.COURSE_FILE)
+                self.finalExitCallbacks.append(self._course.close)
+            return self._course
+        if settings.LANE_WORKER:
+            if self._lane_stream is None:
+                try:
+                    from world.lane_stream import LaneStream
+                except ImportError as e:
+                    print(f"Lane worker disabled ({e})")
+                    settings.LANE_WORKER = False
+                    return WorldGenerator(settings.WORLD_SEED)
+                self._lane_stream = LaneStream()
+                self.finalExitCallbacks.append(self._lane_stream.close)
+            self._lane_stream.reset(settings.WORLD_SEED)
+            return self._lane_stream
+        return WorldGenerator(settings.WORLD_SEED)
+
+    def _ensure_lanes(self, max_new: int = None, ahead: int = settings.LANES_AHEAD):
+        """Generate lanes so we have `ahead` lanes ahead of player (at most max_new this call)."""
         player_z = self.player.grid_z
-        need_up_to = player_z + settings.LANES_AHEAD
+        need_up_to = player_z + ahead
+        built = 0
         while len(self.lanes) == 0 or self.lanes[-1][0] < need_up_to:
+            if max_new is not None and built >= max_new:
+                break
+            built += 1
             z_idx = (self.lanes[-1][0] + 1) if self.lanes else 0
             lane = self.world_gen.next_lane(z_idx)
             node, entities = self._build_lane_visual(lane)
             self.lanes.append((z_idx, lane, node, entities))
             self._lane_nodes.append(node)
             self._lane_entities.append(entities)
+            self.hitch.lane_built(z_idx)
+            if isinstance(lane, RoadLane):
+                self.road_lanes.append(lane)
+            elif isinstance(lane, RiverLane):
+                self.river_lanes.append(lane)
+            if self.hazard_intervals is not None:
+                self.hazard_intervals.start_lane(lane, entities)
             for e in entities:
+                self.collision.attach(e)
                 if isinstance(e, Vehicle):
                     self.vehicles.append(e)
-                elif isinstance(e, Log):
-                    self.logs.append(e)
                 elif isinstance(e, Train):
                     self.trains.append(e)
-                    self.audio.play_train_horn()
+                    e.timer = self.timers.schedule(lane.first_delay, self._start_train_warning, e)
+            if self.leak_monitor is not None:
+                self.leak_monitor.lane_built(self)
+
+    def _start_train_warning(self, train):
+        """Horn once, then activate the train when the warning runs out."""
+        train.start_warning()
+        self.audio.play_train_horn()
+        train.timer = self.timers.schedule(settings.TRAIN_WARNING_TIME, self._activate_train, train)
+
+    def _activate_train(self, train):
+        train.activate()
+        self.active_trains.append(train)
+        if self.hazard_intervals is not None:
+            self.hazard_intervals.start_pass(train)
+
+    def _sleep_train(self, train):
+        """Pass finished: park the train and schedule its next warning."""
+        if self.hazard_intervals is not None:
+            self.hazard_intervals.end_pass(train)
+        train.sleep()
+        train.timer = self.timers.schedule(train.next_sleep_time(), self._start_train_warning, train)
 
     def _build_lane_visual(self, lane):
         """Create tile + obstacle/entity visuals for a lane. Returns (root_node, entities_list)."""
         root = self.world_root.attachNewNode(f"lane_{lane.z_index}")
+        # Static geometry is flattened on its own: entity nodes move and must keep their transforms
+        tiles = root.attachNewNode("tiles")
         ts = settings.TILE_SIZE
         lane_z = lane.z_index * ts
         entities = []
         if isinstance(lane, GrassLane):
             for x in range(settings.LANE_WIDTH):
-                world_tiles.create_grass_tile(self.loader, root, x * ts, lane_z)
-            for (gx, gz) in lane.blocked_tiles:
-                world_obstacles.create_bikini_bottom_prop(self.loader, root, gx * ts, lane_z)
+                world_tiles.create_grass_tile(self.loader, tiles, x * ts, lane_z)
+            for gx in lane.blocked_columns():
+                world_obstacles.create_bikini_bottom_prop(self.loader, tiles, gx * ts, lane_z)
         elif isinstance(lane, RoadLane):
             for x in range(settings.LANE_WIDTH):
-                world_tiles.create_road_tile(self.loader, root, x * ts, lane_z)
-            gap_min = settings.ROAD_VEHICLE_GAP_MIN
-            gap_max = settings.ROAD_VEHICLE_GAP_MAX
-            n_vehicles = random.randint(
-                settings.ROAD_VEHICLES_PER_LANE_MIN,
-                settings.ROAD_VEHICLES_PER_LANE_MAX,
-            )
-            used = set()
-            for _ in range(n_vehicles):
-                gx = random.randint(0, settings.LANE_WIDTH - 1)
-                if gx in used:
-                    continue
-                gap = random.randint(gap_min, gap_max)
-                for dx in range(-gap, gap + 1):
-                    used.add(gx + dx)
-                v = Vehicle(self, root, lane_z, gx, lane.direction, lane.speed)
-                entities.append(v)
+                world_tiles.create_road_tile(self.loader, tiles, x * ts, lane_z)
+            for gx in lane.vehicle_xs:
+                entities.append(Vehicle(self, root, lane_z, gx, lane.direction, lane.speed))
+            lane.traffic = TrafficRing(entities, lane.direction, lane.seed)
         elif isinstance(lane, RiverLane):
-            world_tiles.create_water_lane_surface(self.loader, root, lane_z)
-            log_len_min = settings.RIVER_LOG_LENGTH_MIN
-            log_len_max = settings.RIVER_LOG_LENGTH_MAX
-            x = 0
-            while x < settings.LANE_WIDTH:
-                length = random.randint(log_len_min, log_len_max)
-                length = min(length, settings.LANE_WIDTH - x)
-                if length <= 0:
-                    break
-                start_x = (x + length / 2) * ts
-                log = Log(self, root, lane_z, start_x, length, lane.direction, lane.speed)
-                entities.append(log)
-                gap = random.randint(settings.RIVER_LOG_GAP_MIN, settings.RIVER_LOG_GAP_MAX)
-                x += length + gap
-            # Guarantee at least 2 logs so river is always crossable (logs also wrap)
-            if len(entities) == 0:
-                length = min(log_len_max, settings.LANE_WIDTH)
-                start_x = (settings.LANE_WIDTH / 2) * ts
-                log = Log(self, root, lane_z, start_x, length, lane.direction, lane.speed)
-                entities.append(log)
-            if len(entities) == 1:
-                # Add a second log offset so there's always coverage as they move
-                length = random.randint(log_len_min, log_len_max)
-                length = min(length, settings.LANE_WIDTH)
-                start_x = (settings.LANE_WIDTH * 0.25) * ts if lane.direction > 0 else (settings.LANE_WIDTH * 0.75) * ts
-                log2 = Log(self, root, lane_z, start_x, length, lane.direction, lane.speed)
-                entities.append(log2)
+            world_tiles.create_water_lane_surface(self.loader, tiles, lane_z)
+            for center_x, length in lane.log_layout:
+                entities.append(Log(self, root, lane_z, center_x * ts, length, lane.direction, lane.speed))
+            lane.set_logs(entities)
         elif isinstance(lane, TrainLane):
             for x in range(settings.LANE_WIDTH):
-                world_tiles.create_rail_tile(self.loader, root, x * ts, lane_z)
-            train = Train(self, root, lane_z, random.choice([-1, 1]))
+                world_tiles.create_rail_tile(self.loader, tiles, x * ts, lane_z)
+            train = Train(self, root, lane_z, lane.direction, lane.seed)
             entities.append(train)
-        root.flattenStrong()
+        tiles.flattenStrong()
         return root, entities
 
+    def _toggle_profiler(self):
+        self.profiler.enabled = not self.profiler.enabled
+        self.ui.show_profiler(self.profiler.enabled)
+
     def _update_task(self, task):
-        dt = globalClock.getDt()
-        if dt > 0.1:
-            dt = 0.016
+        profiler = self.profiler
+        start = time.perf_counter()
+        self.hitch.frame_start(self)
+        if profiler.enabled:
+            profiler.begin_frame()
+        capture = self.capture
+        if capture.active:
+            capture.begin_frame()
+        self._update_frame()
+        if capture.active:
+            capture.end_frame()
+        if profiler.enabled:
+            profiler.end_frame()
+            if self.ui.profiler_due():  # the overlay's percentiles sort whole windows
+                self.ui.update_profiler(profiler.overlay_lines())
+        self.gc_mgr.frame_end((time.perf_counter() - start) * 1000.0)
+        self._updates += 1
+        return Task.cont
+
+    def _frame_end_task(self, task):
+        """After rendering: close the latency of a hop this frame showed first, and move the
+        boundary keys are stamped with."""
+        now = time.perf_counter()
+        if self._hop_pressed is not None and self._hop_pressed[1] < self._updates:
+            self.profiler.record("input_latency_ms", (now - self._hop_pressed[0]) * 1000.0)
+            self._hop_pressed = None
+        self._frame_boundary = now
+        return Task.cont
+
+    def _update_frame(self):
+        # A long frame is clamped for motion only; deadlines (timer wheel) follow the real clock
+        frame_dt = globalClock.getDt()
+        dt = frame_dt if frame_dt <= 0.1 else 0.016
         self._frame_times.append(dt)
-        if len(self._frame_times) > 60:
-            self._frame_times.pop(0)
-        fps = 1.0 / (sum(self._frame_times) / len(self._frame_times)) if self._frame_times else 0
+        total = sum(self._frame_times)
+        fps = len(self._frame_times) / total if total > 0 else 0
 
         if self.state == GameState.START:
             self.ui.update_hud(0, self.best_score, fps)
-            return Task.cont
+            return
         if self.state == GameState.GAME_OVER:
-            return Task.cont
+            self._update_camera(dt)  # let the death shake play out
+            return
 
-        # PLAYING
-        self._ensure_lanes()
+        # PLAYING (hitch.phase marks the end of each phase for the hitch detector)
+        hitch = self.hitch
+        self._ensure_lanes(max_new=settings.LANES_BUILT_PER_FRAME)
         self._cull_lanes()
+        hitch.phase("lanes")
+        self._player_prev_pos = self.player.get_world_pos()
+        if self.hazard_intervals is not None:
+            self.hazard_intervals.tick(globalClock.getFrameTime())
         self._process_input()
+        hitch.phase("input")
+        self.camera_ctrl.set_target_from_player(self.player)
+        self.animator.update(dt)
         self.player.update(dt)
+        hitch.phase("animation")
         self._update_entities(dt)
+        hitch.phase("hazards")
         self._check_river_and_logs()
         self._check_collisions()
-        self._check_doom(dt)
+        self.timers.advance(frame_dt)
         self._update_score()
-        self.camera_ctrl.set_target_from_player(self.player.grid_x, self.player.grid_z)
-        self.camera_ctrl.update(dt)
+        hitch.phase("rules")
+        self._update_camera(dt)
+        hitch.phase("camera")
         self.ui.update_hud(self.score, self.best_score, fps)
-        return Task.cont
+        hitch.phase("hud")
+
+    def _update_camera(self, dt):
+        if not self.profiler.enabled:
+            self.camera_ctrl.update(dt)
+            return
+        blocks = sys.getallocatedblocks()
+        self.camera_ctrl.update(dt)
+        self.profiler.record("camera_alloc", blocks_since(blocks))
 
     def _cull_lanes(self):
         player_z = self.player.grid_z
         cull_before = player_z - settings.LANES_BEHIND_CULL
         while self.lanes and self.lanes[0][0] < cull_before:
-            z_idx, lane, node, entities = self.lanes.pop(0)
+            # The oldest lane: its road / river lane, vehicles and train are the oldest entries too
+            z_idx, lane, node, entities = self.lanes.popleft()
             node.removeNode()
-            self._lane_nodes.pop(0)
+            self.hitch.lane_culled(z_idx)
+            if isinstance(lane, RoadLane):
+                self.road_lanes.popleft()
+            elif isinstance(lane, RiverLane):
+                self.river_lanes.popleft()
+            self._lane_nodes.popleft()
+            if self.hazard_intervals is not None:
+                self.hazard_intervals.stop_lane(lane, entities)
             for e in entities:
-                if isinstance(e, Vehicle) and e in self.vehicles:
-                    self.vehicles.remove(e)
-                elif isinstance(e, Log) and e in self.logs:
-                    self.logs.remove(e)
-                elif isinstance(e, Train) and e in self.trains:
-                    self.trains.remove(e)
+                self.collision.detach(e)
+                if isinstance(e, Vehicle):
+                    self.vehicles.popleft()
+                elif isinstance(e, Train):
+                    self.trains.popleft()
+                    self.timers.cancel(e.timer)
+                    if e in self.active_trains:  # at most a few buses are on a pass
+                        self.active_trains.remove(e)
                 if hasattr(e, "remove"):
                     e.remove()
-            self._lane_entities.pop(0)
+            self._lane_entities.popleft()
 
     def _process_input(self):
-        if not self.player.alive:
+        """Queued moves wait for the hop in progress to land; then one move per frame."""
+        if not self.player.alive or self.player.is_hopping():
             return
-        # Consume buffer or current key: one move per frame when not hopping
-        if not self.player.is_hopping():
-            direction = self.input_mgr.pop_direction()
-            if direction:
-                self._try_player_move(direction)
-        else:
-            # Buffer next move
-            direction = self.input_mgr.pop_direction()
-            if direction:
-                self.input_mgr.push_direction(direction)
+        entry = self.input_mgr.pop()
+        if entry is not None:
+            self._try_player_move(*entry)
+
+    def _lane_entry(self, grid_z: int):
+        """(z, lane, node, entities) at row grid_z, or None if not generated / already culled.
+        Lanes are contiguous in z."""
+        if not self.lanes:
+            return None
+        i = grid_z - self.lanes[0][0]
+        if 0 <= i < len(self.lanes):
+            return self.lanes[i]
+        return None
+
+    def _lane_at(self, grid_z: int):
+        """Lane at row grid_z, or None if not generated / already culled."""
+        entry = self._lane_entry(grid_z)
+        return entry[1] if entry else None
 
     def _is_tile_on_log(self, grid_x: int, grid_z: int) -> bool:
         """True if (grid_x, grid_z) is currently covered by a log (required to stand on water)."""
-        ts = settings.TILE_SIZE
-        center_x = grid_x * ts
-        center_z = grid_z * ts
-        for log in self.logs:
-            if abs(log.lane_z - center_z) > ts * 0.5:
-                continue
-            if log.contains_point(center_x, center_z):
-                return True
-        return False
+        entry = self._lane_entry(grid_z)
+        if entry is None or not isinstance(entry[1], RiverLane):
+            return False
+        if self.hazard_intervals is not None:
+            self.hazard_intervals.sync_lane(entry[1], entry[3])
+        return self.collision.is_covered(entry[1], entry[2], grid_x)
 
-    def _try_player_move(self, direction: str):
+    def _try_player_move(self, direction: str, pressed: float):
+        """Start a hop if the target tile is open; `pressed` is the key's arrival stamp (latency metric)."""
         def is_blocked(nx, nz):
             if nx < 0 or nx >= settings.LANE_WIDTH:
                 return True
             if nz < 0:
                 return True
-            for (z_idx, lane, _n, _e) in self.lanes:
-                if z_idx != nz:
-                    continue
-                if isinstance(lane, RiverLane):
-                    # Crossy Road rule: can only step onto water if a log/block is under that tile
-                    if not self._is_tile_on_log(nx, nz):
-                        return True
-                    break
-                if lane.is_blocked(nx):
-                    return True
-            return False
+            lane = self._lane_at(nz)
+            if lane is None:
+                return False
+            if isinstance(lane, RiverLane):
+                # Crossy Road rule: can only step onto water if a log/block is under that tile
+                return not self._is_tile_on_log(nx, nz)
+            return lane.is_blocked(nx)
         if self.player.try_move(direction, is_blocked):
+            self._hop_pressed = (pressed, self._updates)
             self.audio.play_hop()
             if direction == "up":
-                self.last_forward_time = self.taskMgr.globalClock.getFrameTime()
+                self._arm_doom()
             self.player.riding_log = None
 
     def _update_entities(self, dt):
-        for v in self.vehicles:
-            v.update(dt)
-        for log in self.logs:
-            log.update(dt)
-        for t in self.trains:
-            t.update(dt)
-            if t.is_warning():
-                pass  # could flash warning light / play horn once
+        if self.hazard_intervals is not None:
+            vehicles = self._sync_hazards()
+        else:
+            self._move_hazards(dt)
+            vehicles = self.vehicles
+        # Hazards have moved: one collision pass for hits and the log under the player
+        self.collision.update(
+            self.player, self._player_prev_pos, vehicles, self.active_trains,
+            self._lane_at(self.player.grid_z),
+        )
         # Ride on log: if player is in river lane and on a log, carry
         self._update_log_ride()
 
+    def _move_hazards(self, dt):
+        """Per-frame motion of every hazard from Python (the default)."""
+        for lane in self.road_lanes:
+            lane.update_traffic(dt)
+        for lane in self.river_lanes:
+            lane.update_logs(dt)
+        finished = None
+        for t in self.active_trains:
+            t.update(dt)
+            if t.has_left_lane():
+                finished = finished or []
+                finished.append(t)
+        if finished:
+            for t in finished:
+                self.active_trains.remove(t)
+                self._sleep_train(t)
+
+    def _sync_hazards(self) -> list:
+        """Interval mode: the engine has moved the nodes; read gameplay positions off the same clock,
+        only for the rows the player spans this frame (plus one each side) and for buses on a pass.
+        Returns the vehicles to collide with."""
+        ts = settings.TILE_SIZE
+        z0 = int(round(self._player_prev_pos[1] / ts))
+        z1 = self.player.grid_z
+        vehicles = []
+        for z in range(min(z0, z1) - 1, max(z0, z1) + 2):
+            entry = self._lane_entry(z)
+            if entry is None:
+                continue
+            self.hazard_intervals.sync_lane(entry[1], entry[3])
+            if isinstance(entry[1], RoadLane):
+                vehicles.extend(entry[3])
+        finished = [t for t in self.active_trains if self.hazard_intervals.sync_train(t)]
+        for t in finished:
+            self.active_trains.remove(t)
+            self._sleep_train(t)
+        return vehicles
+
     def _update_log_ride(self):
         ts = settings.TILE_SIZE
         px, pz = self.player.get_world_pos()
-        player_lane_z = self.player.grid_z * ts
-        on_log = None
-        for log in self.logs:
-            if abs(log.lane_z - player_lane_z) > ts * 0.5:
-                continue
-            if log.contains_point(px, pz):
-                on_log = log
-                break
+        on_log = self.collision.log_under_player
         if on_log:
             self.player.riding_log = on_log
             offset_x = (px - on_log.world_x) / ts
@@ -374,51 +568,26 @@ class GameApp(ShowBase):
             self.player.riding_log = None
 
     def _check_river_and_logs(self):
-        ts = settings.TILE_SIZE
-        player_lane_z = self.player.grid_z * ts
-        in_river = False
-        for (z_idx, lane, _n, _e) in self.lanes:
-            if not isinstance(lane, RiverLane):
-                continue
-            lane_z = z_idx * ts
-            if abs(lane_z - player_lane_z) > ts * 0.3:
-                continue
-            in_river = True
-            break
-        if in_river and not self.player.riding_log:
-            self.in_water = True
-            self.drown_timer += globalClock.getDt()
-            if self.drown_timer >= settings.RIVER_DROWN_DELAY:
-                self._die("drown")
-        else:
-            self.in_water = False
-            self.drown_timer = 0.0
+        in_river = isinstance(self._lane_at(self.player.grid_z), RiverLane)
+        # Falling in arms the drown deadline; reaching a log or leaving the river cancels it
+        self.in_water = in_river and not self.player.riding_log
+        if self.in_water:
+            if self._drown_timer is None:
+                self._drown_timer = self.timers.schedule(settings.RIVER_DROWN_DELAY, self._die, "drown")
+        elif self._drown_timer is not None:
+            self.timers.cancel(self._drown_timer)
+            self._drown_timer = None
 
     def _check_collisions(self):
-        if not self.player.alive:
-            return
-        px, pz = self.player.get_world_pos()
-        ts = settings.TILE_SIZE
-        half = ts * 0.35
-        for v in self.vehicles:
-            min_x, max_x, min_z, max_z = v.get_bounds()
-            if px + half >= min_x and px - half <= max_x and pz + half >= min_z and pz - half <= max_z:
-                self._die("vehicle")
-                return
-        for t in self.trains:
-            if not t.is_active():
-                continue
-            min_x, max_x, min_z, max_z = t.get_bounds()
-            if px + half >= min_x and px - half <= max_x and pz + half >= min_z and pz - half <= max_z:
-                self._die("train")
-                return
+        """Hazard hits found by this frame's collision pass (swept in the Python backend, so fast
+        hazards and long frames cannot tunnel through the player)."""
+        if self.player.alive and self.collision.hit:
+            self._die(self.collision.hit)
 
-    def _check_doom(self, dt):
-        if not self.player.alive:
-            return
-        t = self.taskMgr.globalClock.getFrameTime()
-        if t - self.last_forward_time >= settings.DOOM_TIME:
-            self._die("doom")
+    def _arm_doom(self):
+        """(Re)start the doom deadline; called on start and on every forward hop."""
+        self.timers.cancel(self._doom_timer)
+        self._doom_timer = self.timers.schedule(settings.DOOM_TIME, self._die, "doom")
 
     def _update_score(self):
         if self.player.grid_z > self.max_reached_z:
@@ -427,14 +596,23 @@ class GameApp(ShowBase):
             self.audio.play_score()
             if self.score > self.best_score:
                 self.best_score = self.score
+                t0 = time.perf_counter()
                 save_best_score(self.best_score)
+                self.hitch.saved((time.perf_counter() - t0) * 1000.0)
         self.world_gen.set_score(self.score)
 
     def _die(self, reason: str):
         if not self.player.alive:
             return
+        t0 = time.perf_counter()
         self.player.kill()
+        self.timers.cancel(self._drown_timer)
+        self.timers.cancel(self._doom_timer)
+        self._drown_timer = None
+        self._doom_timer = None
         self.camera_ctrl.trigger_death_shake()
+        if self.hazard_intervals is not None:
+            self.hazard_intervals.pause()
         if reason == "drown":
             self.audio.play_splash()
         elif reason == "train":
@@ -445,6 +623,9 @@ class GameApp(ShowBase):
             self.audio.play_death()
         self.state = GameState.GAME_OVER
         self.ui.show_game_over(self.score, self.best_score, on_restart=self._on_restart)
+        self.transition_times["death_to_game_over"] = (time.perf_counter() - t0) * 1000.0
+        self.gc_mgr.leave_play()  # after the measured transition: the game over screen is up
+        self.hitch.dump()
 
     def quit_game(self):
         self.userExit()
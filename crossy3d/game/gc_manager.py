@@ -0,0 +1,107 @@
+"""
+Garbage collection scheduling: keep CPython's cyclic collector out of gameplay frames.
+
+With settings.GC_MODE = "managed" (--gc managed): everything alive after startup is moved to the
+permanent generation (gc.freeze), generation thresholds are raised while PLAYING so collections do
+not trigger on their own, and collections run deliberately instead: on death and restart within
+GC_EVENT_BUDGET_MS, and in frames whose update left slack under GC_FRAME_BUDGET_MS. A generation
+is only collected when its estimated pause (running average of measured ones) fits the budget.
+
+In either mode every collection's pause is recorded in the frame profiler: gc_pause_ms for all of
+them, gc_play_pause_ms for the ones CPython started on its own during play (zero when managed works).
+"""
+
+import gc
+import time
+
+import settings
+
+_EMA = 0.2  # weight of the newest pause in a generation's estimate
+
+
+class GcManager:
+    """Collector policy for the app's states; GameApp calls the hooks, gc.callbacks time the pauses."""
+
+    def __init__(self, profiler, managed: bool = False):
+        self.profiler = profiler
+        self.managed = managed
+        self.in_play = False
+        self.default_thresholds = gc.get_threshold()
+        self.estimate_ms = [0.0, 0.0, 0.0]  # expected pause per generation
+        self._deliberate = False
+        self._start = 0.0
+        gc.callbacks.append(self._on_gc)
+
+    def startup(self):
+        """After the app is built: drop startup garbage, freeze the survivors, then time one collection
+        per generation to seed the pause estimates."""
+        if not self.managed:
+            return
+        self.collect(2)
+        gc.freeze()
+        self.estimate_ms = [0.0, 0.0, 0.0]
+        for generation in range(3):
+            self.collect(generation)
+
+    def enter_play(self):
+        self.in_play = True
+        if self.managed:
+            gc.set_threshold(*settings.GC_PLAYING_THRESHOLDS)
+
+    def leave_play(self):
+        """Death: play has stopped, so this is a good moment for an older generation."""
+        self.in_play = False
+        if self.managed:
+            gc.set_threshold(*self.default_thresholds)
+            self.collect_within(settings.GC_EVENT_BUDGET_MS, oldest=2)
+
+    def restart(self):
+        """The old world was just torn down: collect it before play resumes."""
+        if self.managed:
+            self.collect_within(settings.GC_EVENT_BUDGET_MS, oldest=2)
+        self.enter_play()
+
+    def frame_end(self, spent_ms: float):
+        """End of the update task: use the frame's slack for the collection CPython would have run."""
+        if not self.managed:
+            return
+        young, middle, old = gc.get_count()
+        if young < settings.GC_IDLE_MIN_YOUNG:
+            return
+        # The generation CPython's default thresholds make due; the oldest one only outside play
+        t0, t1, t2 = self.default_thresholds
+        oldest = 0
+        if middle >= t1:
+            oldest = 1
+            if old >= t2 and not self.in_play:
+                oldest = 2
+        self.collect_within(settings.GC_FRAME_BUDGET_MS - spent_ms, oldest)
+
+    def collect_within(self, budget_ms: float, oldest: int = 2) -> bool:
+        """Collect the oldest generation up to `oldest` whose estimated pause fits budget_ms."""
+        for generation in range(oldest, -1, -1):
+            if self.estimate_ms[generation] <= budget_ms:
+                self.collect(generation)
+                return True
+        return False
+
+    def collect(self, generation: int):
+        self._deliberate = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._deliberate = False
+
+    def _on_gc(self, phase: str, info: dict):
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        ms = (time.perf_counter() - self._start) * 1000.0
+        generation = info["generation"]
+        if self.estimate_ms[generation]:
+            self.estimate_ms[generation] += _EMA * (ms - self.estimate_ms[generation])
+        else:
+            self.estimate_ms[generation] = ms
+        self.profiler.record("gc_pause_ms", ms)
+        if self.in_play and not self._deliberate:
+            self.profiler.record("gc_play_pause_ms", ms)
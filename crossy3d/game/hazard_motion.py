@@ -0,0 +1,169 @@
+"""
+Engine-driven hazard motion: Panda3D intervals move vehicles, logs and buses instead of setX calls
+from Python every frame.
+
+Every vehicle and log gets a looping LerpPosInterval over one lap that reproduces its wrap; a bus
+gets a one-shot interval when its warning runs out. The C++ interval manager moves the nodes.
+Gameplay positions come from the same closed-form functions of the frame clock the intervals run
+on, and are only computed for lanes the game asks about (the rows around the player), so a frame
+does no Python work per hazard. Enable with settings.HAZARD_MOTION = "intervals".
+"""
+
+import random
+
+from direct.interval.IntervalGlobal import LerpPosInterval
+from direct.showbase.ShowBaseGlobal import globalClock
+from panda3d.core import Point3
+
+import settings
+from entities.log import Log
+from entities.vehicle import Vehicle
+from world.lane import RiverLane
+
+
+class _Loop:
+    """x(t) = lo + (x0 - lo + velocity * (t - t0)) mod period: constant speed, wrapping at the lane ends."""
+
+    __slots__ = ("lo", "period", "x0", "t0", "velocity", "interval")
+
+    def __init__(self, lo: float, period: float, x0: float, t0: float, velocity: float):
+        self.lo = lo
+        self.period = period
+        self.x0 = lo + (x0 - lo) % period
+        self.t0 = t0
+        self.velocity = velocity
+        self.interval = None
+
+    def x_at(self, t: float) -> float:
+        return self.lo + (self.x0 - self.lo + self.velocity * (t - self.t0)) % self.period
+
+    def prev_x(self, x: float, dt: float) -> float:
+        """Position dt earlier, or x itself if the hazard wrapped in between (nothing to sweep)."""
+        prev = x - self.velocity * dt
+        return prev if self.lo <= prev < self.lo + self.period else x
+
+    def play(self, node, lane_z: float):
+        """Loop the node along x(t) from now: one lap end to end, entered at x0's phase."""
+        lo, hi = self.lo, self.lo + self.period
+        start, end = (lo, hi) if self.velocity > 0 else (hi, lo)
+        speed = abs(self.velocity)
+        self.interval = LerpPosInterval(
+            node, self.period / speed, Point3(end, 0, lane_z), startPos=Point3(start, 0, lane_z),
+        )
+        self.interval.loop()
+        self.interval.setT(abs(self.x0 - start) / speed)
+
+
+class HazardIntervals:
+    """Intervals for every built hazard, and their gameplay positions on demand.
+
+    tick(frame_time) once per frame before any query, on the clock the interval manager steps
+    with; sync_lane() before reading a lane's hazards; start_pass() / sync_train() / end_pass()
+    bracket a bus pass.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.dt = 0.0
+        self._loops = {}  # vehicle / log -> _Loop
+        self._passes = {}  # train -> (start time, duration, interval)
+        self._synced = {}  # lane z -> frame time of its last sync
+
+    def tick(self, frame_time: float):
+        self.dt = frame_time - self.now
+        self.now = frame_time
+
+    def start_lane(self, lane, entities: list):
+        """Start the loops of a freshly built lane's vehicles and logs."""
+        ts = settings.TILE_SIZE
+        width = settings.LANE_WIDTH * ts
+        vehicles = [e for e in entities if isinstance(e, Vehicle)]
+        if vehicles:
+            # A ring of vehicles keeps its layout: the lap is the lane plus one seeded gap behind the last car
+            hw = vehicles[0].half_width
+            xs = [v.world_x for v in vehicles]
+            gap = random.Random(lane.seed).randint(settings.ROAD_VEHICLE_GAP_MIN, settings.ROAD_VEHICLE_GAP_MAX)
+            period = max(width + 2 * hw, max(xs) - min(xs) + (gap + 1) * ts)
+            if lane.direction > 0:
+                lo = width - 0.5 * ts + hw - period
+            else:
+                lo = -0.5 * ts - hw
+            for v in vehicles:
+                self._start_loop(v, lo, period, v.direction * v.speed)
+        for log in entities:
+            if isinstance(log, Log):
+                # Same wrap as Log.update: out past one end by half a log, in at the other
+                hl = log.half_length
+                self._start_loop(log, -hl, width + 2 * hl, log.direction * log.speed)
+
+    def _start_loop(self, entity, lo: float, period: float, velocity: float):
+        # Intervals started now run on this frame's clock; t0 must be the same instant
+        loop = _Loop(lo, period, entity.world_x, globalClock.getFrameTime(), velocity)
+        entity.world_x = loop.x0
+        if velocity:
+            loop.play(entity.node, entity.lane_z)
+        self._loops[entity] = loop
+
+    def sync_lane(self, lane, entities: list):
+        """Bring a lane's hazards (world_x, prev_x, log index) up to the current frame time."""
+        if self._synced.get(lane.z_index) == self.now:
+            return
+        self._synced[lane.z_index] = self.now
+        for e in entities:
+            loop = self._loops.get(e)
+            if loop is not None:
+                e.world_x = loop.x_at(self.now)
+                if isinstance(e, Vehicle):
+                    e.prev_x = loop.prev_x(e.world_x, self.dt)
+        if isinstance(lane, RiverLane):
+            lane.set_logs(entities)
+
+    def start_pass(self, train):
+        """Warning over: drive the bus from its parking spot until it has left the lane."""
+        ts = settings.TILE_SIZE
+        if train.direction > 0:
+            end = settings.LANE_WIDTH * ts + ts + train.half_length
+        else:
+            end = -ts - train.half_length
+        duration = abs(end - train.start_x) / train.speed
+        interval = LerpPosInterval(
+            train.node, duration, Point3(end, 0, train.lane_z), startPos=Point3(train.start_x, 0, train.lane_z),
+        )
+        interval.start()
+        self._passes[train] = (globalClock.getFrameTime(), duration, interval)
+
+    def sync_train(self, train) -> bool:
+        """Update an active bus's position; True once its pass is over."""
+        t0, duration, _ = self._passes[train]
+        elapsed = min(self.now - t0, duration)
+        train.prev_x = train.world_x
+        train.world_x = train.start_x + train.direction * train.speed * elapsed
+        return self.now - t0 >= duration
+
+    def end_pass(self, train):
+        passed = self._passes.pop(train, None)
+        if passed is not None:
+            passed[2].pause()
+
+    def stop_lane(self, lane, entities: list):
+        """Culled lane: stop its intervals."""
+        for e in entities:
+            loop = self._loops.pop(e, None)
+            if loop is not None and loop.interval is not None:
+                loop.interval.pause()
+            self.end_pass(e)
+        self._synced.pop(lane.z_index, None)
+
+    def pause(self):
+        """Freeze every hazard where it is (game over)."""
+        for loop in self._loops.values():
+            if loop.interval is not None:
+                loop.interval.pause()
+        for _, _, interval in self._passes.values():
+            interval.pause()
+
+    def clear(self):
+        self.pause()
+        self._loops = {}
+        self._passes = {}
+        self._synced = {}
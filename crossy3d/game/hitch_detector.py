@@ -0,0 +1,128 @@
+"""
+Hitch detector: when a frame takes over HITCH_FACTOR times the target frame time, keep a record of
+what happened in it (lanes built / culled, saves, collector pauses, sounds, update phase timings,
+entity counts) in a bounded ring, appended to HITCH_FILE on death and on exit.
+
+A frame here is the wall time from one update task to the next, so it covers rendering and the
+event handlers (key presses, restart) that ran in between; the notes collected over that interval
+go with it. Between hitches the cost is a few perf_counter() calls per frame.
+"""
+
+import gc
+import json
+import time
+from collections import deque
+
+import settings
+
+
+class HitchDetector:
+    def __init__(
+        self, threshold_ms: float = settings.HITCH_FACTOR * settings.HITCH_TARGET_MS,
+        capacity: int = settings.HITCH_RING, path: str = settings.HITCH_FILE,
+    ):
+        self.enabled = True
+        self.threshold_ms = threshold_ms
+        self.path = path
+        self.records = deque(maxlen=capacity)
+        self.frame = 0
+        self.hitches = 0
+        self._unwritten = 0
+        self._last_start = None
+        self._mark = 0.0
+        self._gc_start = 0.0
+        self._reset_notes()
+        gc.callbacks.append(self._on_gc)
+
+    def _reset_notes(self):
+        self.phases = {}
+        self.built = []
+        self.culled = []
+        self.saves = []
+        self.collections = []
+        self.sounds = []
+
+    def frame_start(self, app):
+        """Top of the update task: judge the frame that just ended, then start collecting for this one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_start is not None:
+            frame_ms = (now - self._last_start) * 1000.0
+            if frame_ms > self.threshold_ms:
+                self._record(app, frame_ms)
+            self._reset_notes()
+        self._last_start = now
+        self._mark = now
+        self.frame += 1
+
+    def phase(self, name: str):
+        """Time since the previous mark goes to `name` (update phases, in order)."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[name] = (now - self._mark) * 1000.0
+        self._mark = now
+
+    def lane_built(self, z: int):
+        if self.enabled:
+            self.built.append(z)
+
+    def lane_culled(self, z: int):
+        if self.enabled:
+            self.culled.append(z)
+
+    def saved(self, ms: float):
+        if self.enabled:
+            self.saves.append(round(ms, 3))
+
+    def sound(self, event: str, key: str, ms: float):
+        """AudioManager listener: a sound was loaded or started."""
+        if self.enabled:
+            self.sounds.append({"event": event, "sound": key, "ms": round(ms, 3)})
+
+    def _on_gc(self, phase: str, info: dict):
+        if not self.enabled:
+            return
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            ms = (time.perf_counter() - self._gc_start) * 1000.0
+            self.collections.append({"generation": info["generation"], "ms": round(ms, 3)})
+
+    def _record(self, app, frame_ms: float):
+        self.hitches += 1
+        self._unwritten += 1
+        self.records.append({
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "frame": self.frame,
+            "frame_ms": round(frame_ms, 3),
+            "threshold_ms": round(self.threshold_ms, 3),
+            "state": app.state.name,
+            "score": app.score,
+            "player": [app.player.grid_x, app.player.grid_z],
+            "phases_ms": {name: round(ms, 3) for name, ms in self.phases.items()},
+            "lanes_built": self.built,
+            "lanes_culled": self.culled,
+            "saves_ms": self.saves,
+            "gc": self.collections,
+            "audio": self.sounds,
+            "entities": {
+                "lanes": len(app.lanes),
+                "vehicles": len(app.vehicles),
+                "river_lanes": len(app.river_lanes),
+                "trains": len(app.trains),
+                "active_trains": len(app.active_trains),
+                "world_nodes": app.world_root.countNumDescendants(),
+            },
+        })
+
+    def dump(self):
+        """Append the records not written yet (the newest ones still in the ring) to the file."""
+        pending = min(self._unwritten, len(self.records))
+        if not pending:
+            return
+        with open(self.path, "a") as f:
+            for record in list(self.records)[-pending:]:
+                f.write(json.dumps(record) + "\n")
+        self._unwritten = 0
@@ -1,5 +1,5 @@
 """
-Input handling: movement buffer, key mapping.
+Input handling: timestamped move queue, key mapping.
 """
 
 from collections import deque
@@ -26,20 +26,30 @@ KEY_TO_DIR = {
 
 
 class InputManager:
-    """Buffers one move during hop; maps keys to directions."""
+    """Timestamped move queue: presses that cannot be applied at once wait here, in order.
+
+    Entries are (direction, timestamp) with timestamp in time.perf_counter() seconds: the end of the
+    rendered frame before the key event, the earliest the key can have arrived unseen; at most
+    buffer_max wait, later presses are dropped.
+    """
 
     def __init__(self, buffer_max: int = 1):
         self.buffer_max = buffer_max
-        self.buffer: deque = deque(maxlen=buffer_max)
+        self.buffer: deque = deque()
         self._key_map = KEY_TO_DIR
 
-    def push_direction(self, direction: str):
-        """Queue a direction (up/down/left/right)."""
-        if direction in DIRECTIONS and len(self.buffer) < self.buffer_max:
-            self.buffer.append(direction)
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def push(self, direction: str, timestamp: float) -> bool:
+        """Queue a direction (up/down/left/right); False if it is unknown or the queue is full."""
+        if direction not in DIRECTIONS or len(self.buffer) >= self.buffer_max:
+            return False
+        self.buffer.append((direction, timestamp))
+        return True
 
-    def pop_direction(self):
-        """Consume next buffered direction or None."""
+    def pop(self):
+        """Oldest (direction, timestamp), or None."""
         if self.buffer:
             return self.buffer.popleft()
         return None
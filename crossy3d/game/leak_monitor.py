@@ -0,0 +1,214 @@
+"""
+Leak diagnostics for long runs: every LEAK_SAMPLE_LANES built lanes, sample what should stay bounded
+(scene nodes, GUI nodes, live hazards, geom and texture memory, Python objects per type), flag any
+metric that grew at every one of the last LEAK_GROWTH_SAMPLES samples, and write the retaining paths
+of hazards still alive after their lane was culled. Enable with settings.LEAK_DIAGNOSTICS or
+--leak-diagnostics; sampling runs a full gc.collect() and walks the scene graph, so it hitches.
+"""
+
+import gc
+import sys
+import time
+from collections import Counter, deque
+
+from panda3d.core import TextureCollection
+
+import settings
+from entities.log import Log
+from entities.train import Train
+from entities.vehicle import Vehicle
+
+_HAZARDS = (Vehicle, Log, Train)
+_PATHS_PER_SAMPLE = 3  # retaining paths written per sample (each is a gc.get_referrers walk)
+_PATH_DEPTH = 8
+
+
+def _geom_bytes(root) -> int:
+    geom_nodes = root.findAllMatches("**/+GeomNode")
+    total = 0
+    for i in range(geom_nodes.getNumPaths()):
+        node = geom_nodes.getPath(i).node()
+        for j in range(node.getNumGeoms()):
+            total += node.getGeom(j).getNumBytes()
+    return total
+
+
+def _texture_bytes(*roots) -> int:
+    textures = TextureCollection()
+    for root in roots:
+        textures.addTexturesFrom(root.findAllTextures())
+    textures.removeDuplicateTextures()
+    return sum(textures.getTexture(i).estimateTextureMemory() for i in range(textures.getNumTextures()))
+
+
+def _contents(*roots) -> set:
+    """ids of the roots and every GC-tracked container reachable through them (dict values, sequence
+    items, __slots__ attributes): diagnostic state, whose bounded growth is not the game's."""
+    seen = set()
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, dict):
+            items = obj.values()
+        elif isinstance(obj, (list, tuple, deque, set, frozenset)):
+            items = obj
+        else:
+            items = [getattr(obj, slot, None) for slot in getattr(type(obj), "__slots__", ())]
+        stack.extend(item for item in items if gc.is_tracked(item))
+    return seen
+
+
+def _edge(referrer, child) -> str:
+    """How `referrer` holds `child`, e.g. "Vehicle.node", "dict['x']", "list[3]"."""
+    name = type(referrer).__name__
+    if isinstance(referrer, dict):
+        for key, value in referrer.items():
+            if value is child:
+                return f"dict[{key!r}]"
+    elif isinstance(referrer, (list, tuple, deque)):
+        for i, value in enumerate(referrer):
+            if value is child:
+                return f"{name}[{i}]"
+    else:
+        for klass in type(referrer).__mro__:
+            for slot in getattr(klass, "__slots__", ()):
+                if getattr(referrer, slot, None) is child:
+                    return f"{name}.{slot}"
+        for attr, value in getattr(referrer, "__dict__", {}).items():
+            if value is child:
+                return f"{name}.{attr}"
+    return name
+
+
+def retaining_path(obj, roots: set, ignore: set = frozenset()) -> list:
+    """Shortest chain of referrers from a root (the app, a module namespace) down to obj, as edge
+    descriptions root-first; the partial chain from the furthest object reached if no root is found
+    within _PATH_DEPTH links. Referrers whose id is in `ignore` (the caller's own lists) are skipped."""
+    parent = {id(obj): None}  # id(x) -> (x, the object x refers to one step nearer obj)
+    frontier = [obj]
+    ignore = set(ignore) | {id(parent), id(frontier)}
+    last = obj
+    for _ in range(_PATH_DEPTH):
+        nxt = []
+        ignore.add(id(nxt))
+        for child in frontier:
+            for ref in gc.get_referrers(child):
+                rid = id(ref)
+                if rid in parent or rid in ignore or type(ref).__name__ == "frame":
+                    continue
+                parent[rid] = (ref, child)
+                if rid in roots:
+                    return _chain(parent, ref)
+                nxt.append(ref)
+                last = ref
+        frontier = nxt
+        if not frontier:
+            break
+    return _chain(parent, last) + ["(no root within reach)"]
+
+
+def _chain(parent: dict, top) -> list:
+    path = []
+    node = top
+    while parent.get(id(node)) is not None:
+        ref, child = parent[id(node)]
+        path.append(_edge(ref, child))
+        node = child
+    path.append(type(node).__name__)
+    return path
+
+
+class LeakMonitor:
+    """Samples bounded-by-design quantities as lanes stream in; reports growth and leaked hazards."""
+
+    def __init__(
+        self, every: int = settings.LEAK_SAMPLE_LANES, growth: int = settings.LEAK_GROWTH_SAMPLES,
+        report_path: str = settings.LEAK_REPORT_FILE,
+    ):
+        self.every = every
+        self.growth = growth
+        self.report_path = report_path
+        self.lanes_built = 0
+        self.samples = deque(maxlen=growth + 1)  # (metrics dict, Counter of Python types)
+        self.flagged = set()
+        self._report = None
+
+    def lane_built(self, app):
+        self.lanes_built += 1
+        if self.lanes_built % self.every == 0:
+            self.sample(app)
+
+    def sample(self, app):
+        gc.collect()
+        live = Counter()
+        types = Counter()
+        owned = {id(e) for entities in app._lane_entities for e in entities}
+        # Leave out diagnostics filling up to their bounds: this window, the hitch ring, profiler rings
+        mine = _contents(self.samples, app.hitch.records, app.profiler._rings)
+        leaked = []
+        for obj in gc.get_objects():
+            if id(obj) in mine:
+                continue
+            types[type(obj).__name__] += 1
+            if isinstance(obj, _HAZARDS):
+                live[type(obj).__name__] += 1
+                if id(obj) not in owned:
+                    leaked.append(obj)
+        metrics = {
+            "world_nodes": app.world_root.countNumDescendants(),
+            "gui_nodes": app.aspect2d.countNumDescendants(),
+            "vehicles": live["Vehicle"],
+            "logs": live["Log"],
+            "trains": live["Train"],
+            "geom_bytes": _geom_bytes(app.world_root),
+            "texture_bytes": _texture_bytes(app.render, app.aspect2d),
+            "py_objects": sum(types.values()),
+        }
+        self.samples.append((metrics, types))
+        self._write(f"lanes {self.lanes_built}: " + "  ".join(f"{k}={v}" for k, v in metrics.items()))
+        for name, first, last in self._growing():
+            self._flag(name, f"{name} grew at each of the last {self.growth} samples: {first} -> {last}")
+        if leaked:
+            self._flag("hazards", f"{len(leaked)} hazard(s) alive after their lane was culled")
+            roots = {id(app)} | {id(vars(m)) for m in list(sys.modules.values()) if m is not None}
+            for obj in leaked[:_PATHS_PER_SAMPLE]:
+                self._write("  retained: " + " -> ".join(retaining_path(obj, roots, {id(leaked)})))
+
+    def _growing(self) -> list:
+        """(name, first, last) of every metric and Python type that strictly grew across the window."""
+        if len(self.samples) <= self.growth:
+            return []
+        found = []
+        metrics = [m for m, _ in self.samples]
+        for name in metrics[-1]:
+            values = [m[name] for m in metrics]
+            if all(b > a for a, b in zip(values, values[1:])):
+                found.append((name, values[0], values[-1]))
+        counters = [t for _, t in self.samples]
+        for name in counters[-1]:
+            values = [c[name] for c in counters]
+            if all(b > a for a, b in zip(values, values[1:])):
+                found.append((f"python:{name}", values[0], values[-1]))
+        return found
+
+    def _flag(self, key: str, message: str):
+        """Report to the file every time, to the console the first time per key."""
+        if key not in self.flagged:
+            self.flagged.add(key)
+            print(f"Leak diagnostics: {message} (see {self.report_path})")
+        self._write("  FLAG " + message)
+
+    def _write(self, line: str):
+        if self._report is None:
+            self._report = open(self.report_path, "a")
+            self._report.write(f"# leak diagnostics {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._report.write(line + "\n")
+        self._report.flush()
+
+    def close(self):
+        if self._report is not None:
+            self._report.close()
+            self._report = None
@@ -0,0 +1,168 @@
+"""
+On-demand profiler capture of the update task (PROFILE_CAPTURE_KEY, or --profile-capture N from the
+start of play) for the next N frames, written to PROFILE_CAPTURE_DIR (<time> to the millisecond):
+  cprofile  deterministic cProfile of every call: profile_<time>.pstats (python -m pstats, snakeviz)
+  sample    statistical sampler: a thread reads the main thread's stack every
+            PROFILE_SAMPLE_INTERVAL_MS while the update task runs; profile_<time>.folded holds
+            collapsed stacks ("a;b;c count") for flamegraph.pl / speedscope
+Next to it, profile_<time>.json records the game state and every setting at capture start.
+Only the update task is profiled, not rendering. Nothing is hooked while no capture runs.
+"""
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections import Counter
+
+from panda3d.core import PandaSystem
+
+import settings
+
+
+class _Sampler(threading.Thread):
+    """Counts the main thread's stacks, from `root` (a code object) down, while `recording` is set."""
+
+    def __init__(self, thread_id: int, root, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.recording = False
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            if not self.recording:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                if code is self.root:
+                    break
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+class ProfileCapture:
+    """Profiles the update task for a number of frames; GameApp brackets _update_frame while active."""
+
+    def __init__(self, root, mode: str = settings.PROFILE_CAPTURE_MODE, out_dir: str = settings.PROFILE_CAPTURE_DIR):
+        self.root = root  # code object the sampled stacks start at (GameApp._update_task)
+        self.mode = mode
+        self.out_dir = out_dir
+        self.active = False
+        self.frames_left = 0
+        self.frames = 0
+        self._profile = None
+        self._sampler = None
+        self._switch_interval = None
+        self._stem = None
+
+    def toggle(self, app, frames: int = settings.PROFILE_CAPTURE_FRAMES):
+        """Hotkey: start a capture, or end the running one early."""
+        if self.active:
+            self.finish()
+        else:
+            self.start(app, frames)
+
+    def start(self, app, frames: int):
+        if self.active:
+            return
+        os.makedirs(self.out_dir, exist_ok=True)
+        now = time.time()
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}"
+        self._stem = os.path.join(self.out_dir, "profile_" + stamp)
+        n = 1
+        while os.path.exists(self._stem + ".json"):  # several captures within a millisecond
+            n += 1
+            self._stem = os.path.join(self.out_dir, f"profile_{stamp}_{n}")
+        with open(self._stem + ".json", "w") as f:
+            json.dump(self._metadata(app, frames), f, indent=2)
+        if self.mode == "sample":
+            interval = settings.PROFILE_SAMPLE_INTERVAL_MS / 1000.0
+            # The sampler needs the GIL to read a stack: let the main thread hand it over that often
+            self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._switch_interval, interval))
+            self._sampler = _Sampler(threading.get_ident(), self.root, interval)
+            self._sampler.start()
+        else:
+            self._profile = cProfile.Profile()
+        self.active = True
+        self.frames_left = frames
+        self.frames = 0
+        print(f"Profile capture ({self.mode}) of {frames} frames started: {self._stem}.*")
+
+    def begin_frame(self):
+        if self._profile is not None:
+            self._profile.enable()
+        else:
+            self._sampler.recording = True
+
+    def end_frame(self):
+        if self._profile is not None:
+            self._profile.disable()
+        else:
+            self._sampler.recording = False
+        self.frames += 1
+        self.frames_left -= 1
+        if self.frames_left <= 0:
+            self.finish()
+
+    def finish(self):
+        """Write the capture out and unhook everything."""
+        if not self.active:
+            return
+        self.active = False
+        if self._profile is not None:
+            path = self._stem + ".pstats"
+            self._profile.dump_stats(path)
+            self._profile = None
+        else:
+            self._sampler.stop()
+            sys.setswitchinterval(self._switch_interval)
+            path = self._stem + ".folded"
+            with open(path, "w") as f:
+                for stack, count in self._sampler.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self._sampler = None
+        print(f"Profile capture: {self.frames} frames written to {path}")
+
+    def _metadata(self, app, frames: int) -> dict:
+        config = {}
+        for name, value in vars(settings).items():
+            if name.isupper():
+                try:
+                    json.dumps(value)
+                except TypeError:
+                    value = repr(value)
+                config[name] = value
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "mode": self.mode,
+            "frames": frames,
+            "sample_interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS if self.mode == "sample" else None,
+            "python": platform.python_version(),
+            "panda3d": PandaSystem.getVersionString(),
+            "platform": platform.platform(),
+            "state": app.state.name,
+            "score": app.score,
+            "best_score": app.best_score,
+            "player": [app.player.grid_x, app.player.grid_z],
+            "lanes": len(app.lanes),
+            "vehicles": len(app.vehicles),
+            "river_lanes": len(app.river_lanes),
+            "active_trains": len(app.active_trains),
+            "settings": config,
+        }
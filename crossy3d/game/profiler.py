@@ -0,0 +1,100 @@
+"""
+Frame profiler: per-frame metrics in fixed ring buffers, summarized for the on-screen overlay.
+
+Each metric keeps its last PROFILER_WINDOW samples in a preallocated list; record() overwrites
+in place, so profiling itself adds nothing to the heap per frame. Built-in metrics:
+  frame_ms      wall time of the game's update task
+  alloc_blocks  net change in allocated Python memory blocks (sys.getallocatedblocks) over it
+  camera_alloc  the same, across CameraController.update alone
+  input_latency_ms  key arrival (end of the frame before its event) to the end of the first
+                    rendered frame showing the hop (recorded even while the overlay is off)
+  gc_pause_ms / gc_play_pause_ms  collector pauses: all, and those CPython started during play
+Other systems record their own with record(name, value).
+"""
+
+import sys
+import time
+
+import settings
+
+
+def _probe_bias() -> int:
+    """Blocks a reading itself adds: the int holding the first count is alive at the second."""
+    start = sys.getallocatedblocks()
+    return sys.getallocatedblocks() - start
+
+
+_BIAS = _probe_bias()
+
+
+def blocks_since(start: int) -> int:
+    """Net allocated blocks since sys.getallocatedblocks() returned `start`."""
+    return sys.getallocatedblocks() - start - _BIAS
+
+
+class _Ring:
+    __slots__ = ("values", "count", "index")
+
+    def __init__(self, size: int):
+        self.values = [0.0] * size
+        self.count = 0
+        self.index = 0
+
+    def add(self, value: float):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % len(self.values)
+        if self.count < len(self.values):
+            self.count += 1
+
+    def samples(self) -> list:
+        return self.values[:self.count] if self.count < len(self.values) else list(self.values)
+
+
+class FrameProfiler:
+    """Ring-buffered frame metrics; begin_frame() / end_frame() bracket the update task."""
+
+    def __init__(self, window: int = settings.PROFILER_WINDOW):
+        self.window = window
+        self.enabled = False
+        self._rings = {}
+        self._frame_start = 0.0
+        self._frame_blocks = 0
+
+    def record(self, name: str, value: float):
+        ring = self._rings.get(name)
+        if ring is None:
+            ring = self._rings[name] = _Ring(self.window)
+        ring.add(value)
+
+    def begin_frame(self):
+        self._frame_blocks = sys.getallocatedblocks()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        elapsed = time.perf_counter() - self._frame_start
+        self.record("frame_ms", elapsed * 1000.0)
+        self.record("alloc_blocks", blocks_since(self._frame_blocks))
+
+    def summary(self, name: str) -> dict:
+        """mean / p99 / max of a metric over the window (zeros if never recorded)."""
+        ring = self._rings.get(name)
+        samples = sorted(ring.samples()) if ring is not None else []
+        if not samples:
+            return {"mean": 0.0, "p99": 0.0, "max": 0.0, "count": 0}
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return {"mean": sum(samples) / len(samples), "p99": p99, "max": samples[-1], "count": len(samples)}
+
+    def overlay_lines(self) -> list:
+        """Text for the profiler overlay."""
+        frame = self.summary("frame_ms")
+        alloc = self.summary("alloc_blocks")
+        camera = self.summary("camera_alloc")
+        latency = self.summary("input_latency_ms")
+        pauses = self.summary("gc_pause_ms")
+        in_play = self.summary("gc_play_pause_ms")
+        return [
+            f"update {frame['mean']:.2f} ms  p99 {frame['p99']:.2f}  max {frame['max']:.2f}",
+            f"alloc blocks/frame {alloc['mean']:+.1f}  camera {camera['mean']:+.1f}",
+            f"key->hop {latency['mean']:.2f} ms  p99 {latency['p99']:.2f}  ({latency['count']} hops)",
+            f"gc {pauses['count']} pauses  max {pauses['max']:.2f} ms  unscheduled in play {in_play['count']}",
+        ]
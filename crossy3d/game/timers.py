@@ -0,0 +1,120 @@
+"""
+Hashed timer wheel: one-shot, cancellable callbacks on game time.
+Advanced once per frame from the update task; costs nothing while no timers are pending.
+"""
+
+import math
+
+import settings
+
+
+class TimerHandle:
+    """A scheduled callback. Pass to TimerWheel.cancel (or call cancel()) to drop it."""
+
+    __slots__ = ("wheel", "deadline", "rounds", "callback", "args", "active")
+
+    def __init__(self, wheel, deadline: float, rounds: int, callback, args):
+        self.wheel = wheel
+        self.deadline = deadline
+        self.rounds = rounds
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def remaining(self) -> float:
+        """Seconds of game time until this timer fires (0 once fired or cancelled)."""
+        if not self.active:
+            return 0.0
+        return max(0.0, self.deadline - self.wheel.now)
+
+    def cancel(self):
+        self.wheel.cancel(self)
+
+
+class TimerWheel:
+    """Fixed-resolution hashed wheel: schedule is O(1), cancel is O(1), advance is O(ticks + due)."""
+
+    def __init__(self, tick: float = settings.TIMER_TICK, slots: int = settings.TIMER_SLOTS):
+        self.tick = tick
+        self.now = 0.0
+        self._slots = [[] for _ in range(slots)]
+        self._tick_index = 0
+        self._pending = 0
+        self._stale = 0  # cancelled handles still sitting in a bucket
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def schedule(self, delay: float, callback, *args) -> TimerHandle:
+        """Call callback(*args) after `delay` seconds of game time (rounded up to one tick)."""
+        ticks = max(1, int(math.ceil(delay / self.tick - 1e-9)))
+        n = len(self._slots)
+        target = self._tick_index + ticks
+        handle = TimerHandle(self, self.now + delay, (ticks - 1) // n, callback, args)
+        self._slots[target % n].append(handle)
+        self._pending += 1
+        return handle
+
+    def cancel(self, handle):
+        """Cancel a pending timer; None and already fired/cancelled handles are ignored."""
+        if handle is None or not handle.active:
+            return
+        handle.active = False
+        # The handle stays in its bucket until the wheel next passes it; it must not keep what it
+        # would have been called with (a culled lane's bus) alive until then
+        handle.callback = None
+        handle.args = ()
+        self._pending -= 1
+        self._stale += 1
+
+    def advance(self, dt: float):
+        """Move game time forward by dt and fire every timer that came due, in tick order."""
+        self.now += dt
+        target = int(self.now / self.tick)
+        if self._pending == 0:
+            # Nothing scheduled: jump straight to the target tick
+            if self._stale:
+                for bucket in self._slots:
+                    bucket.clear()
+                self._stale = 0
+            self._tick_index = max(self._tick_index, target)
+            return
+        n = len(self._slots)
+        while self._tick_index < target and self._pending:
+            self._tick_index += 1
+            i = self._tick_index % n
+            bucket = self._slots[i]
+            if not bucket:
+                continue
+            keep = []
+            due = []
+            for handle in bucket:
+                if not handle.active:
+                    self._stale -= 1
+                elif handle.rounds == 0:
+                    due.append(handle)
+                else:
+                    handle.rounds -= 1
+                    keep.append(handle)
+            # Refill the bucket in place (it lives as long as the wheel); callbacks may schedule new
+            # timers into this slot, after the kept ones
+            bucket[:] = keep
+            for handle in due:
+                if not handle.active:  # cancelled by an earlier callback this tick
+                    self._stale -= 1
+                    continue
+                handle.active = False
+                self._pending -= 1
+                handle.callback(*handle.args)
+        self._tick_index = max(self._tick_index, target)
+
+    def clear(self):
+        """Drop every pending timer and reset game time."""
+        for bucket in self._slots:
+            for handle in bucket:
+                handle.active = False
+            bucket.clear()
+        self.now = 0.0
+        self._tick_index = 0
+        self._pending = 0
+        self._stale = 0
@@ -13,12 +13,17 @@ import settings
 CONTROLS_HUD = "WASD / Arrows - Move  |  R - Restart  |  Esc - Quit"
 CONTROLS_FULL = [
     "W / ↑ / Space - Forward    S / ↓ - Back    A / ← - Left    D / → - Right",
-    "Enter - Start / Confirm    R - Restart    Esc - Quit    F1 - Debug",
+    "Enter - Start / Confirm    R - Restart    Esc - Quit    F1 - Debug    "
+    f"{settings.PROFILER_KEY.upper()} - Profiler    {settings.PROFILE_CAPTURE_KEY.upper()} - Capture",
 ]
 
 
 class UIManager:
-    """Start / HUD / Game over text overlays + Restart button."""
+    """Start / HUD / Game over text overlays + Restart button.
+
+    Every screen is built once under its own root node; transitions only stash/unstash
+    the roots and update the dynamic fields, so death and restart pay no text layout.
+    """
 
     def __init__(self, base):
         self.base = base
@@ -32,12 +37,34 @@ class UIManager:
         self._game_over_score = None
         self._game_over_restart = None
         self._restart_button = None
-        self._game_over_controls = []
+        self._restart_command = None
         self._nodes = []
+        # Last value rendered into each dynamic HUD field; setText only runs on change
+        self._hud_values = {}
+        self._fps_next_refresh = 0.0
+        # Text geometry rebuild counter (every setText regenerates TextNode geometry)
+        self.text_rebuilds = 0
+        self.text_rebuilds_per_sec = 0.0
+        self._rebuild_window_start = 0.0
+        self._rebuild_window_count = 0
+        self._start_root = base.aspect2d.attachNewNode("start_screen")
+        self._hud_root = base.aspect2d.attachNewNode("hud")
+        self._game_over_root = base.aspect2d.attachNewNode("game_over_screen")
+        # Profiler overlay is independent of the screens (hide_all leaves it alone)
+        self._profiler_root = base.aspect2d.attachNewNode("profiler_overlay")
+        self._profiler_text = None
+        self._profiler_next_refresh = 0.0
+        self._build_start_screen()
+        self._build_hud()
+        self._build_game_over()
+        self._build_profiler_overlay()
+        self.hide_all()
+        self._profiler_root.stash()
 
     def _make_text(
         self,
         text: str,
+        parent,
         pos=(0, 0),
         scale=0.07,
         fg=(1, 1, 1, 1),
@@ -46,6 +73,7 @@ class UIManager:
     ):
         node = OnscreenText(
             text=text,
+            parent=parent,
             pos=pos,
             scale=scale,
             fg=fg,
@@ -55,45 +83,52 @@ class UIManager:
         self._nodes.append(node)
         return node
 
-    def show_start_screen(self):
+    def _build_start_screen(self):
         """SpongeBob theme title + Press Enter to Start + all controls reminder."""
-        self.hide_all()
+        root = self._start_root
         self._title = self._make_text(
             "SpongeBob Crossy Road",
+            root,
             pos=(0, 0.2),
             scale=0.11,
             fg=(1.0, 0.95, 0.3, 1),
         )
         self._subtitle = self._make_text(
             "Bikini Bottom 3D",
+            root,
             pos=(0, 0.08),
             scale=0.055,
             fg=(0.3, 0.7, 0.9, 1),
         )
         self._make_text(
             "Press ENTER to Start",
+            root,
             pos=(0, -0.02),
             scale=0.06,
         )
         for i, line in enumerate(CONTROLS_FULL):
             self._make_text(
                 line,
+                root,
                 pos=(0, -0.22 - i * 0.06),
                 scale=0.035,
                 fg=(0.9, 0.9, 0.9, 1),
             )
 
-    def show_hud(self, score: int, best: int):
+    def _build_hud(self):
         """Score, best, FPS, and controls reminder."""
+        root = self._hud_root
         self._score_text = self._make_text(
-            f"Score: {score}",
+            "Score: 0",
+            root,
             pos=(-1.3, 0.9),
             scale=0.05,
             align=TextNode.A_left,
             mayChange=True,
         )
         self._best_text = self._make_text(
-            f"Best: {best}",
+            "Best: 0",
+            root,
             pos=(-1.3, 0.82),
             scale=0.05,
             align=TextNode.A_left,
@@ -102,6 +137,7 @@ class UIManager:
         if settings.DEBUG_SHOW_FPS:
             self._fps_text = self._make_text(
                 "FPS: 0",
+                root,
                 pos=(1.2, 0.9),
                 scale=0.04,
                 align=TextNode.A_right,
@@ -109,67 +145,149 @@ class UIManager:
             )
         self._controls_hud_text = self._make_text(
             CONTROLS_HUD,
+            root,
             pos=(0, -0.92),
             scale=0.032,
             fg=(0.85, 0.85, 0.85, 1),
         )
+        self._hud_values = {"score": 0, "best": 0}
 
-    def update_hud(self, score: int, best: int, fps: float = 0):
-        if self._score_text:
-            self._score_text.setText(f"Score: {score}")
-        if self._best_text:
-            self._best_text.setText(f"Best: {best}")
-        if self._fps_text and settings.DEBUG_SHOW_FPS:
-            self._fps_text.setText(f"FPS: {int(fps)}")
-
-    def show_game_over(self, score: int, best: int, on_restart=None):
+    def _build_game_over(self):
         """Game over: score, best, Restart button, and all controls reminder."""
-        self.hide_all()
+        root = self._game_over_root
         self._game_over_title = self._make_text(
             "GAME OVER",
+            root,
             pos=(0, 0.22),
             scale=0.1,
             fg=(1, 0.3, 0.3, 1),
         )
         self._game_over_score = self._make_text(
-            f"Score: {score}  |  Best: {best}",
+            "Score: 0  |  Best: 0",
+            root,
             pos=(0, 0.08),
             scale=0.06,
+            mayChange=True,
         )
         self._game_over_restart = self._make_text(
             "Press R or click Restart",
+            root,
             pos=(0, -0.02),
             scale=0.045,
         )
-        if on_restart is not None:
-            self._restart_button = DirectButton(
-                text="Restart",
-                scale=0.06,
-                command=on_restart,
-                pos=(0, 0, -0.12),
-            )
-            self._nodes.append(self._restart_button)
+        self._restart_button = DirectButton(
+            text="Restart",
+            parent=root,
+            scale=0.06,
+            command=self._on_restart_clicked,
+            pos=(0, 0, -0.12),
+        )
+        self._nodes.append(self._restart_button)
         for i, line in enumerate(CONTROLS_FULL):
             self._make_text(
                 line,
+                root,
                 pos=(0, -0.32 - i * 0.055),
                 scale=0.032,
                 fg=(0.85, 0.85, 0.85, 1),
             )
+        self._hud_values["game_over"] = (0, 0)
+
+    def _build_profiler_overlay(self):
+        self._profiler_text = self._make_text(
+            "",
+            self._profiler_root,
+            pos=(-1.3, 0.74),
+            scale=0.035,
+            fg=(1, 1, 0.6, 1),
+            align=TextNode.A_left,
+            mayChange=True,
+        )
+
+    def show_profiler(self, visible: bool):
+        if visible:
+            self._profiler_next_refresh = 0.0
+            self._profiler_root.unstash()
+        else:
+            self._profiler_root.stash()
+
+    def profiler_due(self) -> bool:
+        """Is the profiler overlay due for a refresh? Throttled to HUD_FPS_INTERVAL like the FPS
+        readout; True also starts the next interval, so the caller builds the lines only then."""
+        now = self.base.taskMgr.globalClock.getFrameTime()
+        if now < self._profiler_next_refresh:
+            return False
+        self._profiler_next_refresh = now + settings.HUD_FPS_INTERVAL
+        return True
+
+    def update_profiler(self, lines: list):
+        """Show the profiler overlay lines (call when profiler_due())."""
+        self._set_text("profiler", self._profiler_text, tuple(lines), "\n".join(lines))
+
+    def _on_restart_clicked(self):
+        if self._restart_command is not None:
+            self._restart_command()
+
+    def show_start_screen(self):
+        self.hide_all()
+        self._start_root.unstash()
+
+    def show_hud(self, score: int, best: int):
+        self._set_text("score", self._score_text, score, f"Score: {score}")
+        self._set_text("best", self._best_text, best, f"Best: {best}")
+        self._hud_root.unstash()
+
+    def _set_text(self, key: str, node, value, text: str):
+        """setText only if the field's value changed since the last render."""
+        if self._hud_values.get(key) == value:
+            return
+        self._hud_values[key] = value
+        node.setText(text)
+        self.text_rebuilds += 1
+        self._rebuild_window_count += 1
+
+    def _tick_rebuild_rate(self, now: float):
+        """Roll the text-rebuilds-per-second counter once per second."""
+        elapsed = now - self._rebuild_window_start
+        if elapsed >= 1.0:
+            self.text_rebuilds_per_sec = self._rebuild_window_count / elapsed
+            self._rebuild_window_start = now
+            self._rebuild_window_count = 0
+
+    def update_hud(self, score: int, best: int, fps: float = 0):
+        """Refresh HUD fields that changed; FPS readout is throttled to HUD_FPS_INTERVAL."""
+        now = self.base.taskMgr.globalClock.getFrameTime()
+        self._tick_rebuild_rate(now)
+        if self._score_text:
+            self._set_text("score", self._score_text, score, f"Score: {score}")
+        if self._best_text:
+            self._set_text("best", self._best_text, best, f"Best: {best}")
+        if self._fps_text and settings.DEBUG_SHOW_FPS and now >= self._fps_next_refresh:
+            self._fps_next_refresh = now + settings.HUD_FPS_INTERVAL
+            value = (int(fps), int(self.text_rebuilds_per_sec))
+            self._set_text("fps", self._fps_text, value, f"FPS: {value[0]}  Text: {value[1]}/s")
+
+    def show_game_over(self, score: int, best: int, on_restart=None):
+        """Show the pre-built game over screen; the Restart button is hidden without a callback."""
+        self.hide_all()
+        self._set_text("game_over", self._game_over_score, (score, best), f"Score: {score}  |  Best: {best}")
+        self._restart_command = on_restart
+        if on_restart is None:
+            self._restart_button.stash()
+        else:
+            self._restart_button.unstash()
+        self._game_over_root.unstash()
 
     def hide_all(self):
-        """Remove all UI nodes and the Restart button."""
+        """Stash every screen (nodes are kept for the next transition)."""
+        self._start_root.stash()
+        self._hud_root.stash()
+        self._game_over_root.stash()
+
+    def destroy(self):
+        """Tear down all UI nodes (shutdown only)."""
         for node in self._nodes:
-            if hasattr(node, "destroy"):
-                node.destroy()
+            node.destroy()
         self._nodes = []
-        self._title = None
-        self._subtitle = None
-        self._score_text = None
-        self._best_text = None
-        self._fps_text = None
-        self._controls_hud_text = None
-        self._game_over_title = None
-        self._game_over_score = None
-        self._game_over_restart = None
-        self._restart_button = None
+        for root in (self._start_root, self._hud_root, self._game_over_root, self._profiler_root):
+            root.removeNode()
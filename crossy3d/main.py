@@ -5,6 +5,7 @@ Run from project root: python crossy3d/main.py
 Or from crossy3d/: python main.py
 """
 
+import argparse
 import sys
 import os
 
@@ -13,8 +14,70 @@ _root = os.path.dirname(os.path.abspath(__file__))
 if _root not in sys.path:
     sys.path.insert(0, _root)
 
+import settings
 from game.game_app import GameApp
 
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Crossy Road 3D")
+    parser.add_argument(
+        "--lane-worker", action="store_true",
+        help="generate lanes ahead of the player in a worker process (needs NumPy)",
+    )
+    parser.add_argument("--course", metavar="PATH", help="play a precomputed course file (tools/make_course.py)")
+    parser.add_argument(
+        "--collision", choices=("python", "panda"),
+        help="collision backend (default: settings.COLLISION_BACKEND)",
+    )
+    parser.add_argument(
+        "--hazard-motion", choices=("python", "intervals"),
+        help="who moves vehicles, logs and buses (default: settings.HAZARD_MOTION)",
+    )
+    parser.add_argument(
+        "--gc", choices=("python", "managed"),
+        help="garbage collection: CPython's own timing or frozen + scheduled (default: settings.GC_MODE)",
+    )
+    parser.add_argument(
+        "--leak-diagnostics", action="store_true",
+        help=f"sample scene / object counts every {settings.LEAK_SAMPLE_LANES} lanes and report growth",
+    )
+    parser.add_argument(
+        "--hitch-factor", type=float, metavar="X",
+        help=f"record frames over X target frames to {settings.HITCH_FILE}; 0 turns it off "
+        f"(default: {settings.HITCH_FACTOR})",
+    )
+    parser.add_argument(
+        "--profile-capture", type=int, metavar="N",
+        help=f"profile the first N frames of play into {settings.PROFILE_CAPTURE_DIR}/ "
+        f"({settings.PROFILE_CAPTURE_KEY.upper()} captures {settings.PROFILE_CAPTURE_FRAMES} frames at any time)",
+    )
+    parser.add_argument(
+        "--profile-mode", choices=("cprofile", "sample"),
+        help="cProfile to .pstats or stack sampling to collapsed stacks (default: settings.PROFILE_CAPTURE_MODE)",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.lane_worker:
+        settings.LANE_WORKER = True
+    if args.course:
+        settings.COURSE_FILE = args.course
+    if args.collision:
+        settings.COLLISION_BACKEND = args.collision
+    if args.hazard_motion:
+        settings.HAZARD_MOTION = args.hazard_motion
+    if args.gc:
+        settings.GC_MODE = args.gc
+    if args.leak_diagnostics:
+        settings.LEAK_DIAGNOSTICS = True
+    if args.hitch_factor is not None:
+        settings.HITCH_DETECTOR = args.hitch_factor > 0
+        settings.HITCH_FACTOR = args.hitch_factor
+    if args.profile_capture:
+        settings.PROFILE_CAPTURE_ON_PLAY = args.profile_capture
+    if args.profile_mode:
+        settings.PROFILE_CAPTURE_MODE = args.profile_mode
     app = GameApp()
     app.run()
@@ -20,22 +20,42 @@ FORWARD_SIGN = 1
 PLAYER_HOP_DURATION = 0.25  # seconds per hop
 PLAYER_HOP_HEIGHT = 0.35    # arc height for hop
 PLAYER_SQUASH_SCALE = 0.85  # squash at land
-INPUT_BUFFER_MAX = 1       # queued moves during hop
+INPUT_BUFFER_MAX = 1       # moves queued while a hop is in progress (others apply at once)
 
 # Camera (isometric / trailing) – zoomed in to fill view and reduce blank areas
 CAMERA_DISTANCE = 6.5
 CAMERA_HEIGHT = 4.5
 CAMERA_ANGLE = 32.0        # degrees from horizontal
-CAMERA_SMOOTHING = 8.0     # follow speed (higher = snappier)
+CAMERA_SMOOTHING = 8.0     # follow spring frequency, 1/s (higher = snappier)
 CAMERA_LOOK_AHEAD = 1.5    # look slightly ahead of player
+CAMERA_HOP_LEAD = 0.4      # extra lead along a hop in progress, towards the landing tile
+CAMERA_SHAKE_SEED = 7      # death shake phases come from this seed
+CAMERA_SHAKE_FREQUENCY = 25.0  # Hz
+
+# Animation (utils/animation.py)
+ANIM_CAPACITY = 64         # animated channels (player hop, props)
+ANIM_LUT_SIZE = 1024       # samples per easing table
+ANIM_BATCH_MIN = 64        # moving channels from which the NumPy pass beats the Python loop
 
 # Lanes - generation
 LANES_AHEAD = 15           # lanes to generate in front
 LANES_BEHIND_CULL = 3      # cull lanes this many behind player
+LANES_READY_ON_RESTART = 6 # lanes built synchronously on start/restart; the rest stream in
+LANES_BUILT_PER_FRAME = 2  # max lanes built per frame while streaming
 MIN_SAFE_LANES = 2         # min grass between roads/rivers
 MAX_CONSECUTIVE_HAZARD = 2 # max roads/trains in a row
 MAX_CONSECUTIVE_RIVER = 3  # rivers can repeat (2–3 water lanes) so it looks like continuous water, not a train
 
+WORLD_SEED = None          # int for a reproducible world (lanes + hazard timing); None = random
+
+# Lane worker: stream lane content from a separate process (needs NumPy; --lane-worker on the CLI)
+LANE_WORKER = False
+LANE_WORKER_AHEAD = 64     # lanes the worker keeps generated past the lane being built
+LANE_WORKER_BATCH = 32     # lanes per generated batch (the replay unit of the in-process fallback)
+LANE_WORKER_CAPACITY = 256 # records in the shared-memory ring
+
+COURSE_FILE = None         # path of a precomputed course (tools/make_course.py) to play instead of generating
+
 # Grass
 GRASS_BLOCKER_CHANCE = 0.15  # chance per tile for tree/rock
 GRASS_BLOCKER_CLUSTER = 0.3  # chance to add adjacent blocker
@@ -64,11 +84,17 @@ TRAIN_LANE_CHANCE = 0.08
 TRAIN_WARNING_TIME = 2.0   # seconds warning before train
 TRAIN_SPEED = 15.0
 TRAIN_LENGTH = 8           # tiles
+TRAIN_SLEEP_MIN = 2.0      # seconds parked between passes (seeded per lane)
+TRAIN_SLEEP_MAX = 6.0
 
 # Doom (eagle / stay too long)
 DOOM_TIME = 12.0           # seconds without forward progress
 DOOM_WARNING_TIME = 3.0
 
+# Timers (hashed timer wheel driving train, drown and doom deadlines)
+TIMER_TICK = 1.0 / 120.0   # wheel resolution in seconds
+TIMER_SLOTS = 256          # buckets per revolution
+
 # Scoring
 SCORE_PER_ROW = 1
 SAVE_FILE = "best_score.json"
@@ -85,3 +111,44 @@ AUDIO_ENABLED = True
 # Debug
 DEBUG_COLLISION_BOXES = False
 DEBUG_SHOW_FPS = True
+
+# Collision backend (game/collision.py; --collision on the CLI)
+COLLISION_BACKEND = "python"  # "python" (swept AABB tests) or "panda" (CollisionTraverser)
+
+# Hazard motion (game/hazard_motion.py; --hazard-motion on the CLI)
+HAZARD_MOTION = "python"  # "python" (setX every frame) or "intervals" (Panda3D intervals move hazards)
+
+# HUD
+HUD_FPS_INTERVAL = 0.5     # seconds between FPS readout refreshes
+
+# Profiler overlay (game/profiler.py)
+PROFILER_KEY = "f3"
+PROFILER_WINDOW = 600      # frames of history per metric
+
+# Profiler capture of the update task (game/profile_capture.py; --profile-capture on the CLI)
+PROFILE_CAPTURE_KEY = "f4"
+PROFILE_CAPTURE_FRAMES = 300  # frames captured per key press (pressing again ends it early)
+PROFILE_CAPTURE_MODE = "cprofile"  # "cprofile" (.pstats) or "sample" (collapsed stacks, .folded)
+PROFILE_SAMPLE_INTERVAL_MS = 1.0
+PROFILE_CAPTURE_ON_PLAY = 0  # frames to capture from the start of play (0: only on the key)
+PROFILE_CAPTURE_DIR = "profiles"
+
+# Garbage collection (game/gc_manager.py; --gc on the CLI)
+GC_MODE = "python"         # "python" (CPython collects when it likes) or "managed" (freeze + scheduled collections)
+GC_PLAYING_THRESHOLDS = (50000, 50, 1000)  # gc.set_threshold while PLAYING when managed
+GC_EVENT_BUDGET_MS = 10.0  # death / restart: oldest generation whose expected pause fits this
+GC_FRAME_BUDGET_MS = 8.0   # an update task under this leaves the rest for a due collection
+GC_IDLE_MIN_YOUNG = 700    # young objects pending before a frame's slack is spent on a collection
+
+# Leak diagnostics (game/leak_monitor.py; --leak-diagnostics on the CLI)
+LEAK_DIAGNOSTICS = False
+LEAK_SAMPLE_LANES = 50     # lanes built between samples
+LEAK_GROWTH_SAMPLES = 5    # a metric is flagged when it grew at each of this many samples in a row
+LEAK_REPORT_FILE = "leak_report.txt"  # samples, flags and retaining paths are appended here
+
+# Hitch detector (game/hitch_detector.py; --hitch-factor on the CLI)
+HITCH_DETECTOR = True
+HITCH_TARGET_MS = 1000.0 / 60.0  # frame time the game aims for
+HITCH_FACTOR = 2.0         # a frame longer than this many target frames is recorded
+HITCH_RING = 64            # records kept in memory
+HITCH_FILE = "hitches.jsonl"  # records are appended here on death and on exit
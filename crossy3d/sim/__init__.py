@@ -0,0 +1,3 @@
+"""Headless simulation for bots: many games stepped in lockstep with NumPy (no Panda3D window)."""
+
+from .vec_env import VecEnv, OBS_CHANNELS, NOOP, UP, DOWN, LEFT, RIGHT
@@ -0,0 +1,430 @@
+"""
+Vectorized headless environment: M independent games stepped in lockstep with NumPy.
+
+Rules follow GameApp: one-tile hops eased over PLAYER_HOP_DURATION, grass blockers, stepping onto
+water only where a log covers the tile, riding while a log is under the player, drowning after
+RIVER_DROWN_DELAY off a log, swept collision against boats and trains, train sleep / warning /
+pass cycles, and doom after DOOM_TIME without a forward hop. Each env keeps the same window of
+lanes the game keeps built (LANES_BEHIND_CULL behind, LANES_AHEAD ahead) in a ring of slots.
+Lanes come from the batch generator in aligned chunks, as in the lane stream.
+Requires NumPy.
+"""
+
+import numpy as np
+
+import settings
+from world.lane_batch import LANE_DTYPE, MAX_ITEMS, KIND_GRASS, KIND_ROAD, KIND_RIVER, KIND_TRAIN
+from world.lane_stream import stream_batch
+from world.world_gen import WorldGenerator
+
+# Actions: no-op, then the hops of game.input.DIRECTIONS
+NOOP, UP, DOWN, LEFT, RIGHT = range(5)
+_ACTION_DX = np.array([0, 0, 0, 1, -1], dtype=np.int64)
+_ACTION_DZ = np.array([0, 1, -1, 0, 0], dtype=np.int64)
+
+# Death reasons reported in info["death"]
+ALIVE, DEATH_VEHICLE, DEATH_TRAIN, DEATH_DROWN, DEATH_DOOM = range(5)
+
+# Observation channels, one W-wide row per lane around the player
+OBS_CHANNELS = ("grass", "road", "river", "train", "blocked", "occupied", "velocity", "train_warning", "player")
+
+_SLEEP, _WARNING, _ACTIVE = 0, 1, 2  # train phases
+
+
+class VecEnv:
+    """M games in lockstep. step(actions) -> (obs, reward, done, info); done envs reset automatically.
+
+    obs is float32 (M, len(OBS_CHANNELS), obs_behind + 1 + obs_ahead, LANE_WIDTH), rows from
+    obs_behind lanes behind the player to obs_ahead ahead. The same buffer is returned every step.
+    Actions given mid-hop are dropped. Reward is SCORE_PER_ROW per new row reached and
+    death_penalty on death. A reset env replays its world (reuse_worlds episodes per world)
+    with fresh hazard timing, without reallocating anything.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        seed: int = None,
+        dt: float = 0.05,
+        obs_behind: int = 2,
+        obs_ahead: int = 5,
+        death_penalty: float = -1.0,
+        reuse_worlds: int = 4,
+        chunk: int = 256,
+    ):
+        self.num_envs = m = num_envs
+        self.dt = dt
+        self.death_penalty = death_penalty
+        self.reuse_worlds = max(1, reuse_worlds)
+        self.chunk = chunk
+        self.rng = np.random.default_rng(seed)
+        self.width = w = settings.LANE_WIDTH
+        self.ts = settings.TILE_SIZE
+        self.behind = settings.LANES_BEHIND_CULL
+        self.slots = n = settings.LANES_BEHIND_CULL + 1 + settings.LANES_AHEAD
+        self.vehicles = v = min(settings.ROAD_VEHICLES_PER_LANE_MAX, MAX_ITEMS)
+        steps = min(MAX_ITEMS - 1, -(-w // (settings.RIVER_LOG_LENGTH_MIN + settings.RIVER_LOG_GAP_MIN)))
+        self.logs = g = max(steps, 2)
+        self._rows = np.arange(-obs_behind, obs_ahead + 1)
+        self._obs_player_row = obs_behind
+        self._env = np.arange(m)
+        self._cols = np.arange(w)
+
+        # Lane slots (lane z lives in slot z % slots)
+        self.kind = np.zeros((m, n), dtype=np.int8)
+        self.direction = np.zeros((m, n))
+        self.speed = np.zeros((m, n))
+        self.blocked = np.zeros((m, n), dtype=np.int64)
+        self.veh_on = np.zeros((m, n, v), dtype=bool)
+        self.veh_x = np.zeros((m, n, v))
+        self.veh_prev = np.zeros((m, n, v))
+        self.log_on = np.zeros((m, n, g), dtype=bool)
+        self.log_x = np.zeros((m, n, g))
+        self.log_hl = np.zeros((m, n, g))
+        self.train_phase = np.zeros((m, n), dtype=np.int8)
+        self.train_timer = np.full((m, n), np.inf)
+        self.train_x = np.zeros((m, n))
+        self.train_prev = np.zeros((m, n))
+        self.train_hl = settings.TRAIN_LENGTH * self.ts / 2
+
+        # Player and episode
+        self.gx = np.zeros(m, dtype=np.int64)
+        self.gz = np.zeros(m, dtype=np.int64)
+        self.px = np.zeros(m)
+        self.pz = np.zeros(m)
+        self.hop_t = np.ones(m)
+        self.hop_sx = np.zeros(m)
+        self.hop_sz = np.zeros(m)
+        self.hop_ex = np.zeros(m)
+        self.hop_ez = np.zeros(m)
+        self.base = np.zeros(m, dtype=np.int64)  # lowest lane still in the window
+        self.max_z = np.zeros(m, dtype=np.int64)
+        self.score = np.zeros(m, dtype=np.int64)
+        self.steps = np.zeros(m, dtype=np.int64)
+        self.drown_t = np.zeros(m)
+        self.doom_t = np.zeros(m)
+
+        # Worlds: lane records per env, generated a chunk at a time
+        self._gens = [None] * m
+        self._records = np.zeros((m, chunk), dtype=LANE_DTYPE)
+        self._chunk_start = np.zeros(m, dtype=np.int64)
+        self._world_uses = np.zeros(m, dtype=np.int64)
+
+        self.obs = np.zeros((m, len(OBS_CHANNELS), len(self._rows), w), dtype=np.float32)
+        self.reward = np.zeros(m, dtype=np.float32)
+        self.done = np.zeros(m, dtype=bool)
+        self.death = np.zeros(m, dtype=np.int8)
+
+    # -- Episodes -----------------------------------------------------------------------------
+
+    def reset(self) -> np.ndarray:
+        self._world_uses[:] = self.reuse_worlds  # every env gets a new world
+        self._reset_envs(self._env)
+        return self._observe()
+
+    def _reset_envs(self, envs: np.ndarray):
+        for e in envs.tolist():
+            self._world_uses[e] += 1
+            if self._world_uses[e] > self.reuse_worlds or self._chunk_start[e] != 0:
+                self._gens[e] = WorldGenerator(int(self.rng.integers(1 << 63)))
+                self._records[e] = stream_batch(self._gens[e], 0, self.chunk)
+                self._chunk_start[e] = 0
+                self._world_uses[e] = 1
+        ts = self.ts
+        self.gx[envs] = self.width // 2
+        self.gz[envs] = 0
+        self.px[envs] = self.gx[envs] * ts
+        self.pz[envs] = 0.0
+        self.hop_t[envs] = 1.0
+        self.base[envs] = 0
+        # GameApp scores the spawn row on the first frame
+        self.max_z[envs] = 0
+        self.score[envs] = settings.SCORE_PER_ROW
+        self.steps[envs] = 0
+        self.drown_t[envs] = 0.0
+        self.doom_t[envs] = 0.0
+        n = self.slots
+        self._load(np.repeat(envs, n), np.tile(np.arange(n), len(envs)))
+
+    def _load(self, envs: np.ndarray, zs: np.ndarray):
+        """Load lane zs[i] of env envs[i] into its slot, with hazards at their starting layout."""
+        for e in np.unique(envs[zs - self._chunk_start[envs] >= self.chunk]).tolist():
+            # Lanes advance one at a time, so the next lane is always in the next chunk
+            self._chunk_start[e] += self.chunk
+            self._records[e] = stream_batch(self._gens[e], int(self._chunk_start[e]), self.chunk)
+        rec = self._records[envs, zs - self._chunk_start[envs]]
+        s = zs % self.slots
+        ts = self.ts
+        kind = rec["kind"].astype(np.int8)
+        direction = rec["direction"].astype(np.float64)
+        count = rec["count"][:, None]
+        self.kind[envs, s] = kind
+        self.direction[envs, s] = direction
+        self.speed[envs, s] = rec["speed"]
+        self.blocked[envs, s] = rec["blocked"].astype(np.int64)
+        xs = rec["xs"].astype(np.float64) * ts
+        self.veh_on[envs, s] = (kind == KIND_ROAD)[:, None] & (np.arange(self.vehicles) < count)
+        self.veh_x[envs, s] = xs[:, :self.vehicles]
+        self.veh_prev[envs, s] = xs[:, :self.vehicles]
+        self.log_on[envs, s] = (kind == KIND_RIVER)[:, None] & (np.arange(self.logs) < count)
+        self.log_x[envs, s] = xs[:, :self.logs]
+        self.log_hl[envs, s] = rec["lengths"][:, :self.logs] * (ts / 2)
+        train = kind == KIND_TRAIN
+        start = np.where(direction > 0, -self.train_hl - 5, self.train_hl + 5)
+        self.train_phase[envs, s] = _SLEEP
+        self.train_timer[envs, s] = np.where(train, rec["first_delay"], np.inf)
+        self.train_x[envs, s] = start
+        self.train_prev[envs, s] = start
+
+    # -- Step ---------------------------------------------------------------------------------
+
+    def step(self, actions):
+        """Advance every env by dt. Returns (obs, reward, done, info); info["score"] and
+        info["death"] describe the episode that just ended for envs with done set."""
+        dt = self.dt
+        ts = self.ts
+        e = self._env
+        actions = np.asarray(actions, dtype=np.int64)
+        px0 = self.px.copy()
+        pz0 = self.pz.copy()
+
+        # Input: one hop when idle, as GameApp._try_player_move
+        dx = _ACTION_DX[actions]
+        dz = _ACTION_DZ[actions]
+        nx = self.gx + dx
+        nz = self.gz + dz
+        move = (self.hop_t >= 1.0) & (actions != NOOP) & ~self._is_blocked(nx, nz)
+        if move.any():
+            self.hop_sx = np.where(move, self.px, self.hop_sx)
+            self.hop_sz = np.where(move, self.pz, self.hop_sz)
+            self.hop_ex = np.where(move, nx * ts, self.hop_ex)
+            self.hop_ez = np.where(move, nz * ts, self.hop_ez)
+            self.hop_t[move] = 0.0
+            self.gx = np.where(move, nx, self.gx)
+            self.gz = np.where(move, nz, self.gz)
+            self.doom_t[move & (dz > 0)] = 0.0  # forward hop re-arms doom
+
+        # Hop animation (Player.update)
+        hopping = self.hop_t < 1.0
+        t = np.minimum(1.0, self.hop_t + dt / settings.PLAYER_HOP_DURATION)
+        eased = np.where(t < 0.5, 2 * t * t, 1 - (2 - 2 * t) ** 2 / 2)
+        self.hop_t = np.where(hopping, t, self.hop_t)
+        self.px = np.where(hopping, self.hop_sx + (self.hop_ex - self.hop_sx) * eased, self.px)
+        self.pz = np.where(hopping, self.hop_sz + (self.hop_ez - self.hop_sz) * eased, self.pz)
+
+        self._update_hazards(dt)
+
+        # Log ride and drowning (GameApp._update_log_ride / _check_river_and_logs)
+        slot = self.gz % self.slots
+        in_window = self.gz >= self.base
+        river = in_window & (self.kind[e, slot] == KIND_RIVER)
+        near = np.abs(self.pz - self.gz * ts) <= ts * 0.4
+        riding = river & near & self._log_under(slot, self.px)
+        in_water = river & ~riding
+        self.drown_t = np.where(in_water, self.drown_t + dt, 0.0)
+
+        death = np.zeros(self.num_envs, dtype=np.int8)
+        death[self._hit_trains(px0, pz0)] = DEATH_TRAIN
+        death[self._hit_vehicles(px0, pz0)] = DEATH_VEHICLE
+
+        # Deadlines (the game's timer wheel)
+        self.doom_t += dt
+        alive = death == ALIVE
+        death[alive & (self.drown_t >= settings.RIVER_DROWN_DELAY)] = DEATH_DROWN
+        death[(death == ALIVE) & (self.doom_t >= settings.DOOM_TIME)] = DEATH_DOOM
+
+        # Score and lane window
+        self.reward[:] = 0.0
+        gained = self.gz > self.max_z
+        self.reward[gained] = settings.SCORE_PER_ROW
+        self.score[gained] += settings.SCORE_PER_ROW
+        self.max_z = np.maximum(self.max_z, self.gz)
+        self._advance_window()
+        self.steps += 1
+
+        self.done = death != ALIVE
+        self.death = death
+        info = {"score": self.score.copy(), "death": death, "steps": self.steps.copy()}
+        if self.done.any():
+            self.reward[self.done] = self.death_penalty
+            self._reset_envs(np.flatnonzero(self.done))
+        return self._observe(), self.reward, self.done, info
+
+    def _is_blocked(self, nx: np.ndarray, nz: np.ndarray) -> np.ndarray:
+        """GameApp._try_player_move's is_blocked; lanes behind the window count as open ground."""
+        e = self._env
+        out = (nx < 0) | (nx >= self.width) | (nz < 0)
+        x = np.clip(nx, 0, self.width - 1)
+        slot = nz % self.slots
+        in_window = nz >= self.base
+        kind = self.kind[e, slot]
+        grass = (self.blocked[e, slot] >> x) & 1 == 1
+        water = ~self._log_under(slot, x * self.ts)
+        blocked = np.where(kind == KIND_GRASS, grass, np.where(kind == KIND_RIVER, water, False))
+        return out | (in_window & blocked)
+
+    def _log_under(self, slot: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Is x (world) on a log of lane slot? RiverLane.log_at / is_covered, per env."""
+        e = self._env
+        lx = self.log_x[e, slot]
+        hl = self.log_hl[e, slot]
+        x = x[:, None]
+        return (self.log_on[e, slot] & (lx - hl <= x) & (x <= lx + hl)).any(axis=1)
+
+    def _update_hazards(self, dt: float):
+        ts = self.ts
+        lane_min = -0.5 * ts
+        lane_max = (self.width - 0.5) * ts
+        step = (self.direction * self.speed * dt)[:, :, None]
+
+        # Traffic (TrafficRing): the leading vehicle past the far edge re-enters behind the tail
+        self.veh_prev[:] = self.veh_x
+        self.veh_x += step
+        d = self.direction[:, :, None]
+        hw = ts * 0.6
+        left = self.veh_on & np.where(d > 0, self.veh_x - hw > lane_max, self.veh_x + hw < lane_min)
+        if left.any():
+            key = np.where(self.veh_on, self.veh_x * d, np.inf)
+            tail = np.take_along_axis(self.veh_x, key.argmin(axis=2)[:, :, None], axis=2)
+            lead = np.where(left, key, -np.inf).argmax(axis=2)[:, :, None]
+            recycle = np.take_along_axis(left, lead, axis=2)
+            gap = self.rng.integers(settings.ROAD_VEHICLE_GAP_MIN, settings.ROAD_VEHICLE_GAP_MAX + 1, size=tail.shape)
+            behind = tail - d * (gap + 1) * ts
+            x = np.where(d > 0, np.minimum(behind, lane_min - hw), np.maximum(behind, lane_max + hw))
+            old = np.take_along_axis(self.veh_x, lead, axis=2)
+            np.put_along_axis(self.veh_x, lead, np.where(recycle, x, old), axis=2)
+            np.put_along_axis(self.veh_prev, lead, np.where(recycle, x, np.take_along_axis(self.veh_prev, lead, axis=2)), axis=2)
+
+        # Logs wrap from one edge to the other
+        self.log_x += step
+        edge = self.width * ts
+        hl = self.log_hl
+        self.log_x = np.where((d > 0) & (self.log_x > edge + hl), -hl, self.log_x)
+        self.log_x = np.where((d < 0) & (self.log_x < -hl), edge + hl, self.log_x)
+
+        # Trains: sleep -> warning -> pass -> sleep
+        active = self.train_phase == _ACTIVE
+        self.train_prev[:] = self.train_x
+        self.train_x += np.where(active, self.direction * settings.TRAIN_SPEED * dt, 0.0)
+        d = self.direction
+        gone = active & np.where(
+            d > 0, self.train_x - self.train_hl > edge + ts, self.train_x + self.train_hl < -ts,
+        )
+        if gone.any():
+            start = np.where(d > 0, -self.train_hl - 5, self.train_hl + 5)
+            self.train_phase[gone] = _SLEEP
+            self.train_x = np.where(gone, start, self.train_x)
+            self.train_prev = np.where(gone, start, self.train_prev)
+            self.train_timer[gone] = self.rng.uniform(settings.TRAIN_SLEEP_MIN, settings.TRAIN_SLEEP_MAX, size=int(gone.sum()))
+        # Timer transitions fire after collisions in the game; a train activated now moves next step
+        self.train_timer -= dt
+        due = self.train_timer <= 0.0
+        if due.any():
+            warn = due & (self.train_phase == _SLEEP)
+            go = due & (self.train_phase == _WARNING)
+            self.train_phase[warn] = _WARNING
+            self.train_timer[warn] = settings.TRAIN_WARNING_TIME
+            self.train_phase[go] = _ACTIVE
+            self.train_timer[go] = np.inf
+
+    def _near_rows(self):
+        """Slots and lane centers of the lanes the player can touch this step (its row and both neighbours)."""
+        zz = self.gz[:, None] + np.array([-1, 0, 1])
+        valid = (zz >= self.base[:, None]) & (zz >= 0)
+        return zz % self.slots, zz * self.ts, valid
+
+    def _hit_vehicles(self, px0: np.ndarray, pz0: np.ndarray) -> np.ndarray:
+        slot, lane_z, valid = self._near_rows()
+        e = self._env[:, None]
+        on = self.veh_on[e, slot] & valid[:, :, None]
+        hit = _swept_overlap(
+            px0[:, None, None], pz0[:, None, None], self.px[:, None, None], self.pz[:, None, None],
+            self.ts * 0.35,
+            self.veh_prev[e, slot], lane_z[:, :, None], self.veh_x[e, slot], self.ts * 0.6, self.ts * 0.4,
+        )
+        return (on & hit).any(axis=(1, 2))
+
+    def _hit_trains(self, px0: np.ndarray, pz0: np.ndarray) -> np.ndarray:
+        slot, lane_z, valid = self._near_rows()
+        e = self._env[:, None]
+        on = (self.train_phase[e, slot] == _ACTIVE) & (self.kind[e, slot] == KIND_TRAIN) & valid
+        hit = _swept_overlap(
+            px0[:, None], pz0[:, None], self.px[:, None], self.pz[:, None],
+            self.ts * 0.35,
+            self.train_prev[e, slot], lane_z, self.train_x[e, slot], self.train_hl, self.ts * 0.4,
+        )
+        return (on & hit).any(axis=1)
+
+    def _advance_window(self):
+        """Cull lanes behind the player and load the ones coming into range (GameApp._cull_lanes)."""
+        base = np.maximum(self.base, self.gz - self.behind)
+        grown = base - self.base
+        while grown.any():
+            envs = np.flatnonzero(grown > 0)
+            self._load(envs, self.base[envs] + self.slots)
+            self.base[envs] += 1
+            grown[envs] -= 1
+
+    # -- Observation --------------------------------------------------------------------------
+
+    def _observe(self) -> np.ndarray:
+        ts = self.ts
+        e = self._env[:, None]
+        zz = self.gz[:, None] + self._rows
+        valid = (zz >= self.base[:, None]) & (zz >= 0)
+        slot = zz % self.slots
+        kind = np.where(valid, self.kind[e, slot], -1)
+        obs = self.obs
+        for c, k in enumerate((KIND_GRASS, KIND_ROAD, KIND_RIVER, KIND_TRAIN)):
+            obs[:, c] = (kind == k)[:, :, None]
+        cols = self._cols
+        obs[:, 4] = (kind == KIND_GRASS)[:, :, None] & ((self.blocked[e, slot][:, :, None] >> cols) & 1 == 1)
+
+        # Occupied: boat or train bodies on a tile (RoadLane.update_traffic), log-covered tile centers on water
+        cx = cols * ts
+        vx = self.veh_x[e, slot][..., None]
+        hw = ts * 0.6
+        first = np.floor((vx - hw) / ts + 0.5)
+        last = np.ceil((vx + hw) / ts - 0.5)
+        boats = (self.veh_on[e, slot][..., None] & (first <= cols) & (cols <= last)).any(axis=2)
+        lx = self.log_x[e, slot][..., None]
+        lhl = self.log_hl[e, slot][..., None]
+        logs = (self.log_on[e, slot][..., None] & (lx - lhl <= cx) & (cx <= lx + lhl)).any(axis=2)
+        phase = self.train_phase[e, slot]
+        tx = self.train_x[e, slot][..., None]
+        first = np.floor((tx - self.train_hl) / ts + 0.5)
+        last = np.ceil((tx + self.train_hl) / ts - 0.5)
+        train = ((phase == _ACTIVE)[..., None]) & (first <= cols) & (cols <= last)
+        obs[:, 5] = np.where(
+            (kind == KIND_ROAD)[..., None], boats,
+            np.where((kind == KIND_RIVER)[..., None], logs, (kind == KIND_TRAIN)[..., None] & train),
+        )
+
+        # Signed velocity in tiles/s: lane traffic, or a train on its warning or pass
+        velocity = self.direction[e, slot] * self.speed[e, slot]
+        velocity = np.where(kind == KIND_TRAIN, self.direction[e, slot] * settings.TRAIN_SPEED * (phase != _SLEEP), velocity)
+        obs[:, 6] = np.where(valid & (kind != KIND_GRASS), velocity / ts, 0.0)[:, :, None]
+        obs[:, 7] = ((kind == KIND_TRAIN) & (phase == _WARNING))[:, :, None]
+        obs[:, 8] = 0.0
+        obs[self._env, 8, self._obs_player_row, self.gx] = 1.0
+        return obs
+
+
+def _swept_overlap(ax0, az0, ax1, az1, a_h, bx0, bz, bx1, b_hw, b_hd):
+    """utils.math3d.swept_aabb_overlap over arrays: square player box (half a_h) against boxes
+    moving along X at fixed z."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        enter = np.zeros(np.broadcast(ax0, bx0).shape)
+        leave = np.ones_like(enter)
+        for p, d, h in (
+            (ax0 - bx0, (ax1 - ax0) - (bx1 - bx0), a_h + b_hw),
+            (az0 - bz, az1 - az0, a_h + b_hd),
+        ):
+            t0 = (-h - p) / d
+            t1 = (h - p) / d
+            # Not moving on this axis: overlapping all tick, or never
+            still = d == 0.0
+            inside = np.abs(p) <= h
+            enter = np.maximum(enter, np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(t0, t1)))
+            leave = np.minimum(leave, np.where(still, np.inf, np.maximum(t0, t1)))
+    return enter <= leave
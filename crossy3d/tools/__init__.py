@@ -0,0 +1 @@
+"""Offline tools: benchmarks and batch checkers. Run each module as a script from the project root."""
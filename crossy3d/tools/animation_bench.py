@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Animation benchmark: time per frame of N hopping objects (position, arc and stretch, as the player
+hops) with the easing functions evaluated per object, against one Animator update (a Python loop
+over the moving channels below ANIM_BATCH_MIN of them, one NumPy pass from there).
+Run from project root: python crossy3d/tools/animation_bench.py [--counts 1,16,...] [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+import settings
+from utils.animation import Animator, CURVE_IN_OUT_QUAD, CURVE_ARC, CURVE_BUMP
+from utils.easing import ease_in_out_quad, hop_height, squash_stretch
+
+DT = 1.0 / 60.0
+
+
+def _per_object(count: int, frames: int) -> float:
+    """The old Player.update loop, once per object: mean us/frame."""
+    d = settings.PLAYER_HOP_DURATION
+    objs = [[i * 0.01, 0.0, 0.0, 0.0, 0.0] for i in range(count)]  # hop t, x, z, y, scale
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        for o in objs:
+            t = o[0] = (o[0] + DT / d) % 1.0
+            e = ease_in_out_quad(t)
+            o[1] = 0.0 + (1.0 - 0.0) * e
+            o[2] = 0.0 + (1.0 - 0.0) * e
+            o[3] = hop_height(t, settings.PLAYER_HOP_HEIGHT)
+            o[4] = squash_stretch(t, settings.PLAYER_SQUASH_SCALE)
+    return (time.perf_counter() - t0) / frames * 1e6
+
+
+def _batched(count: int, frames: int) -> float:
+    """Same hops as Animator channels (re-armed as they land): mean us/frame."""
+    d = settings.PLAYER_HOP_DURATION
+    anim = Animator(capacity=4 * count)
+    channels = [tuple(anim.channel() for _ in range(4)) for _ in range(count)]
+
+    def hop(ch):
+        anim.tween(ch[0], 0.0, 1.0, d, CURVE_IN_OUT_QUAD)
+        anim.tween(ch[1], 0.0, 1.0, d, CURVE_IN_OUT_QUAD)
+        anim.tween(ch[2], 0.0, settings.PLAYER_HOP_HEIGHT, d, CURVE_ARC)
+        anim.tween(ch[3], 1.0, 1.0 + (1.0 - settings.PLAYER_SQUASH_SCALE) * 0.2, d, CURVE_BUMP)
+
+    for ch in channels:
+        hop(ch)
+    # Hops are staggered in the per-object loop; here they land together every `d`, re-armed
+    # outside the timed section like the game's input handler would
+    total = 0.0
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        anim.update(DT)
+        total += time.perf_counter() - t0
+        if not anim.playing(channels[0][0]):
+            for ch in channels:
+                hop(ch)
+    return total / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", default="1,16,64,256,1024,4096", help="comma-separated object counts")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    print(f"{'objects':>8} {'per-object us/frame':>20} {'batched us/frame':>17}")
+    for count in (int(c) for c in args.counts.split(",")):
+        print(f"{count:>8} {_per_object(count, args.frames):>20.1f} {_batched(count, args.frames):>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Collision benchmark: time per frame of each collision backend (game/collision.py) against the
+number of hazards in the world.
+Run from project root: python crossy3d/tools/collision_bench.py [--counts 16,64,...] [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from panda3d.core import NodePath
+
+import settings
+from game.collision import BACKENDS
+from entities.player import Player
+from entities.vehicle import Vehicle
+from entities.log import Log
+
+
+class _Loader:
+    """make_box ignores the loader; the entities only need `base.loader` to exist."""
+
+    loader = None
+
+
+def _build(backend_cls, count: int):
+    """World with `count` hazards, half vehicles and half logs, two per lane."""
+    ts = settings.TILE_SIZE
+    root = NodePath("world")
+    backend = backend_cls(root)
+    player = Player(_Loader(), root)
+    backend.attach(player)
+    vehicles, logs = [], []
+    for i in range(count):
+        lane_z = (i // 2) * ts
+        x = (i % 2) * settings.LANE_WIDTH * ts / 2
+        direction = 1 if (i // 2) % 2 else -1
+        if i % 4 < 2:
+            e = Vehicle(_Loader(), root, lane_z, int(x / ts), direction, 2.0)
+            vehicles.append(e)
+        else:
+            e = Log(_Loader(), root, lane_z, x, 2, direction, 1.5)
+            logs.append(e)
+        backend.attach(e)
+    return root, backend, player, vehicles, logs
+
+
+def _time_backend(backend_cls, count: int, frames: int) -> float:
+    """Mean microseconds per frame of backend.update() (hazards move in between, untimed)."""
+    root, backend, player, vehicles, logs = _build(backend_cls, count)
+    dt = 1.0 / 60.0
+    prev = player.get_world_pos()
+    total = 0.0
+    for _ in range(frames):
+        for v in vehicles:
+            v.update(dt)
+        for log in logs:
+            log.update(dt)
+        t0 = time.perf_counter()
+        backend.update(player, prev, vehicles, [], None)
+        total += time.perf_counter() - t0
+    root.removeNode()
+    return total / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", default="16,64,256,1024,4096", help="comma-separated hazard counts")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    names = list(BACKENDS)
+    print(f"{'hazards':>8} " + " ".join(f"{name + ' us/frame':>18}" for name in names))
+    for count in (int(c) for c in args.counts.split(",")):
+        row = [_time_backend(BACKENDS[name], count, args.frames) for name in names]
+        print(f"{count:>8} " + " ".join(f"{us:>18.1f}" for us in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Batch fairness checker: generate lanes for many seeds and parameter sets and verify, independently
+of the generator's own repair pass, that every lane is reachable from the spawn.
+Run from project root: python crossy3d/tools/fairness_check.py [--seeds N] [--lanes N] [--workers N]
+Exits 1 if any seed produced an unreachable lane.
+"""
+
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+import settings
+from world.world_gen import WorldGenerator
+from world.reachability import spawn_mask, step
+
+
+# Settings overrides per parameter set; difficulty is swept through the score
+PARAM_SETS = {
+    "default": {},
+    "dense_blockers": {"GRASS_BLOCKER_CHANCE": 0.5, "GRASS_BLOCKER_CLUSTER": 0.8},
+    "wall_of_grass": {"GRASS_BLOCKER_CHANCE": 0.9, "GRASS_BLOCKER_CLUSTER": 1.0},
+    "wide_lanes": {"LANE_WIDTH": 11, "GRASS_BLOCKER_CHANCE": 0.35},
+    "narrow_lanes": {"LANE_WIDTH": 3, "GRASS_BLOCKER_CHANCE": 0.4},
+}
+
+
+def check_seed(job) -> dict:
+    """Generate `lanes` lanes for one (param set, seed) and verify them lane by lane.
+    The set's settings are restored afterwards: pool workers run many jobs in one process."""
+    name, seed, lanes, max_score = job
+    saved = {key: getattr(settings, key) for key in PARAM_SETS[name]}
+    for key, value in PARAM_SETS[name].items():
+        setattr(settings, key, value)
+    try:
+        width = settings.LANE_WIDTH
+        gen = WorldGenerator(seed)
+        reach = spawn_mask(width)
+        failure = -1
+        for z in range(lanes):
+            gen.set_score(min(max_score, max(0, z - settings.LANES_AHEAD)))
+            reach = step(reach, gen.next_lane(z), width)
+            if reach == 0 and failure < 0:
+                failure = z
+                reach = spawn_mask(width)  # keep counting after the first failure
+    finally:
+        for key, value in saved.items():
+            setattr(settings, key, value)
+    return {"params": name, "seed": seed, "lanes": lanes, "repairs": gen.repairs, "first_failure": failure}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=64, help="seeds per parameter set")
+    parser.add_argument("--lanes", type=int, default=20000, help="lanes per seed")
+    parser.add_argument("--max-score", type=int, default=60, help="difficulty ramps with z up to this score")
+    parser.add_argument("--params", nargs="*", default=sorted(PARAM_SETS), choices=sorted(PARAM_SETS))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    jobs = [(name, seed, args.lanes, args.max_score) for name in args.params for seed in range(args.seeds)]
+    t0 = time.perf_counter()
+    if args.workers > 1:
+        with Pool(args.workers) as pool:
+            results = pool.map(check_seed, jobs, chunksize=1)
+    else:
+        results = [check_seed(job) for job in jobs]
+    elapsed = time.perf_counter() - t0
+
+    failed = [r for r in results if r["first_failure"] >= 0]
+    total = sum(r["lanes"] for r in results)
+    for name in args.params:
+        rows = [r for r in results if r["params"] == name]
+        lanes = sum(r["lanes"] for r in rows)
+        repairs = sum(r["repairs"] for r in rows)
+        bad = sum(1 for r in rows if r["first_failure"] >= 0)
+        print(f"{name:<16} seeds={len(rows):<5} lanes={lanes:<10} repairs={repairs:<8} unreachable seeds={bad}")
+    print(f"{total} lanes in {elapsed:.2f}s ({total / elapsed * 60 / 1e6:.2f}M lanes/min, {args.workers} workers)")
+    for r in failed[:20]:
+        print(f"  FAIL params={r['params']} seed={r['seed']} first unreachable lane z={r['first_failure']}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Game benchmark: scripted scenarios through the real GameApp in an offscreen buffer, reported as JSON.
+Each scenario runs on a fixed seed and a fixed 60 fps game clock (wall time is measured separately),
+with the player made invulnerable so every run does the same work. Reported per scenario: frame time
+percentiles (whole engine step and the update task), mean cost of each update phase, node and geom
+counts under render, and Python memory. With --baseline, exits 1 if a gated metric regressed by more
+than --threshold.
+Run from project root: python crossy3d/tools/game_bench.py [--scenarios idle,forward,...] [--out run.json]
+    [--baseline baseline.json] [--threshold 0.2] [--seed N] [--frames N] [--marathon-lanes N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from panda3d.core import ClockObject, PandaSystem, loadPrcFileData
+
+import settings
+from game.game_app import GameApp
+from game.input import DIRECTIONS, KEY_TO_DIR
+from game.state import GameState
+
+try:
+    import resource
+except ImportError:  # not on Windows; peak RSS is then left out
+    resource = None
+
+FPS = 60
+WARMUP_FRAMES = 30  # left out of the statistics: the first lanes stream in over these
+
+# name -> settings overrides, starting score (difficulty), input policy, frames (None: --frames)
+SCENARIOS = {
+    "idle": ({}, 0, None, None),
+    "forward": ({}, 0, "forward", None),
+    "river_heavy": ({"RIVER_LANE_CHANCE": 0.9, "ROAD_LANE_CHANCE": 0.05, "TRAIN_LANE_CHANCE": 0.0}, 0, "forward", None),
+    "road_heavy": ({"ROAD_LANE_CHANCE": 0.9, "RIVER_LANE_CHANCE": 0.05, "TRAIN_LANE_CHANCE": 0.05}, 0, "forward", None),
+    # WorldGenerator's difficulty factor tops out at 1.5, i.e. a score of 45
+    "max_difficulty": ({}, 45, "forward", None),
+    "marathon": ({}, 0, "forward", "lanes"),
+}
+
+# Metrics compared against the baseline: scenario -> these keys, worse when larger
+GATED = (
+    ("step_ms", "p50"), ("step_ms", "p99"),
+    ("update_ms", "p50"), ("update_ms", "p99"),
+    ("nodes", "max"), ("geoms", "max"), ("py_objects", "max"),
+)
+
+# Update phases: label -> GameApp methods timed under it (the rest of the update task is "other")
+PHASES = {
+    "lanes": ("_ensure_lanes", "_cull_lanes"),
+    "input": ("_process_input",),
+    "hazards": ("_update_entities",),
+    "rules": ("_check_river_and_logs", "_check_collisions", "_update_score"),
+    "camera": ("_update_camera",),
+}
+
+
+class _Phases:
+    """Wraps GameApp methods (as instance attributes) to add their wall time to a per-frame total."""
+
+    def __init__(self, app):
+        self.frame = dict.fromkeys(list(PHASES) + ["animation", "hud"], 0.0)
+        for label, names in PHASES.items():
+            for name in names:
+                setattr(app, name, self._timed(label, getattr(app, name)))
+        app.animator.update = self._timed("animation", app.animator.update)
+        app.ui.update_hud = self._timed("hud", app.ui.update_hud)
+
+    def _timed(self, label, fn):
+        frame = self.frame
+
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                frame[label] += time.perf_counter() - t0
+        return timed
+
+    def reset(self):
+        for label in self.frame:
+            self.frame[label] = 0.0
+
+
+_STEPS = tuple((key, *DIRECTIONS[KEY_TO_DIR[key]]) for key in "wads")  # (key, dx, dz), forward first
+
+
+def _forward_policy(app):
+    """Take the next hop of a shortest route, around grass blockers, to the furthest built lane.
+    Water with no log under the target is refused by the game; the policy then waits for one."""
+    player = app.player
+    if player.is_hopping() or app.input_mgr or not app.lanes:
+        return
+    width = settings.LANE_WIDTH
+    lanes = {z: lane for z, lane, _, _ in app.lanes}
+    goal = app.lanes[-1][0]
+    start = (player.grid_x, player.grid_z)
+    first = {start: None}  # cell -> key of the first hop that reaches it
+    frontier = [start]
+    while frontier:
+        nxt = []
+        for x, z in frontier:
+            if z == goal:
+                if first[(x, z)]:
+                    app._on_key(first[(x, z)])
+                return
+            for key, dx, dz in _STEPS:
+                cell = (x + dx, z + dz)
+                lane = lanes.get(cell[1])
+                if cell in first or lane is None or not 0 <= cell[0] < width or lane.is_blocked(cell[0]):
+                    continue
+                first[cell] = first[(x, z)] or key
+                nxt.append(cell)
+        frontier = nxt
+
+
+def _percentiles(samples: list) -> dict:
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    s = sorted(samples)
+    n = len(s)
+
+    def rank(q):
+        return s[min(n - 1, int(n * q))]
+    return {"mean": sum(s) / n, "p50": rank(0.5), "p90": rank(0.9), "p99": rank(0.99), "max": s[-1]}
+
+
+def _scene_counts(app) -> tuple:
+    """(nodes under render, geoms in its GeomNodes)."""
+    geom_nodes = app.render.findAllMatches("**/+GeomNode")
+    geoms = sum(geom_nodes.getPath(i).node().getNumGeoms() for i in range(geom_nodes.getNumPaths()))
+    return app.render.countNumDescendants(), geoms
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024  # bytes on macOS, KiB elsewhere
+
+
+def _run_scenario(app, phases: _Phases, name: str, seed: int, frames: int, marathon_lanes: int) -> dict:
+    overrides, score, policy, length = SCENARIOS[name]
+    saved = {key: getattr(settings, key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+    settings.WORLD_SEED = seed
+    random.seed(seed)
+    try:
+        app.state = GameState.GAME_OVER
+        app._on_restart()  # fresh world from WORLD_SEED and the overrides
+        app.score = score
+        app.world_gen.set_score(score)
+
+        step_ms, update_ms = [], []
+        phase_totals = dict.fromkeys(phases.frame, 0.0)
+        samples = {"nodes": [], "geoms": [], "py_objects": [], "py_blocks": []}
+        limit = marathon_lanes * FPS if length == "lanes" else frames + WARMUP_FRAMES
+        frame = 0
+        while frame < limit:
+            if length == "lanes" and app.player.grid_z >= marathon_lanes:
+                break
+            if policy == "forward":
+                _forward_policy(app)
+            phases.reset()
+            app._bench_update_s = 0.0
+            t0 = time.perf_counter()
+            app.taskMgr.step()
+            elapsed = time.perf_counter() - t0
+            frame += 1
+            if frame <= WARMUP_FRAMES:
+                continue
+            step_ms.append(elapsed * 1000.0)
+            update_ms.append(app._bench_update_s * 1000.0)
+            for label, seconds in phases.frame.items():
+                phase_totals[label] += seconds
+            if frame % FPS == 0:  # once per game second, outside the timed step
+                nodes, geoms = _scene_counts(app)
+                samples["nodes"].append(nodes)
+                samples["geoms"].append(geoms)
+                samples["py_objects"].append(len(gc.get_objects()))
+                samples["py_blocks"].append(sys.getallocatedblocks())
+    finally:
+        for key, value in saved.items():
+            setattr(settings, key, value)
+
+    n = max(1, len(step_ms))
+    phase_ms = {label: total * 1000.0 / n for label, total in phase_totals.items()}
+    update = _percentiles(update_ms)
+    phase_ms["other"] = max(0.0, update["mean"] - sum(phase_ms.values()))
+    result = {
+        "frames": len(step_ms),
+        "lanes_reached": app.player.grid_z,
+        "step_ms": _percentiles(step_ms),
+        "update_ms": update,
+        "phase_ms": phase_ms,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    for key, values in samples.items():
+        result[key] = {"final": values[-1] if values else 0, "max": max(values, default=0)}
+    return result
+
+
+def _make_app():
+    loadPrcFileData("", "window-type offscreen\naudio-library-name null\nsync-video false")
+    settings.HITCH_DETECTOR = False  # restarts between timed steps would be logged as hitches
+    app = GameApp()
+    app.best_score = sys.maxsize  # never overwrite the player's best_score.json
+    app._die = lambda reason: None  # invulnerable: every run covers the scripted distance
+    clock = ClockObject.getGlobalClock()
+    clock.setMode(ClockObject.MNonRealTime)
+    clock.setFrameRate(FPS)
+    # Time the update task on its own, inside the engine step
+    update_task = app._update_task
+
+    def timed_update(task):
+        t0 = time.perf_counter()
+        result = update_task(task)
+        app._bench_update_s = time.perf_counter() - t0
+        return result
+    app.taskMgr.remove("update")
+    app.taskMgr.add(timed_update, "update")
+    app._on_enter()
+    return app
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """(scenario, metric, baseline, current) for every gated metric more than threshold above baseline."""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for metric, stat in GATED:
+            old = base.get(metric, {}).get(stat)
+            new = current.get(metric, {}).get(stat)
+            if old and new is not None and new > old * (1.0 + threshold):
+                regressions.append((name, f"{metric}.{stat}", old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated, from: " + ", ".join(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--frames", type=int, default=1800, help="measured frames per scenario (marathon: until --marathon-lanes)")
+    parser.add_argument("--marathon-lanes", type=int, default=5000)
+    parser.add_argument("--out", metavar="PATH", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="report to compare against; exit 1 on a regression")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative increase of a gated metric")
+    args = parser.parse_args()
+
+    names = [n for n in args.scenarios.split(",") if n]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    app = _make_app()
+    phases = _Phases(app)
+    results = {
+        "seed": args.seed,
+        "fps": FPS,
+        "python": platform.python_version(),
+        "panda3d": PandaSystem.getVersionString(),
+        "collision": settings.COLLISION_BACKEND,
+        "hazard_motion": settings.HAZARD_MOTION,
+        "scenarios": {},
+    }
+    for name in names:
+        t0 = time.perf_counter()
+        results["scenarios"][name] = _run_scenario(app, phases, name, args.seed, args.frames, args.marathon_lanes)
+        print(f"{name}: {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+    report = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old:.3f} -> {new:.3f} (+{(new / old - 1) * 100:.0f}%)", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regression above {args.threshold:.0%} against {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
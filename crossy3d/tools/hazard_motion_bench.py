@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Hazard motion benchmark: time per frame of moving hazards from Python (setX every frame) against
+Panda3D intervals (game/hazard_motion.py), by hazard count. Both include the gameplay side the
+game does per frame: collision against the vehicles and the log index of river lanes.
+Run from project root: python crossy3d/tools/hazard_motion_bench.py [--counts 16,64,...] [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from direct.interval.IntervalGlobal import ivalMgr
+from panda3d.core import ClockObject, NodePath
+
+import settings
+from game.collision import PythonCollision
+from game.hazard_motion import HazardIntervals
+from entities.player import Player
+from entities.vehicle import Vehicle
+from entities.log import Log
+from entities.traffic import TrafficRing
+from world.lane import RoadLane, RiverLane
+
+FPS = 60
+
+
+class _Loader:
+    """make_box ignores the loader; the entities only need `base.loader` to exist."""
+
+    loader = None
+
+
+def _build(count: int):
+    """`count` hazards, alternating road lanes of two vehicles and river lanes of two logs."""
+    ts = settings.TILE_SIZE
+    root = NodePath("world")
+    lanes = []
+    for z in range((count + 1) // 2):
+        direction = 1 if z % 2 else -1
+        if z % 2 == 0:
+            lane = RoadLane(z, direction, 3.0, seed=z, vehicle_xs=(0, 3))
+            entities = [Vehicle(_Loader(), root, z * ts, gx, direction, lane.speed) for gx in lane.vehicle_xs]
+            lane.traffic = TrafficRing(entities, direction, lane.seed)
+        else:
+            lane = RiverLane(z, direction, 2.0, log_layout=((1, 2), (4, 2)))
+            entities = [Log(_Loader(), root, z * ts, cx * ts, n, direction, lane.speed) for cx, n in lane.log_layout]
+            lane.set_logs(entities)
+        lanes.append((lane, entities))
+    player = Player(_Loader(), root)
+    player.reset(settings.LANE_WIDTH // 2, len(lanes) // 2)
+    return root, lanes, player
+
+
+def _python_frame(lanes, player, collision, vehicles, dt):
+    for lane, _ in lanes:
+        if isinstance(lane, RoadLane):
+            lane.update_traffic(dt)
+        else:
+            lane.update_logs(dt)
+    collision.update(player, player.get_world_pos(), vehicles, [], None)
+
+
+def _intervals_frame(lanes, player, collision, motion, clock):
+    motion.tick(clock.getFrameTime())
+    near = []
+    for lane, entities in lanes[max(0, player.grid_z - 1):player.grid_z + 2]:
+        motion.sync_lane(lane, entities)
+        if isinstance(lane, RoadLane):
+            near.extend(entities)
+    collision.update(player, player.get_world_pos(), near, [], None)
+
+
+def _time_mode(mode: str, count: int, frames: int) -> tuple:
+    """(mean us/frame in total, of which in the interval manager's step)."""
+    clock = ClockObject.getGlobalClock()
+    root, lanes, player = _build(count)
+    collision = PythonCollision(root)
+    vehicles = [e for _, entities in lanes for e in entities if isinstance(e, Vehicle)]
+    motion = None
+    if mode == "intervals":
+        motion = HazardIntervals()
+        for lane, entities in lanes:
+            motion.start_lane(lane, entities)
+    total = engine = 0.0
+    for _ in range(frames):
+        clock.tick()
+        t0 = time.perf_counter()
+        if motion is None:
+            _python_frame(lanes, player, collision, vehicles, 1.0 / FPS)
+        else:
+            ivalMgr.step()
+            t1 = time.perf_counter()
+            engine += t1 - t0
+            _intervals_frame(lanes, player, collision, motion, clock)
+        total += time.perf_counter() - t0
+    if motion is not None:
+        motion.clear()
+    root.removeNode()
+    return total / frames * 1e6, engine / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", default="16,64,256,1024,4096", help="comma-separated hazard counts")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    clock = ClockObject.getGlobalClock()
+    clock.setMode(ClockObject.MNonRealTime)
+    clock.setFrameRate(FPS)
+    print(f"{'hazards':>8} {'python us/frame':>16} {'intervals us/frame':>19} {'(engine step)':>14}")
+    for count in (int(c) for c in args.counts.split(",")):
+        python_us, _ = _time_mode("python", count, args.frames)
+        intervals_us, engine_us = _time_mode("intervals", count, args.frames)
+        print(f"{count:>8} {python_us:>16.1f} {intervals_us:>19.1f} {engine_us:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Lane generation benchmark: lanes/sec of the scalar WorldGenerator.next_lane path against the
+vectorized WorldGenerator.next_batch path, both producing full lane content.
+Run from project root: python crossy3d/tools/lane_gen_bench.py [--lanes N] [--batch K] [--score N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from world.world_gen import WorldGenerator
+
+
+def bench_scalar(lanes: int, seed: int, score: int) -> float:
+    gen = WorldGenerator(seed)
+    gen.set_score(score)
+    t0 = time.perf_counter()
+    for z in range(lanes):
+        gen.next_lane(z)
+    return time.perf_counter() - t0
+
+
+def bench_batch(lanes: int, batch: int, seed: int, score: int) -> float:
+    WorldGenerator(seed).next_batch(0, 1)  # import NumPy outside the timed loop
+    gen = WorldGenerator(seed)
+    gen.set_score(score)
+    t0 = time.perf_counter()
+    for z in range(0, lanes, batch):
+        gen.next_batch(z, min(batch, lanes - z))
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lanes", type=int, default=200000)
+    parser.add_argument("--batch", type=int, default=16384, help="lanes per next_batch call")
+    parser.add_argument("--score", type=int, default=30, help="difficulty for both paths")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    scalar = bench_scalar(args.lanes, args.seed, args.score)
+    batch = bench_batch(args.lanes, args.batch, args.seed, args.score)
+    print(f"scalar  {args.lanes / scalar:>12,.0f} lanes/s  ({scalar:.3f}s)")
+    print(f"batch   {args.lanes / batch:>12,.0f} lanes/s  ({batch:.3f}s, K={args.batch})")
+    print(f"speedup {scalar / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Course builder: generate a fixed course with WorldGenerator and write it as a course file.
+Lanes come in the lane stream's aligned LANE_WORKER_BATCH batches, so a course holds exactly the
+lanes a stream of the same seed serves (difficulty ramping with the lane index the same way).
+Run from project root: python crossy3d/tools/make_course.py OUT [--seed N | --daily] [--lanes N]
+Play it with: python crossy3d/main.py --course OUT
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+import numpy as np
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+import settings
+from world.course import Course, write_course
+from world.lane_batch import LANE_DTYPE
+from world.lane_stream import stream_batch
+from world.world_gen import WorldGenerator
+from world.reachability import first_unreachable
+
+
+def build(seed: int, lanes: int, batch: int = settings.LANE_WORKER_BATCH) -> np.ndarray:
+    """Records of lanes 0..lanes-1; whole batches are generated (as the stream does), then cut."""
+    gen = WorldGenerator(seed)
+    parts = [stream_batch(gen, z, batch) for z in range(0, lanes, batch)]
+    return np.concatenate(parts)[:lanes] if parts else np.zeros(0, dtype=LANE_DTYPE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out", help="course file to write")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--seed", type=int, default=0)
+    group.add_argument("--daily", action="store_true", help="seed from today's date (YYYYMMDD)")
+    parser.add_argument("--lanes", type=int, default=2000)
+    args = parser.parse_args()
+
+    seed = int(datetime.date.today().strftime("%Y%m%d")) if args.daily else args.seed
+    write_course(args.out, build(seed, args.lanes), seed)
+    course = Course(args.out)
+    bad = first_unreachable((course.lane(z) for z in range(len(course))), course.width)
+    print(f"{args.out}: {len(course)} lanes, seed {seed}, {os.path.getsize(args.out)} bytes")
+    course.close()
+    if bad >= 0:
+        print(f"  lane {bad} is unreachable")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
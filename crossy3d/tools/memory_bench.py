@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: bytes per lane and per hazard for the slotted simulation objects, against a
+dict-backed object holding the same fields plus the old base/parent references (the layout
+before __slots__).
+Run from project root: python crossy3d/tools/memory_bench.py [--lanes N] [--hazards N]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from panda3d.core import NodePath
+
+from world.world_gen import WorldGenerator
+from entities.vehicle import Vehicle
+from entities.log import Log
+from entities.train import Train
+
+
+class _DictState:
+    """Plain object: attributes live in a per-instance __dict__."""
+
+
+class _Loader:
+    """make_box ignores the loader; the entities only need `base.loader` to exist."""
+
+    loader = None
+
+
+def _slot_names(cls) -> list:
+    names = []
+    for klass in cls.__mro__:
+        names.extend(getattr(klass, "__slots__", ()))
+    return names
+
+
+def _as_dict_state(obj, extra: dict) -> _DictState:
+    state = _DictState()
+    for name in _slot_names(type(obj)):
+        if hasattr(obj, name):
+            setattr(state, name, getattr(obj, name))
+    state.__dict__.update(extra)
+    return state
+
+
+def _traced_bytes(build) -> tuple:
+    """(result, bytes allocated while building and still alive)."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, total
+
+
+def _report(name: str, objs: list, extra: dict):
+    n = len(objs)
+    if n == 0:
+        return
+    slotted = sum(sys.getsizeof(o) for o in objs) / n
+    _, dict_bytes = _traced_bytes(lambda: [_as_dict_state(o, extra) for o in objs])
+    print(f"  {name:<10} n={n:<7} slots: {slotted:7.1f} B/obj   dict (before): {dict_bytes / n:7.1f} B/obj")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lanes", type=int, default=20000)
+    parser.add_argument("--hazards", type=int, default=2000)
+    args = parser.parse_args()
+
+    gen = WorldGenerator(seed=1)
+    lanes, lane_bytes = _traced_bytes(lambda: [gen.next_lane(z) for z in range(args.lanes)])
+    print(f"Lanes: {args.lanes} generated, {lane_bytes / args.lanes:.1f} B/lane traced (slots)")
+    by_type = {}
+    for lane in lanes:
+        by_type.setdefault(type(lane).__name__, []).append(lane)
+    for name, objs in sorted(by_type.items()):
+        _report(name, objs, {})
+
+    base = _Loader()
+    root = NodePath("bench")
+    n = args.hazards
+    print(f"Hazards: {n} of each (Python-side state only; geometry lives in Panda3D)")
+    vehicles = [Vehicle(base, root, 0.0, i % 5, 1, 3.0) for i in range(n)]
+    logs = [Log(base, root, 1.0, 2.0, 3, 1, 2.0) for _ in range(n)]
+    trains = [Train(base, root, 2.0, 1, i) for i in range(max(1, n // 10))]
+    refs = {"base": base, "parent": root}
+    _report("Vehicle", vehicles, refs)
+    _report("Log", logs, refs)
+    _report("Train", trains, refs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks: per-call time of the game's hot functions, with warmup, repeated timed batches and
+a 95% confidence interval of the mean, appended to a JSON-lines history (one record per run, tagged
+with the git commit) so trends across commits can be compared or plotted.
+Covers make_box, every world.obstacles creator, GameApp._build_lane_visual per lane type,
+WorldGenerator.next_lane, the collision pass + _check_collisions and _is_tile_on_log by entity count,
+Vehicle.update / Log.update and UIManager.update_hud. GameApp runs in an offscreen buffer.
+Run from project root: python crossy3d/tools/micro_bench.py [--filter SUBSTR] [--repeats N]
+    [--history PATH | --no-history] [--trend NAME]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from panda3d.core import Vec4, loadPrcFileData
+
+import settings
+from world import obstacles
+from world.lane import RiverLane
+from world.tiles import make_box
+from world.world_gen import WorldGenerator
+from entities.vehicle import Vehicle
+from entities.log import Log
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(_root), "micro_bench_history.jsonl")
+COUNTS = (16, 64, 256, 1024)
+OBSTACLES = (
+    "create_tree", "create_rock", "create_coral", "create_palm_tree", "create_shell", "create_jellyfish",
+    "create_krusty_krab", "create_pineapple_house", "create_squidward_house",
+)
+# Two-sided 95% Student t quantiles by degrees of freedom (1..30); the normal 1.96 beyond
+_T95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+def measure(fn, repeats: int, warmup: int, min_time: float, teardown=None) -> dict:
+    """Per-call microseconds of fn(): calls per batch sized so a batch takes at least min_time,
+    `warmup` untimed batches, then `repeats` timed ones. teardown() runs untimed after every batch."""
+    number = 1
+    while True:  # calibrate (these batches double as extra warmup)
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if teardown:
+            teardown()
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    samples = []
+    for i in range(warmup + repeats):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if teardown:
+            teardown()
+        if i >= warmup:
+            samples.append(elapsed / number * 1e6)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    df = len(samples) - 1
+    t = _T95[df - 1] if 0 < df <= len(_T95) else 1.96
+    return {
+        "mean_us": mean,
+        "ci95_us": t * stdev / len(samples) ** 0.5,
+        "stdev_us": stdev,
+        "min_us": min(samples),
+        "repeats": len(samples),
+        "number": number,
+    }
+
+
+class _Scratch:
+    """Parent node for geometry a benchmark creates; emptied between batches."""
+
+    def __init__(self, parent):
+        self.node = parent.attachNewNode("bench")
+
+    def clear(self):
+        self.node.getChildren().detach()
+
+
+def _make_app():
+    loadPrcFileData("", "window-type offscreen\naudio-library-name null")
+    from game.game_app import GameApp
+    app = GameApp()
+    app.ui.show_hud(0, 0)
+    return app
+
+
+def _one_of_each_lane(seed: int = 1) -> dict:
+    """First generated lane of each type."""
+    gen = WorldGenerator(seed)
+    found = {}
+    z = 0
+    while len(found) < 4:
+        lane = gen.next_lane(z)
+        found.setdefault(type(lane), lane)
+        z += 1
+    return found
+
+
+def _cases(app):
+    """(name, fn, teardown) for every benchmark."""
+    scratch = _Scratch(app.render)
+    loader = app.loader
+    color = Vec4(0.5, 0.5, 0.5, 1)
+    yield "make_box", lambda: make_box(loader, 1.0, 1.0, 0.5, color), None
+    for name in OBSTACLES:
+        creator = getattr(obstacles, name)
+        yield f"obstacles.{name}", lambda c=creator: c(loader, scratch.node, 0.0, 0.0), scratch.clear
+
+    built = []
+
+    def clear_built():
+        for root, entities in built:
+            for e in entities:
+                e.remove()
+            root.removeNode()
+        built.clear()
+    for cls, lane in _one_of_each_lane().items():
+        yield (
+            f"_build_lane_visual[{cls.__name__}]",
+            lambda lane=lane: built.append(app._build_lane_visual(lane)),
+            clear_built,
+        )
+
+    gen = WorldGenerator(1)
+    z = [0]
+
+    def next_lane():
+        gen.next_lane(z[0])
+        z[0] += 1
+    yield "WorldGenerator.next_lane", next_lane, None
+
+    player = app.player
+    player.reset(settings.LANE_WIDTH // 2, 0)
+    prev = player.get_world_pos()
+    ts = settings.TILE_SIZE
+    for count in COUNTS:
+        # All on the player's row but past the lane's end: the full swept test runs for every one, no hit
+        vehicles = [Vehicle(app, scratch.node, 0.0, settings.LANE_WIDTH + 2 + i, 1, 3.0) for i in range(count)]
+
+        def collide(vehicles=vehicles):
+            app.collision.update(player, prev, vehicles, [], None)
+            app._check_collisions()
+        yield f"collision_pass+_check_collisions[{count}]", collide, None
+
+    for count in COUNTS:
+        lane = RiverLane(1, 1, 2.0, ())
+        logs = [Log(app, scratch.node, ts, (i % settings.LANE_WIDTH) * ts, 2, 1, 2.0) for i in range(count)]
+        lane.set_logs(logs)
+        entry = (1, lane, scratch.node, logs)
+
+        def on_log(entry=entry):
+            app.lanes = [entry]
+            app._is_tile_on_log(2, 1)
+        yield f"_is_tile_on_log[{count}]", on_log, None
+    app.lanes = []
+
+    vehicle = Vehicle(app, scratch.node, ts, 2, 1, 3.0)
+    log = Log(app, scratch.node, ts, 2.0 * ts, 3, 1, 2.0)
+    yield "Vehicle.update", lambda: vehicle.update(1.0 / 60.0), None
+    yield "Log.update", lambda: log.update(1.0 / 60.0), None
+
+    ui = app.ui
+    yield "UIManager.update_hud[unchanged]", lambda: ui.update_hud(1, 1, 60.0), None
+    score = [0]
+
+    def hud_new_score():
+        score[0] += 1
+        ui.update_hud(score[0], score[0], 60.0)
+    yield "UIManager.update_hud[new score]", hud_new_score, None
+
+
+def _git_commit():
+    """(short commit hash, dirty) of the working tree, or (None, None) outside git."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=_root, capture_output=True, text=True,
+        ).stdout.strip() != ""
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def _print_trend(path: str, name: str):
+    """One line per recorded run of benchmark `name`: when, commit, mean +- CI."""
+    with open(path) as f:
+        for line in f:
+            run = json.loads(line)
+            result = run["results"].get(name)
+            if result is not None:
+                dirty = "+" if run.get("dirty") else ""
+                print(f"{run['time']}  {run.get('commit') or '-'}{dirty:<2} {result['mean_us']:10.2f} +- {result['ci95_us']:.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="only benchmarks whose name contains this")
+    parser.add_argument("--repeats", type=int, default=20, help="timed batches per benchmark")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed batches before them")
+    parser.add_argument("--min-time", type=float, default=0.01, help="seconds per batch (sets calls per batch)")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON-lines file the run is appended to")
+    parser.add_argument("--no-history", action="store_true", help="print only, do not append")
+    parser.add_argument("--trend", metavar="NAME", help="print the recorded history of one benchmark and exit")
+    args = parser.parse_args()
+
+    if args.trend:
+        _print_trend(args.history, args.trend)
+        return
+
+    app = _make_app()
+    results = {}
+    print(f"{'benchmark':<44} {'mean us':>10} {'+- 95% CI':>10} {'calls':>8}")
+    for name, fn, teardown in _cases(app):
+        if args.filter not in name:
+            continue
+        r = results[name] = measure(fn, args.repeats, args.warmup, args.min_time, teardown)
+        print(f"{name:<44} {r['mean_us']:>10.2f} {r['ci95_us']:>10.2f} {r['number']:>8}")
+
+    if args.no_history:
+        return
+    commit, dirty = _git_commit()
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.history, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"Appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
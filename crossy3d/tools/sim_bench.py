@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Vectorized env benchmark: env-steps/sec of sim.VecEnv under a random policy, plus episode stats.
+Run from project root: python crossy3d/tools/sim_bench.py [--envs M] [--steps N] [--seed N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from sim import VecEnv, NOOP, UP, DOWN, LEFT, RIGHT
+from sim.vec_env import DEATH_VEHICLE, DEATH_TRAIN, DEATH_DROWN, DEATH_DOOM
+
+DEATH_NAMES = {DEATH_VEHICLE: "vehicle", DEATH_TRAIN: "train", DEATH_DROWN: "drown", DEATH_DOOM: "doom"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--envs", type=int, default=1024)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    env = VecEnv(args.envs, seed=args.seed)
+    env.reset()
+    rng = np.random.default_rng(args.seed)
+    # Forward-biased random policy so episodes get past the first lanes
+    actions = rng.choice([NOOP, UP, UP, UP, DOWN, LEFT, RIGHT], size=(args.steps, args.envs))
+    scores = []
+    deaths = {name: 0 for name in DEATH_NAMES.values()}
+    t0 = time.perf_counter()
+    for i in range(args.steps):
+        _, _, done, info = env.step(actions[i])
+        if done.any():
+            scores.extend(info["score"][done].tolist())
+            for reason in info["death"][done].tolist():
+                deaths[DEATH_NAMES[reason]] += 1
+    elapsed = time.perf_counter() - t0
+    total = args.steps * args.envs
+    print(f"{total} env-steps in {elapsed:.2f}s: {total / elapsed:,.0f} env-steps/s ({args.envs} envs)")
+    if scores:
+        print(f"{len(scores)} episodes, mean score {np.mean(scores):.2f}, best {max(scores)}, deaths {deaths}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,3 @@
 from .easing import ease_in_out_quad, hop_height, squash_stretch
-from .math3d import grid_to_world, world_to_grid, clamp
+from .math3d import grid_to_world, world_to_grid, clamp, swept_aabb_overlap
+from .animation import Animator
@@ -0,0 +1,205 @@
+"""
+Batched animation: every active tween and follower advanced in one update, easing sampled from
+precomputed lookup tables.
+
+An Animator owns a fixed pool of scalar channels (struct-of-arrays). A channel either holds its
+value, tweens from a start to an end value over a duration along one of the CURVE_* tables, or
+follows a target (exponential approach). update() only visits channels that are moving: nothing
+at all while everything holds, and a Python loop over the moving ones while they are few. With
+NumPy, from ANIM_BATCH_MIN moving channels on, the pool's state moves into arrays and is advanced
+in one vectorized pass, whose fixed cost (tens of microseconds) only pays off at that size; it
+moves back to lists once fewer than half that many are moving.
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # the game runs without NumPy; the Python path below is used instead
+    np = None
+
+import settings
+from .easing import ease_in_out_quad, ease_out_quad, ease_in_quad
+
+CURVE_LINEAR = 0
+CURVE_IN_OUT_QUAD = 1
+CURVE_OUT_QUAD = 2
+CURVE_IN_QUAD = 3
+CURVE_ARC = 4    # 0 -> 1 -> 0 parabola, peak at t=0.5 (hop height)
+CURVE_BUMP = 5   # 0 -> 1 -> 0 half sine (stretch during a hop)
+
+_CURVES = (
+    lambda t: t,
+    ease_in_out_quad,
+    ease_out_quad,
+    ease_in_quad,
+    lambda t: 4 * t * (1 - t),
+    lambda t: math.sin(t * math.pi),
+)
+
+_HOLD = 0
+_TWEEN = 1
+_FOLLOW = 2
+
+
+def build_luts(size: int) -> list:
+    """One table per curve: size + 1 samples over t in [0, 1] (the extra one makes t=1 exact)."""
+    return [[curve(i / size) for i in range(size + 1)] for curve in _CURVES]
+
+
+class Animator:
+    """Fixed pool of animated scalars. channel() once per animated property, then tween() /
+    follow() / set() to drive it; update(dt) advances every channel and `values` holds the result."""
+
+    def __init__(
+        self, capacity: int = settings.ANIM_CAPACITY, lut_size: int = settings.ANIM_LUT_SIZE,
+        batch_min: int = settings.ANIM_BATCH_MIN,
+    ):
+        self.capacity = capacity
+        self.lut_size = lut_size
+        self.batch_min = batch_min
+        self.luts = build_luts(lut_size)
+        self._curve_end = [lut[-1] for lut in self.luts]
+        # Flattened tables for the vectorized pass
+        self._flat = np.array(self.luts, dtype=np.float64).ravel() if np is not None else None
+        self._free = list(range(capacity - 1, -1, -1))
+        self._used = 0  # channels below this index have been handed out at least once
+        self._live = set()  # channels tweening or following
+        self.values = [0.0] * capacity
+        self._mode = [_HOLD] * capacity
+        self._t = [0.0] * capacity
+        self._rate = [0.0] * capacity  # tween: 1 / duration; follow: approach speed
+        self._start = [0.0] * capacity
+        self._end = [0.0] * capacity  # tween end value or follow target
+        self._final = [0.0] * capacity  # value a tween settles on: start + (end - start) * curve(1)
+        self._curve = [0] * capacity
+        self._batched = False  # state held in NumPy arrays (see _to_arrays)
+
+    def channel(self, value: float = 0.0) -> int:
+        """Allocate a channel holding `value`."""
+        if not self._free:
+            raise RuntimeError(f"Animator is full ({self.capacity} channels)")
+        ch = self._free.pop()
+        self._used = max(self._used, ch + 1)
+        self.set(ch, value)
+        return ch
+
+    def release(self, ch: int):
+        self.set(ch, 0.0)
+        self._free.append(ch)
+
+    def set(self, ch: int, value: float):
+        """Stop whatever the channel is doing and hold `value`."""
+        self._mode[ch] = _HOLD
+        self._live.discard(ch)
+        self.values[ch] = value
+
+    def tween(self, ch: int, start: float, end: float, duration: float, curve: int = CURVE_LINEAR):
+        """value = start + (end - start) * curve(t), t from 0 to 1 over `duration` seconds, then held
+        (exactly `end` for curves that finish at 1, back at `start` for CURVE_ARC / CURVE_BUMP)."""
+        last = self._curve_end[curve]
+        final = end if last == 1.0 else start + (end - start) * last
+        if duration <= 0:
+            self.set(ch, final)
+            return
+        self._mode[ch] = _TWEEN
+        self._live.add(ch)
+        self._t[ch] = 0.0
+        self._rate[ch] = 1.0 / duration
+        self._start[ch] = start
+        self._end[ch] = end
+        self._curve[ch] = curve
+        self._final[ch] = final
+        self.values[ch] = start
+
+    def follow(self, ch: int, target: float, rate: float):
+        """Move the value towards `target` by min(1, rate * dt) of the remaining distance each update."""
+        self._mode[ch] = _FOLLOW
+        self._live.add(ch)
+        self._end[ch] = target
+        self._rate[ch] = rate
+
+    def playing(self, ch: int) -> bool:
+        """True while a tween on the channel has not reached its end."""
+        return self._mode[ch] == _TWEEN
+
+    def update(self, dt: float):
+        live = self._live
+        if self._batched:
+            if len(live) < self.batch_min // 2:
+                self._to_lists()
+            else:
+                self._update_batched(dt)
+                return
+        elif np is not None and len(live) >= self.batch_min:
+            self._to_arrays()
+            self._update_batched(dt)
+            return
+        if live:
+            self._update_live(dt)
+
+    _FIELDS = ("values", "_mode", "_t", "_rate", "_start", "_end", "_final", "_curve")
+
+    def _to_arrays(self):
+        for name in self._FIELDS:
+            setattr(self, name, np.array(getattr(self, name)))
+        self._batched = True
+
+    def _to_lists(self):
+        for name in self._FIELDS:
+            setattr(self, name, getattr(self, name).tolist())
+        self._batched = False
+
+    def _update_live(self, dt: float):
+        """Python loop over the moving channels."""
+        size = self.lut_size
+        values, modes, ts, rates, ends = self.values, self._mode, self._t, self._rate, self._end
+        for ch in tuple(self._live):
+            if modes[ch] == _TWEEN:
+                t = ts[ch] + dt * rates[ch]
+                if t >= 1.0:
+                    ts[ch] = 1.0
+                    modes[ch] = _HOLD
+                    self._live.discard(ch)
+                    values[ch] = self._final[ch]
+                    continue
+                ts[ch] = t
+                pos = t * size
+                i = int(pos)
+                lut = self.luts[self._curve[ch]]
+                lo = lut[i]
+                start = self._start[ch]
+                values[ch] = start + (ends[ch] - start) * (lo + (lut[i + 1] - lo) * (pos - i))
+            else:
+                v = values[ch]
+                step = rates[ch] * dt
+                values[ch] = v + (ends[ch] - v) * (step if step < 1.0 else 1.0)
+
+    def _update_batched(self, dt: float):
+        """One vectorized pass over the used channels."""
+        # Every used channel goes through both formulas and `where` picks per mode: at these sizes
+        # a few whole-array ops are cheaper than gathering the tweening / following subsets
+        n = self._used
+        size = self.lut_size
+        mode = self._mode[:n]
+        values = self.values[:n]
+        end = self._end[:n]
+        t = self._t[:n]
+        step = self._rate[:n] * dt
+        tween = mode == _TWEEN
+        np.copyto(t, np.minimum(1.0, t + step), where=tween)
+        pos = t * size
+        i = np.minimum(pos.astype(np.intp), size - 1)
+        frac = pos - i
+        i += self._curve[:n] * (size + 1)
+        lo = self._flat[i]
+        start = self._start[:n]
+        tweened = start + (end - start) * (lo + (self._flat[i + 1] - lo) * frac)
+        followed = values + (end - values) * np.minimum(1.0, step)
+        np.copyto(values, tweened, where=tween)
+        np.copyto(values, followed, where=mode == _FOLLOW)
+        done = tween & (t >= 1.0)
+        if done.any():
+            mode[done] = _HOLD
+            values[done] = self._final[:n][done]  # settle exactly
+            self._live.difference_update(np.flatnonzero(done).tolist())
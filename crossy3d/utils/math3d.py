@@ -19,3 +19,32 @@ def world_to_grid(x: float, z: float, tile_size: float = 1.0) -> tuple:
 def clamp(value, min_val, max_val):
     """Clamp value to [min_val, max_val]."""
     return max(min_val, min(max_val, value))
+
+
+def swept_aabb_overlap(
+    ax0: float, az0: float, ax1: float, az1: float, a_hw: float, a_hd: float,
+    bx0: float, bz0: float, bx1: float, bz1: float, b_hw: float, b_hd: float,
+) -> bool:
+    """Do boxes A and B (half extents hw on X, hd on Z), each moving linearly from (x0, z0) to
+    (x1, z1) over the same tick, touch at any moment of that tick? Slab test on relative motion."""
+    t_enter = 0.0
+    t_exit = 1.0
+    for p, d, h in (
+        (ax0 - bx0, (ax1 - ax0) - (bx1 - bx0), a_hw + b_hw),
+        (az0 - bz0, (az1 - az0) - (bz1 - bz0), a_hd + b_hd),
+    ):
+        if d == 0.0:
+            if p > h or p < -h:
+                return False
+            continue
+        t0 = (-h - p) / d
+        t1 = (h - p) / d
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_enter:
+            t_enter = t0
+        if t1 < t_exit:
+            t_exit = t1
+        if t_enter > t_exit:
+            return False
+    return True
@@ -0,0 +1,81 @@
+"""
+Precomputed courses: a binary file of fixed-size lane records, memory-mapped for play.
+
+Layout: a 32-byte header (magic, version, lane width, record size, lane count, seed), then one
+LANE_DTYPE record per lane in z order. Courses are made offline (tools/make_course.py, or
+write_course with records filled by lane_to_record) and are identical on every machine.
+Requires NumPy.
+"""
+
+import struct
+
+import numpy as np
+
+import settings
+from .lane import Lane, GrassLane
+from .lane_batch import LANE_DTYPE, lane_from_record
+
+MAGIC = b"CRSYCRSE"
+VERSION = 1
+_HEADER = struct.Struct("<8sHHIIQ4x")  # magic, version, lane width, record size, lanes, seed
+
+
+def write_course(path: str, records: np.ndarray, seed: int = 0):
+    """Write LANE_DTYPE records (lane i at z=i) as a course file."""
+    records = np.ascontiguousarray(records, dtype=LANE_DTYPE)
+    if len(records) and not np.array_equal(records["z"], np.arange(len(records))):
+        raise ValueError("course records must be lanes 0..n-1 in order")
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, settings.LANE_WIDTH, LANE_DTYPE.itemsize, len(records), seed))
+        f.write(records.tobytes())
+
+
+class Course:
+    """A course file mapped read-only; lanes are decoded on demand, in O(1) for any z.
+
+    Drop-in for WorldGenerator in GameApp. Past the last lane the course continues as open grass.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path}: not a course file")
+        magic, version, width, record_size, lanes, seed = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a course file")
+        if version != VERSION or record_size != LANE_DTYPE.itemsize:
+            raise ValueError(f"{path}: unsupported course version {version}")
+        if width != settings.LANE_WIDTH:
+            raise ValueError(f"{path}: course is {width} tiles wide, game is {settings.LANE_WIDTH}")
+        self.path = path
+        self.width = width
+        self.seed = seed
+        if lanes:
+            self.records = np.memmap(path, dtype=LANE_DTYPE, mode="r", offset=_HEADER.size, shape=(lanes,))
+        else:
+            self.records = np.zeros(0, dtype=LANE_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, z_index: int):
+        """Raw record of lane z_index."""
+        return self.records[z_index]
+
+    def lane(self, z_index: int) -> Lane:
+        if 0 <= z_index < len(self.records):
+            return lane_from_record(self.records[z_index])
+        return GrassLane(z_index)
+
+    def next_lane(self, z_index: int) -> Lane:
+        return self.lane(z_index)
+
+    def set_score(self, score: int):
+        """Courses are fixed; difficulty was baked in when the course was made."""
+
+    def close(self):
+        mm = getattr(self.records, "_mmap", None)
+        self.records = np.zeros(0, dtype=LANE_DTYPE)
+        if mm is not None:
+            mm.close()
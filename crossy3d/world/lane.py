@@ -1,10 +1,13 @@
 """
 Lane types: Grass, Road, River, Train.
+
+Tiles of a lane are bits of an int (bit x = column x): static blockers in `blocked_mask`,
+per-tick dynamic occupancy (boats on a road, logs on a river) in `occupancy`.
 """
 
+import math
 from abc import ABC, abstractmethod
-from typing import Set, List, Optional, Any
-import random
+from typing import Set, List, Optional, Any, Iterator
 
 import settings
 
@@ -16,73 +19,234 @@ class LaneType:
     TRAIN = "train"
 
 
+def full_mask(width: int) -> int:
+    """Mask with one bit set per column of a lane `width` tiles wide."""
+    return (1 << width) - 1
+
+
+def span_mask(first: int, last: int, width: int) -> int:
+    """Bits first..last (inclusive), clipped to the lane."""
+    first = max(first, 0)
+    last = min(last, width - 1)
+    if last < first:
+        return 0
+    return ((1 << (last - first + 1)) - 1) << first
+
+
+def mask_columns(mask: int) -> Iterator[int]:
+    """Column indices of the set bits, ascending."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 class Lane(ABC):
     """Base lane: has type, z index, and optional blockers / entities."""
 
+    __slots__ = ("z_index", "blocked_mask", "occupancy", "_lane_width")
+
     def __init__(self, z_index: int):
         self.z_index = z_index
-        self.blocked_tiles: Set[tuple] = set()  # (x, z) blocked for movement
-        self.safe_tiles: Set[tuple] = set()     # (x,) or (x, z) that are safe
+        self.blocked_mask = 0   # static blockers (bit x = column x blocked for movement)
+        self.occupancy = 0      # dynamic occupancy this tick (see subclasses)
         self._lane_width = settings.LANE_WIDTH
 
     @abstractmethod
     def get_type(self) -> str:
         pass
 
+    @property
+    def blocked_tiles(self) -> Set[tuple]:
+        """(x, z) blocked for movement (derived from blocked_mask)."""
+        return {(x, self.z_index) for x in mask_columns(self.blocked_mask)}
+
+    @property
+    def safe_tiles(self) -> Set[tuple]:
+        """(x, z) not statically blocked (derived from blocked_mask)."""
+        free = full_mask(self._lane_width) & ~self.blocked_mask
+        return {(x, self.z_index) for x in mask_columns(free)}
+
+    def blocked_columns(self) -> Iterator[int]:
+        return mask_columns(self.blocked_mask)
+
     def is_blocked(self, grid_x: int) -> bool:
         """Is (grid_x, self.z_index) blocked for movement?"""
-        return (grid_x, self.z_index) in self.blocked_tiles
+        return 0 <= grid_x < self._lane_width and (self.blocked_mask >> grid_x) & 1 == 1
 
     def is_safe_tile(self, grid_x: int) -> bool:
         """Override in subclasses (e.g. road: never safe, river: on log)."""
-        return (grid_x, self.z_index) not in self.blocked_tiles
+        return not self.is_blocked(grid_x)
 
 
 class GrassLane(Lane):
     """Safe lane; may have trees/rocks as blockers."""
 
+    __slots__ = ()
+
     def get_type(self) -> str:
         return LaneType.GRASS
 
     def add_blocker(self, grid_x: int):
-        self.blocked_tiles.add((grid_x, self.z_index))
+        self.blocked_mask |= 1 << grid_x
 
 
 class RoadLane(Lane):
     """Cars move left/right; direction and speeds; gaps are "safe" only when no car there."""
 
+    __slots__ = ("direction", "speed", "seed", "vehicle_xs", "traffic")
+
     def get_type(self) -> str:
         return LaneType.ROAD
 
-    def __init__(self, z_index: int, direction: int, speed: float):
+    def __init__(self, z_index: int, direction: int, speed: float, seed: int = 0, vehicle_xs: tuple = ()):
         super().__init__(z_index)
         self.direction = direction  # -1 left, 1 right
         self.speed = speed
-        # Vehicle positions (grid_x) are updated in world; we don't store them here for logic
-        # Collision is done in world by checking player vs vehicle bounds
+        self.seed = seed  # recycle spacing
+        self.vehicle_xs = vehicle_xs  # starting grid x of each vehicle
+        # TrafficRing owning this lane's vehicles once built; collision is done in world
+        self.traffic = None
+
+    def update_traffic(self, dt: float):
+        """Move vehicles; occupancy = columns any vehicle body overlaps this tick."""
+        if self.traffic is None:
+            return
+        self.traffic.update(dt)
+        ts = settings.TILE_SIZE
+        width = self._lane_width
+        mask = 0
+        for v in self.traffic.vehicles:
+            # Column i spans [(i - 0.5) * ts, (i + 0.5) * ts]
+            first = math.floor((v.world_x - v.half_width) / ts + 0.5)
+            last = math.ceil((v.world_x + v.half_width) / ts - 0.5)
+            mask |= span_mask(first, last, width)
+        self.occupancy = mask
+
+    def is_safe_tile(self, grid_x: int) -> bool:
+        return not self.is_blocked(grid_x) and (self.occupancy >> grid_x) & 1 == 0
 
 
 class RiverLane(Lane):
-    """Logs move; safe only when standing on a log."""
+    """Logs move; safe only when standing on a log.
+
+    Logs are kept as a sorted interval list (ascending left edge), stored as a ring so that a
+    log wrapping from one edge to the other is an O(1) rotation. Coverage queries are a binary
+    search over the ring.
+    """
+
+    __slots__ = ("direction", "speed", "log_layout", "_logs", "_start", "_max_length")
 
     def get_type(self) -> str:
         return LaneType.RIVER
 
-    def __init__(self, z_index: int, direction: int, speed: float):
+    def __init__(self, z_index: int, direction: int, speed: float, log_layout: tuple = ()):
         super().__init__(z_index)
         self.direction = direction
         self.speed = speed
-        # Log segments: list of (start_x, length) in grid; movement handled in world
+        self.log_layout = log_layout  # (center_x in tiles, length in tiles) of each starting log
+        self._logs: List[Any] = []
+        self._start = 0          # ring index of the leftmost log
+        self._max_length = 0.0   # longest log, bounds the backward scan for overlaps
+
+    @property
+    def logs(self) -> List[Any]:
+        return self._logs
+
+    def set_logs(self, logs: List[Any]):
+        """Attach this lane's logs (any objects with world_x, half_length, update(dt) -> wrapped)."""
+        self._logs = sorted(logs, key=_left)
+        self._start = 0
+        self._max_length = max((2 * log.half_length for log in self._logs), default=0.0)
+        self._update_occupancy()
+
+    def _update_occupancy(self):
+        """occupancy = columns whose tile center is on a log this tick (standable water)."""
+        ts = settings.TILE_SIZE
+        width = self._lane_width
+        mask = 0
+        for log in self._logs:
+            first = math.ceil((log.world_x - log.half_length) / ts)
+            last = math.floor((log.world_x + log.half_length) / ts)
+            mask |= span_mask(first, last, width)
+        self.occupancy = mask
+
+    def _log(self, i: int):
+        """i-th log in ascending order."""
+        return self._logs[(self._start + i) % len(self._logs)]
+
+    def update_logs(self, dt: float):
+        """Move logs; a wrap rotates the ring instead of re-sorting."""
+        wrapped = None
+        wraps = 0
+        for log in self._logs:
+            if log.update(dt):
+                wrapped = log
+                wraps += 1
+        if wraps > 1:  # two wraps in one tick: just re-sort
+            self.set_logs(self._logs)
+            return
+        self._update_occupancy()
+        if wrapped is None:
+            return  # equal speeds: moving never changes the order
+        # The log that wraps is the one at the leading end; it becomes the trailing end
+        # unless mixed lengths break the order (then re-sort)
+        n = len(self._logs)
+        if self.direction > 0 and wrapped is self._log(n - 1):
+            self._start = (self._start - 1) % n
+            if n == 1 or _left(wrapped) <= _left(self._log(1)):
+                return
+        elif self.direction < 0 and wrapped is self._log(0):
+            self._start = (self._start + 1) % n
+            if n == 1 or _left(wrapped) >= _left(self._log(n - 2)):
+                return
+        self.set_logs(self._logs)
+
+    def log_at(self, world_x: float) -> Optional[Any]:
+        """Log whose span covers world_x, or None. O(log n)."""
+        n = len(self._logs)
+        lo, hi = 0, n
+        while lo < hi:  # first log whose left edge is past world_x
+            mid = (lo + hi) // 2
+            if _left(self._log(mid)) <= world_x:
+                lo = mid + 1
+            else:
+                hi = mid
+        i = lo - 1
+        while i >= 0:
+            log = self._log(i)
+            if _left(log) < world_x - self._max_length:
+                break
+            if world_x <= log.world_x + log.half_length:
+                return log
+            i -= 1
+        return None
+
+    def is_covered(self, grid_x: int) -> bool:
+        """Is the center of tile grid_x on a log this tick?"""
+        return 0 <= grid_x < self._lane_width and (self.occupancy >> grid_x) & 1 == 1
+
+    def is_safe_tile(self, grid_x: int) -> bool:
+        return self.is_covered(grid_x)
+
+
+def _left(log) -> float:
+    return log.world_x - log.half_length
 
 
 class TrainLane(Lane):
     """Rare; warning then fast train."""
 
+    __slots__ = ("direction", "seed", "first_delay", "warning_time", "speed", "length")
+
     def get_type(self) -> str:
         return LaneType.TRAIN
 
-    def __init__(self, z_index: int):
+    def __init__(self, z_index: int, direction: int = 1, seed: int = 0, first_delay: float = 0.0):
         super().__init__(z_index)
+        self.direction = direction
+        self.seed = seed  # drives the recurring pass schedule
+        self.first_delay = first_delay  # seconds parked before the first warning
         self.warning_time = settings.TRAIN_WARNING_TIME
         self.speed = settings.TRAIN_SPEED
         self.length = settings.TRAIN_LENGTH
@@ -0,0 +1,311 @@
+"""
+Batch lane generation: the next K lanes' full content in one vectorized NumPy pass.
+
+Lanes come out as one structured array of fixed-size records (LANE_DTYPE) that the headless sim
+reads directly and the renderer turns into Lane objects with lane_from_record. The same record
+layout is what gets streamed between processes and stored in course files.
+Requires NumPy (the live game's scalar WorldGenerator.next_lane does not).
+"""
+
+import numpy as np
+
+import settings
+from .lane import Lane, GrassLane, RoadLane, RiverLane, TrainLane, full_mask, mask_columns
+from .reachability import spawn_mask, spread
+
+# Lane kinds as stored in records
+KIND_GRASS = 0
+KIND_ROAD = 1
+KIND_RIVER = 2
+KIND_TRAIN = 3
+
+MAX_ITEMS = 8  # vehicles or logs per record
+
+LANE_DTYPE = np.dtype([
+    ("z", "<i4"),
+    ("kind", "u1"),
+    ("direction", "i1"),
+    ("count", "u1"),              # vehicles (road) or logs (river) used in xs / lengths
+    ("epoch", "u1"),              # stream epoch tag (world.lane_stream)
+    ("speed", "<f4"),
+    ("blocked", "<u8"),           # static blocker bitmask (grass)
+    ("seed", "<u4"),              # recycle spacing (road) / pass schedule (train)
+    ("first_delay", "<f4"),       # train: seconds before the first warning
+    ("xs", "<f4", (MAX_ITEMS,)),  # road: vehicle grid x; river: log center x in tiles
+    ("lengths", "u1", (MAX_ITEMS,)),  # river: log length in tiles
+])
+
+
+def generate_batch(gen, z_start: int, k: int) -> np.ndarray:
+    """Next k lanes from WorldGenerator `gen`, advancing its streak and reachability state.
+
+    Difficulty is gen._difficulty_factor() at call time, as if next_lane were called k times.
+    """
+    width = settings.LANE_WIDTH
+    if width > 64:
+        raise ValueError("lane records hold at most 64 columns")
+    rng = np.random.default_rng(gen.rng.getrandbits(64))
+    df = gen._difficulty_factor()
+    out = np.zeros(k, dtype=LANE_DTYPE)
+    out["z"] = np.arange(z_start, z_start + k)
+    kinds = _pick_kinds(gen, z_start, rng.random(k), df)
+    out["kind"] = kinds
+    direction = np.where(rng.random(k) < 0.5, -1, 1).astype(np.int8)
+    out["direction"] = direction
+    out["seed"] = rng.integers(0, 2 ** 32, size=k, dtype=np.uint32)
+
+    # Content per kind, computed on that kind's rows only
+    road = np.flatnonzero(kinds == KIND_ROAD)
+    river = np.flatnonzero(kinds == KIND_RIVER)
+    train = np.flatnonzero(kinds == KIND_TRAIN)
+    grass = np.flatnonzero(kinds == KIND_GRASS)
+    out["speed"][road] = rng.uniform(
+        settings.ROAD_VEHICLE_SPEED_MIN * (1 + 0.2 * df),
+        settings.ROAD_VEHICLE_SPEED_MAX * (1 + 0.3 * df),
+        size=len(road),
+    )
+    out["speed"][river] = rng.uniform(
+        settings.RIVER_LOG_SPEED_MIN,
+        settings.RIVER_LOG_SPEED_MAX * (1 + 0.2 * df),
+        size=len(river),
+    )
+    out["first_delay"][train] = rng.uniform(0.0, settings.TRAIN_SLEEP_MAX, size=len(train))
+    out["blocked"][grass] = _grass_blockers(rng, len(grass), width)
+    xs = np.zeros((k, MAX_ITEMS), dtype=np.float32)
+    count = np.zeros(k, dtype=np.uint8)
+    xs[road], count[road] = _place_vehicles(rng, len(road), width)
+    lengths = np.zeros((k, MAX_ITEMS), dtype=np.uint8)
+    xs[river], lengths[river], count[river] = _layout_logs(rng, direction[river], width)
+    out["xs"] = xs
+    out["lengths"] = lengths
+    out["count"] = count
+    _ensure_reachable(gen, out, rng, width)
+    return out
+
+
+def _pick_kinds(gen, z_start: int, r: np.ndarray, df: float) -> np.ndarray:
+    """Same rules as WorldGenerator._pick_lane, over pre-drawn uniforms."""
+    train_chance = settings.TRAIN_LANE_CHANCE * (0.5 + 0.5 * df)
+    road_chance = settings.ROAD_LANE_CHANCE * (0.8 + 0.4 * df)
+    river_chance = settings.RIVER_LANE_CHANCE * (0.8 + 0.4 * df)
+    t_road = train_chance + road_chance
+    t_river = t_road + river_chance
+    raw = np.select(
+        [r < train_chance, r < t_road, r < t_river],
+        [KIND_TRAIN, KIND_ROAD, KIND_RIVER],
+        KIND_GRASS,
+    ).astype(np.uint8)
+    raw[np.arange(z_start, z_start + len(r)) == 0] = KIND_GRASS
+    # Hazard cap in closed form: a forced grass resets the streak, so within a run of hazard
+    # draws every (cap + 1)-th lane becomes grass. The river cap forces grass into the raw draws
+    # (one lane per over-long run per pass) and the hazard cap is re-applied; with the default
+    # caps river runs never outlast the hazard cap and this loop runs once.
+    cycle = settings.MAX_CONSECUTIVE_HAZARD + 1
+    max_river = getattr(settings, "MAX_CONSECUTIVE_RIVER", 3)
+    while True:
+        drawn = _run_lengths(raw != KIND_GRASS, gen._consecutive_hazard)
+        kinds = np.where(drawn % cycle == 0, KIND_GRASS, raw).astype(np.uint8)
+        rivers = _run_lengths(kinds == KIND_RIVER, gen._consecutive_river)
+        over = rivers == max_river + 1
+        if not over.any():
+            break
+        raw[over] = KIND_GRASS
+    if len(kinds):
+        gen._consecutive_hazard = int(drawn[-1] % cycle)
+        gen._consecutive_river = int(rivers[-1])
+    return kinds
+
+
+def _run_lengths(flags: np.ndarray, carry: int) -> np.ndarray:
+    """Length of the run of True ending at each index (0 where False); `carry` continues a run from before."""
+    idx = np.arange(len(flags))
+    last_break = np.maximum.accumulate(np.where(flags, -1 - carry, idx))
+    return np.where(flags, idx - last_break, 0)
+
+
+def _grass_blockers(rng, n: int, width: int) -> np.ndarray:
+    """Blocker masks: each tile blocks with GRASS_BLOCKER_CHANCE and may extend to its right neighbour."""
+    base = rng.random((n, width)) < settings.GRASS_BLOCKER_CHANCE
+    cluster = base & (rng.random((n, width)) < settings.GRASS_BLOCKER_CLUSTER)
+    blocked = base
+    blocked[:, 1:] |= cluster[:, :-1]
+    bits = np.left_shift(np.uint64(1), np.arange(width, dtype=np.uint64))
+    masks = blocked @ bits if width < 53 else (blocked * bits).sum(axis=1, dtype=np.uint64)
+    masks = masks.astype(np.uint64)
+    # Fairness: a fully blocked row is a wall; reopen one column
+    full = masks == np.uint64(full_mask(width))
+    if full.any():
+        cols = rng.integers(0, width, size=int(full.sum())).astype(np.uint64)
+        masks[full] &= ~np.left_shift(np.uint64(1), cols)
+    return masks
+
+
+def _place_vehicles(rng, n: int, width: int):
+    """Same rule as WorldGenerator._place_vehicles: skip a vehicle whose column is within a gap of another.
+
+    Returns (xs, count) for n road lanes.
+    """
+    vmax = min(settings.ROAD_VEHICLES_PER_LANE_MAX, MAX_ITEMS)
+    wanted = rng.integers(settings.ROAD_VEHICLES_PER_LANE_MIN, vmax + 1, size=n)
+    gx = rng.integers(0, width, size=(n, vmax))
+    gap = rng.integers(settings.ROAD_VEHICLE_GAP_MIN, settings.ROAD_VEHICLE_GAP_MAX + 1, size=(n, vmax))
+    xs = np.zeros((n, MAX_ITEMS), dtype=np.float32)
+    used = np.zeros(n, dtype=np.int64)
+    count = np.zeros(n, dtype=np.int64)
+    rows = np.arange(n)
+    for j in range(vmax):
+        x = gx[:, j]
+        ok = (j < wanted) & (((used >> x) & 1) == 0)
+        lo = np.maximum(x - gap[:, j], 0)
+        hi = np.minimum(x + gap[:, j], width - 1)
+        used |= np.where(ok, ((1 << (hi - lo + 1)) - 1) << lo, 0)
+        xs[rows[ok], count[ok]] = x[ok]
+        count += ok
+    return xs, count
+
+
+def _layout_logs(rng, direction: np.ndarray, width: int):
+    """Same rule as WorldGenerator._layout_logs: logs with gaps left to right, at least two.
+
+    Returns (center_xs, lengths, count) for one river lane per entry of `direction`.
+    """
+    n = len(direction)
+    len_min = settings.RIVER_LOG_LENGTH_MIN
+    steps = min(MAX_ITEMS - 1, -(-width // (len_min + settings.RIVER_LOG_GAP_MIN)))
+    drawn = rng.integers(len_min, settings.RIVER_LOG_LENGTH_MAX + 1, size=(n, steps + 1))
+    gaps = rng.integers(settings.RIVER_LOG_GAP_MIN, settings.RIVER_LOG_GAP_MAX + 1, size=(n, steps))
+    xs = np.zeros((n, MAX_ITEMS), dtype=np.float32)
+    lengths = np.zeros((n, MAX_ITEMS), dtype=np.uint8)
+    # Left edges are a running sum of lengths and gaps; a log exists while its left edge is on the lane
+    left = np.zeros((n, steps), dtype=np.int64)
+    if steps > 1:
+        np.cumsum(drawn[:, :steps - 1] + gaps[:, :steps - 1], axis=1, out=left[:, 1:])
+    on_lane = left < width
+    length = np.minimum(drawn[:, :steps], width - left)
+    xs[:, :steps] = np.where(on_lane, left + length / 2, 0)
+    lengths[:, :steps] = np.where(on_lane, length, 0)
+    count = on_lane.sum(axis=1)
+    # Add a second log offset so there's always coverage as they move (logs also wrap)
+    single = count == 1
+    xs[single, 1] = np.where(direction[single] > 0, width * 0.25, width * 0.75)
+    lengths[single, 1] = np.minimum(drawn[single, steps], width)
+    count += single
+    return xs, lengths, count
+
+
+def _ensure_reachable(gen, out: np.ndarray, rng, width: int):
+    """Same rule as WorldGenerator._ensure_reachable, over the batch's masks.
+
+    Hazards and water never cut a column off, so a grass lane after one is reachable wherever it
+    is free; only runs of grass chain. Lanes are processed by their position in the grass run.
+    """
+    k = len(out)
+    if k == 0:
+        return
+    everything = np.uint64(full_mask(width))
+    grass = out["kind"] == KIND_GRASS
+    blocked = out["blocked"]
+    reach = np.where(grass, everything & ~blocked, everything)
+    pos = _run_lengths(grass, 0)
+    # The first lane continues the previous batch's reach; every other run starts fully reachable
+    first_entry = spawn_mask(width) if gen._reach is None else gen._reach
+    if grass[0]:
+        reach[0] = _repair(gen, out, rng, width, 0, first_entry)
+    for p in range(2, int(pos.max()) + 1):
+        rows = np.flatnonzero(pos == p)
+        entry = reach[rows - 1]
+        free = everything & ~blocked[rows]
+        cut = np.flatnonzero((entry & free) == 0)
+        for j in cut.tolist():
+            reach[rows[j]] = _repair(gen, out, rng, width, int(rows[j]), int(entry[j]))
+        ok = np.ones(len(rows), dtype=bool)
+        ok[cut] = False
+        reach[rows[ok]] = _spread(entry[ok] & free[ok], free[ok], width)
+    gen._reach = int(reach[-1])
+
+
+def _repair(gen, out: np.ndarray, rng, width: int, i: int, entry: int) -> int:
+    """Reach on grass lane i from `entry`, unblocking one arrival column first if it is cut off."""
+    free = full_mask(width) & ~int(out["blocked"][i])
+    if entry & free == 0:
+        # Only grass blockers are permanent: unblock one column the player can arrive in
+        cols = list(mask_columns(entry))
+        col = cols[int(rng.random() * len(cols))]
+        out["blocked"][i] &= ~np.uint64(1 << col)
+        free |= 1 << col
+        gen.repairs += 1
+    return spread(entry & free, free)
+
+
+def _spread(seed: np.ndarray, free: np.ndarray, width: int) -> np.ndarray:
+    """reachability.spread over arrays of masks (a lookup table for narrow lanes)."""
+    if width <= _SPREAD_LUT_MAX_WIDTH:
+        return _spread_table(width)[(seed << np.uint64(width)) | free]
+    reach = seed & free
+    one = np.uint64(1)
+    for _ in range(width - 1):
+        reach = (reach | (reach << one) | (reach >> one)) & free
+    return reach
+
+
+_SPREAD_LUT_MAX_WIDTH = 8
+_spread_tables = {}
+
+
+def _spread_table(width: int) -> np.ndarray:
+    """spread(seed, free) for every (seed, free) pair, indexed by seed << width | free."""
+    table = _spread_tables.get(width)
+    if table is None:
+        n = 1 << width
+        table = np.array([spread(seed, free) for seed in range(n) for free in range(n)], dtype=np.uint64)
+        _spread_tables[width] = table
+    return table
+
+
+def lane_from_record(rec) -> Lane:
+    """Lane object (with content) for one LANE_DTYPE record."""
+    z = int(rec["z"])
+    kind = int(rec["kind"])
+    n = int(rec["count"])
+    if kind == KIND_ROAD:
+        xs = tuple(int(x) for x in rec["xs"][:n])
+        return RoadLane(z, int(rec["direction"]), float(rec["speed"]), int(rec["seed"]), xs)
+    if kind == KIND_RIVER:
+        layout = tuple((float(x), int(l)) for x, l in zip(rec["xs"][:n], rec["lengths"][:n]))
+        return RiverLane(z, int(rec["direction"]), float(rec["speed"]), layout)
+    if kind == KIND_TRAIN:
+        return TrainLane(z, int(rec["direction"]), int(rec["seed"]), float(rec["first_delay"]))
+    lane = GrassLane(z)
+    lane.blocked_mask = int(rec["blocked"])
+    return lane
+
+
+def lane_to_record(lane: Lane, rec):
+    """Fill one LANE_DTYPE record from a Lane object."""
+    rec["z"] = lane.z_index
+    rec["blocked"] = lane.blocked_mask
+    rec["count"] = 0
+    if isinstance(lane, RoadLane):
+        rec["kind"] = KIND_ROAD
+        rec["direction"] = lane.direction
+        rec["speed"] = lane.speed
+        rec["seed"] = lane.seed
+        xs = lane.vehicle_xs[:MAX_ITEMS]
+        rec["count"] = len(xs)
+        rec["xs"][:len(xs)] = xs
+    elif isinstance(lane, RiverLane):
+        rec["kind"] = KIND_RIVER
+        rec["direction"] = lane.direction
+        rec["speed"] = lane.speed
+        logs = lane.log_layout[:MAX_ITEMS]
+        rec["count"] = len(logs)
+        for i, (center_x, length) in enumerate(logs):
+            rec["xs"][i] = center_x
+            rec["lengths"][i] = length
+    elif isinstance(lane, TrainLane):
+        rec["kind"] = KIND_TRAIN
+        rec["direction"] = lane.direction
+        rec["seed"] = lane.seed
+        rec["first_delay"] = lane.first_delay
+    else:
+        rec["kind"] = KIND_GRASS
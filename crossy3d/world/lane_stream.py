@@ -0,0 +1,216 @@
+"""
+Lane streaming: a worker process generates lane records ahead of the player into a shared-memory ring.
+
+The worker runs the batch generator (types, blockers, hazard layouts, schedules and the
+reachability repair); the game process only turns records into Lane objects and builds visuals.
+Lanes are generated in fixed, aligned batches with difficulty taken from the lane index, so the
+in-process fallback replays exactly the same world whenever the worker is behind or missing.
+Requires NumPy.
+"""
+
+import multiprocessing as mp
+import random
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+import settings
+from .lane import Lane
+from .lane_batch import LANE_DTYPE, lane_from_record
+from .world_gen import WorldGenerator
+
+# Ring header slots (int64 each)
+_HEAD = 0    # records published (producer-owned)
+_TAIL = 1    # records consumed (consumer-owned)
+_EPOCH = 2   # bumped by the consumer on reset; records carry it so stale ones are dropped
+_SEED = 3
+_WANTED = 4  # next lane index the consumer will ask for
+_STOP = 5
+_HEADER_SLOTS = 8
+
+
+def stream_batch(gen: WorldGenerator, z_start: int, batch: int) -> np.ndarray:
+    """One aligned batch of the stream; difficulty follows the lane index, not the live score."""
+    gen.set_score(max(0, z_start - settings.LANES_AHEAD))
+    return gen.next_batch(z_start, batch)
+
+
+class LaneRing:
+    """Single-producer single-consumer ring of LANE_DTYPE records in a SharedMemory block."""
+
+    def __init__(self, capacity: int, name: Optional[str] = None):
+        size = _HEADER_SLOTS * 8 + capacity * LANE_DTYPE.itemsize
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self.capacity = capacity
+        self.header = np.ndarray(_HEADER_SLOTS, dtype=np.int64, buffer=self.shm.buf)
+        self.records = np.ndarray(capacity, dtype=LANE_DTYPE, buffer=self.shm.buf, offset=_HEADER_SLOTS * 8)
+        if self.owner:
+            self.header[:] = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __len__(self) -> int:
+        return int(self.header[_HEAD] - self.header[_TAIL])
+
+    def push(self, batch: np.ndarray) -> bool:
+        """Publish a whole batch, or nothing if it doesn't fit."""
+        head = int(self.header[_HEAD])
+        n = len(batch)
+        if self.capacity - (head - int(self.header[_TAIL])) < n:
+            return False
+        i = head % self.capacity
+        first = min(n, self.capacity - i)
+        self.records[i:i + first] = batch[:first]
+        self.records[:n - first] = batch[first:]
+        self.header[_HEAD] = head + n  # publish after the records are written
+        return True
+
+    def peek(self):
+        """Oldest unconsumed record (a view into shared memory), or None."""
+        tail = int(self.header[_TAIL])
+        if tail == int(self.header[_HEAD]):
+            return None
+        return self.records[tail % self.capacity]
+
+    def pop(self):
+        self.header[_TAIL] += 1
+
+    def close(self):
+        self.header = None
+        self.records = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _produce(name: str, capacity: int, ahead: int, batch: int):
+    """Worker loop: keep the ring filled up to `ahead` lanes past the consumer, per epoch."""
+    ring = LaneRing(capacity, name)
+    header = ring.header
+    epoch = None
+    gen = None
+    z = 0
+    try:
+        while not header[_STOP]:
+            if header[_EPOCH] != epoch:
+                epoch = int(header[_EPOCH])
+                gen = WorldGenerator(int(header[_SEED]))
+                z = 0
+            if z >= header[_WANTED] + ahead:
+                time.sleep(0.002)
+                continue
+            records = stream_batch(gen, z, batch)
+            records["epoch"] = epoch & 0xFF
+            while header[_EPOCH] == epoch and not header[_STOP] and not ring.push(records):
+                time.sleep(0.002)
+            z += batch
+    finally:
+        ring.close()
+
+
+class LaneStream:
+    """Drop-in for WorldGenerator in GameApp: next_lane(z) served from the worker's ring.
+
+    Falls back to replaying the same batches in-process when the ring has nothing for z, or
+    when the worker could not be started.
+    """
+
+    def __init__(
+        self,
+        ahead: int = settings.LANE_WORKER_AHEAD,
+        batch: int = settings.LANE_WORKER_BATCH,
+        capacity: int = settings.LANE_WORKER_CAPACITY,
+    ):
+        self.batch = batch
+        self.seed = 0
+        self.epoch = 0
+        self.streamed = 0  # lanes served from the worker
+        self.fallbacks = 0  # lanes generated in-process
+        self._local = None  # (generator, next z) for the in-process replay
+        self._local_batch = None
+        self.ring = None
+        self.worker = None
+        try:
+            self.ring = LaneRing(max(capacity, batch))
+            # spawn, not fork: the worker must not inherit the Panda3D window / GL state
+            ctx = mp.get_context("spawn")
+            self.worker = ctx.Process(
+                target=_produce, args=(self.ring.name, self.ring.capacity, ahead, batch),
+                name="lane-worker", daemon=True,
+            )
+            self.worker.start()
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"Lane worker unavailable ({e}); generating lanes in-process")
+            if self.worker is not None and self.worker.pid is None:
+                self.worker = None  # never started: nothing to join
+            self.close()
+
+    def reset(self, seed: Optional[int] = None):
+        """Start a new world (a new epoch); the worker restarts from lane 0 for `seed`."""
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.epoch += 1
+        self._local = None
+        self._local_batch = None
+        if self.ring is not None:
+            header = self.ring.header
+            header[_SEED] = self.seed
+            header[_WANTED] = 0
+            header[_EPOCH] = self.epoch
+
+    def set_score(self, score: int):
+        """Difficulty follows the lane index in a stream; the live score is ignored."""
+
+    def next_lane(self, z_index: int) -> Lane:
+        rec = self._from_ring(z_index)
+        if rec is not None:
+            self.streamed += 1
+            lane = lane_from_record(rec)
+            self.ring.pop()
+            return lane
+        self.fallbacks += 1
+        return lane_from_record(self._replay(z_index))
+
+    def _from_ring(self, z_index: int):
+        if self.ring is None:
+            return None
+        self.ring.header[_WANTED] = z_index
+        tag = self.epoch & 0xFF
+        while True:
+            rec = self.ring.peek()
+            if rec is None:
+                return None
+            if rec["epoch"] == tag and rec["z"] >= z_index:
+                return rec if rec["z"] == z_index else None
+            self.ring.pop()  # stale epoch, or a lane already served by the fallback
+
+    def _replay(self, z_index: int):
+        """Record for z_index from an in-process generator stepping through the same aligned batches."""
+        start = z_index - z_index % self.batch
+        if self._local_batch is not None and self._local_batch[0] == start:
+            return self._local_batch[1][z_index - start]
+        if self._local is None or self._local[1] > start:
+            self._local = (WorldGenerator(self.seed), 0)
+        gen, z = self._local
+        while z <= start:
+            records = stream_batch(gen, z, self.batch)
+            z += self.batch
+        self._local = (gen, z)
+        self._local_batch = (start, records)
+        return records[z_index - start]
+
+    def close(self):
+        if self.ring is not None:
+            self.ring.header[_STOP] = 1
+        if self.worker is not None:
+            self.worker.join(timeout=1.0)
+            if self.worker.is_alive():
+                self.worker.terminate()
+            self.worker = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
@@ -0,0 +1,47 @@
+"""
+Reachability over lane bitmasks: can the player get from the spawn to every lane?
+
+A column mask per lane says where the player can stand (eventually: logs and traffic move
+through every column, only grass blockers are permanent). Hopping forward keeps the column;
+sideways hops spread along free columns.
+"""
+
+from .lane import Lane, GrassLane, full_mask
+
+
+def spawn_mask(width: int) -> int:
+    """Column the player spawns in on lane 0."""
+    return 1 << (width // 2)
+
+
+def passable_mask(lane: Lane, width: int) -> int:
+    """Columns of `lane` the player can stand on at some point."""
+    if isinstance(lane, GrassLane):
+        return full_mask(width) & ~lane.blocked_mask
+    return full_mask(width)
+
+
+def spread(seed: int, free: int) -> int:
+    """Columns reachable by sideways hops from `seed` without leaving `free`."""
+    reach = seed & free
+    while True:
+        grown = (reach | (reach << 1) | (reach >> 1)) & free
+        if grown == reach:
+            return reach
+        reach = grown
+
+
+def step(reach: int, lane: Lane, width: int) -> int:
+    """Columns reachable on `lane` after arriving from columns `reach` of the lane below."""
+    free = passable_mask(lane, width)
+    return spread(reach & free, free)
+
+
+def first_unreachable(lanes, width: int) -> int:
+    """Index of the first lane the player cannot reach from the spawn, or -1 if all are reachable."""
+    reach = spawn_mask(width)
+    for i, lane in enumerate(lanes):
+        reach = step(reach, lane, width)
+        if reach == 0:
+            return i
+    return -1
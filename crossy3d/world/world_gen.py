@@ -1,22 +1,27 @@
 """
 Procedural lane generation: grass, road, river, train with difficulty scaling.
+Every lane is checked for a route from the previous one as it is generated, and repaired if blocked.
 """
 
 import random
 from typing import List, Optional
 
 import settings
-from .lane import Lane, LaneType, GrassLane, RoadLane, RiverLane, TrainLane
+from .lane import Lane, LaneType, GrassLane, RoadLane, RiverLane, TrainLane, full_mask, mask_columns, span_mask
+from .reachability import spawn_mask, step
 
 
 class WorldGenerator:
     """Generate lanes forward; guarantee safe progression."""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
         self._consecutive_hazard = 0  # roads + trains
         self._consecutive_river = 0   # rivers only (can repeat so water feels continuous)
         self._last_grass_count = 0
         self._score = 0
+        self._reach = None  # columns reachable on the last generated lane
+        self.repairs = 0    # lanes whose blockers had to be opened up
 
     def set_score(self, score: int):
         self._score = score
@@ -26,9 +31,38 @@ class WorldGenerator:
         return min(1.5, self._score / 30.0)
 
     def next_lane(self, z_index: int) -> Lane:
-        """Generate one lane at z_index. Ensures fair patterns. Rivers can repeat so water feels continuous."""
+        """Generate one lane at z_index. Ensures fair patterns and a passable route from the lane below."""
+        lane = self._pick_lane(z_index)
+        self._ensure_reachable(lane)
+        return lane
+
+    def next_batch(self, z_start: int, k: int):
+        """Next k lanes as a LANE_DTYPE record array (world.lane_batch); needs NumPy.
+
+        Same rules and difficulty as k calls to next_lane, drawn in one vectorized pass.
+        """
+        from .lane_batch import generate_batch
+        return generate_batch(self, z_start, k)
+
+    def _ensure_reachable(self, lane: Lane):
+        """Open a blocker if the lane cuts off every column the player can arrive in."""
+        width = settings.LANE_WIDTH
+        entry = spawn_mask(width) if self._reach is None else self._reach
+        reach = step(entry, lane, width)
+        if reach == 0:
+            # Only grass blockers are permanent: unblock one column the player can arrive in
+            cols = list(mask_columns(entry & lane.blocked_mask))
+            lane.blocked_mask &= ~(1 << self.rng.choice(cols))
+            self.repairs += 1
+            reach = step(entry, lane, width)
+        self._reach = reach
+
+    def _pick_lane(self, z_index: int) -> Lane:
+        """Lane type and content by streak caps and difficulty. Rivers can repeat so water feels continuous."""
+        if z_index == 0:
+            return self._make_grass_lane(z_index)  # spawn lane is always safe ground
         df = self._difficulty_factor()
-        r = random.random()
+        r = self.rng.random()
 
         # Force grass after too many non-river hazards (roads/trains)
         if self._consecutive_hazard >= settings.MAX_CONSECUTIVE_HAZARD:
@@ -48,37 +82,82 @@ class WorldGenerator:
         if r < train_chance:
             self._consecutive_hazard += 1
             self._consecutive_river = 0
-            return TrainLane(z_index)
+            return TrainLane(
+                z_index,
+                self.rng.choice([-1, 1]),
+                self.rng.getrandbits(32),
+                self.rng.uniform(0.0, settings.TRAIN_SLEEP_MAX),
+            )
         r -= train_chance
         if r < road_chance:
             self._consecutive_hazard += 1
             self._consecutive_river = 0
-            speed = random.uniform(
+            speed = self.rng.uniform(
                 settings.ROAD_VEHICLE_SPEED_MIN * (1 + 0.2 * df),
                 settings.ROAD_VEHICLE_SPEED_MAX * (1 + 0.3 * df),
             )
-            return RoadLane(z_index, random.choice([-1, 1]), speed)
+            direction = self.rng.choice([-1, 1])
+            return RoadLane(z_index, direction, speed, self.rng.getrandbits(32), self._place_vehicles())
         r -= road_chance
         if r < river_chance_this_round:
             self._consecutive_river += 1
             self._consecutive_hazard += 1  # river still counts as hazard for grass breaks
-            speed = random.uniform(
+            speed = self.rng.uniform(
                 settings.RIVER_LOG_SPEED_MIN,
                 settings.RIVER_LOG_SPEED_MAX * (1 + 0.2 * df),
             )
-            return RiverLane(z_index, random.choice([-1, 1]), speed)
+            direction = self.rng.choice([-1, 1])
+            return RiverLane(z_index, direction, speed, self._layout_logs(direction))
 
         self._consecutive_hazard = 0
         self._consecutive_river = 0
         return self._make_grass_lane(z_index)
 
+    def _place_vehicles(self) -> tuple:
+        """Starting grid x of each vehicle, at least a random gap apart."""
+        width = settings.LANE_WIDTH
+        n_vehicles = self.rng.randint(settings.ROAD_VEHICLES_PER_LANE_MIN, settings.ROAD_VEHICLES_PER_LANE_MAX)
+        used = 0
+        xs = []
+        for _ in range(n_vehicles):
+            gx = self.rng.randint(0, width - 1)
+            if (used >> gx) & 1:
+                continue
+            gap = self.rng.randint(settings.ROAD_VEHICLE_GAP_MIN, settings.ROAD_VEHICLE_GAP_MAX)
+            used |= span_mask(gx - gap, gx + gap, width)
+            xs.append(gx)
+        return tuple(xs)
+
+    def _layout_logs(self, direction: int) -> tuple:
+        """(center_x, length) in tiles of each starting log; always at least 2 so the river is crossable."""
+        width = settings.LANE_WIDTH
+        len_min = settings.RIVER_LOG_LENGTH_MIN
+        len_max = settings.RIVER_LOG_LENGTH_MAX
+        logs = []
+        x = 0
+        while x < width:
+            length = min(self.rng.randint(len_min, len_max), width - x)
+            logs.append((x + length / 2, length))
+            x += length + self.rng.randint(settings.RIVER_LOG_GAP_MIN, settings.RIVER_LOG_GAP_MAX)
+        if len(logs) == 1:
+            # Add a second log offset so there's always coverage as they move (logs also wrap)
+            length = min(self.rng.randint(len_min, len_max), width)
+            logs.append((width * (0.25 if direction > 0 else 0.75), length))
+        return tuple(logs)
+
     def _make_grass_lane(self, z_index: int) -> GrassLane:
         lane = GrassLane(z_index)
+        width = settings.LANE_WIDTH
         chance = settings.GRASS_BLOCKER_CHANCE
         cluster = settings.GRASS_BLOCKER_CLUSTER
-        for x in range(settings.LANE_WIDTH):
-            if random.random() < chance:
-                lane.add_blocker(x)
-                if random.random() < cluster and x + 1 < settings.LANE_WIDTH:
-                    lane.add_blocker(x + 1)
+        mask = 0
+        for x in range(width):
+            if self.rng.random() < chance:
+                mask |= 1 << x
+                if self.rng.random() < cluster and x + 1 < width:
+                    mask |= 1 << (x + 1)
+        # Fairness: a fully blocked row is a wall; reopen one column
+        if mask == full_mask(width):
+            mask &= ~(1 << self.rng.randrange(width))
+        lane.blocked_mask = mask
         return lane